@@ -3,6 +3,8 @@ import pandas as pd
 from folium.plugins import MarkerCluster
 from branca.colormap import linear
 
+from recommend.func.dataset_schema import read_dataset
+
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import matplotlib.pyplot as plt
@@ -25,10 +27,10 @@ def bj_navi(gb):
     ## 목적지 분류 별 방문건수 시각화_공주시 데이터
     # 데이터 로드
 
-    df = pd.read_csv(f"./data/{gb}_bj_navi_전처리데이터.csv")
+    df = read_dataset(f"./data/{gb}_bj_navi_전처리데이터.csv")
 
     df = df.groupby(
-        ['대분류', '소분류', '목적지명','목적지읍면동명', '목적지X좌표', '목적지Y좌표'], as_index=False
+        ['대분류', '소분류', '목적지명','목적지읍면동명', '목적지X좌표', '목적지Y좌표'], as_index=False, observed=True
     )['방문건수'].sum()
 
     if gb == 'g':
@@ -102,7 +104,7 @@ def bj_navi(gb):
 def togo_count(gb):
     ## 방문건수 시각화_공주시 데이터
     # 데이터 로드
-    df = pd.read_csv(f"./data/{gb}_togo_count.csv")
+    df = read_dataset(f"./data/{gb}_togo_count.csv")
 
     # 분위수 계산 (20분위수, 40분위수, 60분위수, 80분위수, 100분위수)
     quantiles = df['방문건수'].quantile([0.2, 0.4, 0.6, 0.8, 1.0])
@@ -195,7 +197,7 @@ def togo_count(gb):
 def not_togo_count(gb):
     ## 방문건수 시각화_공주시데이터_외부유입 방문객
     # 데이터 로드
-    df = pd.read_csv(f"./data/{gb}_not_togo_count.csv")
+    df = read_dataset(f"./data/{gb}_not_togo_count.csv")
 
     # 분위수 계산 (20분위수, 40분위수, 60분위수, 80분위수, 100분위수)
     quantiles = df['방문건수'].quantile([0.2, 0.4, 0.6, 0.8, 1.0])
@@ -290,7 +292,7 @@ def fest_togo_count(gb):
     # 데이터 로드
     ## 축제기간 여부 / 방문지 인기도
     # 데이터 로드
-    df = pd.read_csv("./data/b_fest_togo_count.csv")
+    df = read_dataset("./data/b_fest_togo_count.csv")
 
     # 분위수 계산 (20분위수, 40분위수, 60분위수, 80분위수, 100분위수)
     quantiles = df['방문건수'].quantile([0.5])
@@ -393,12 +395,12 @@ def fest_togo_count(gb):
 def fest_not_togo_count(gb):
     ## 공주 외부유입 데이터_축제기간 내외, 목적지 분류 별
     # 데이터 로드
-    df = pd.read_csv(f"./data/{gb}_fest_not_togo_count.csv")
+    df = read_dataset(f"./data/{gb}_fest_not_togo_count.csv")
 
     # '목적지명', 'festival_period' 등을 기준으로 방문건수를 그룹화
     df = df.groupby(
         ['목적지명', '목적지X좌표', '목적지Y좌표', '목적지시군구명', '목적지읍면동명', '대분류', '중분류', '소분류', 'festival_period'], 
-        as_index=False
+        as_index=False, observed=True  # category 컬럼은 실제로 있는 조합만 그룹화
     )['방문건수'].sum()
     if gb == 'g':
         region_name = "공주시"
@@ -478,7 +480,7 @@ def fest_not_togo_count(gb):
 def fest_visit_count(gb):
     # 'festival_period'의 값에 따른 방문건수 합계 구하기
     # 축제 전/중/후 값을 각각 따로 계산
-    df = pd.read_csv(f"./data/{gb}_fest_visit_count.csv")
+    df = read_dataset(f"./data/{gb}_fest_visit_count.csv")
 
     # festival_period 값을 모두 '전체기간'으로 변경
 
@@ -602,7 +604,7 @@ def wkd_visit_count(gb):
 
     ## 주말여부 / 축제기간여부 / 방문지인기도
     # 데이터 로드
-    df = pd.read_csv(f"./data/{gb}_wkd_visit_count.csv")
+    df = read_dataset(f"./data/{gb}_wkd_visit_count.csv")
 
     # 분위수 계산 (20분위수, 40분위수, 60분위수, 80분위수, 100분위수)
     quantiles = df['방문건수'].quantile([0.2, 0.4, 0.6, 0.8, 1.0])
@@ -712,7 +714,7 @@ def wkd_visit_count(gb):
 
 def nationwide_plot():
     # 데이터 로드
-    df = pd.read_csv("./data/tt_맵표시용_좌표파일.csv")
+    df = read_dataset("./data/tt_맵표시용_좌표파일.csv")
 
     # 지도 생성 (중심을 대략적인 평균 좌표로 설정)
     map_center = [df['목적지Y좌표'].mean(), df['목적지X좌표'].mean()]
@@ -2,6 +2,8 @@ import os
 import requests
 from dotenv import load_dotenv
 
+from recommend.func.http_transport import get_transport
+
 # load_dotenv()
 # KAKAO_API_KEY = os.environ['KAKAO_KEY']
 # API_KEY = os.environ['API_KEY']
@@ -17,7 +19,7 @@ def get_lon_lat(search: str):
     search = ' '.join(search.split('/'))
     params = {'query': search, 'page': 1}
     # API 요청
-    response = requests.get(url, headers=headers, params=params)
+    response = get_transport().get(url, headers=headers, params=params)
     # JSON 응답 파싱
     data = response.json()
     
@@ -62,7 +64,7 @@ def get_lon_lat(search: str):
 def get_festival_info(search_keyword):
 
     URL = f"http://apis.data.go.kr/B551011/KorService1/searchKeyword1?numOfRows=12&pageNo=1&MobileOS=ETC&MobileApp=AppTest&ServiceKey={API_KEY}&listYN=Y&arrange=A&areaCode=&sigunguCode=&cat1=A02&cat2=A0207&cat3=&keyword={search_keyword}&_type=json"
-    response = requests.get(URL)
+    response = get_transport().get(URL)
     result = response.json()['response']['body']['items']['item'][0]
     map_lat_lon = float(result['mapy']), float(result['mapx'])
     addr_list = [result['addr1']]
@@ -22,6 +22,10 @@ sys.path.append(RECOMMEND_SYS_PATH)
 from recommend.func.tmap_client import TMAPClient
 from recommend.func.place_data_manager import PlaceDataManager
 from recommend.func.route_optimizer import RouteOptimizer
+from recommend.func.sqlite_cache import SQLiteCache
+from recommend.func.poi_cache import PoiCache
+from recommend.func.rate_limiter import QuotaExceededError
+from recommend.func.polyline import routes_to_json, routes_from_json, select_polyline_level
 from recommend.func.tools import *
 from func import search
 #########################################################################################
@@ -30,16 +34,15 @@ load_dotenv()
 api_key = os.getenv('SK_OPEN_API_KEY')
 
 ################################ route optimizer instances ##############################
-tmap_client = TMAPClient(api_key)
+route_cache = SQLiteCache(table='routes')
+poi_cache = PoiCache(disk_cache=SQLiteCache(table='pois', ttl=30 * 24 * 60 * 60))
+tmap_client = TMAPClient(api_key, route_cache=route_cache, poi_cache=poi_cache)
 place_data_manager = PlaceDataManager(file_name="추천장소통합리스트.csv")
 route_optimizer = RouteOptimizer(tmap_client, place_data_manager)
 #########################################################################################
 
 DEBUG = True
-
-def calculate_distance(coord1, coord2):
-    # 유클리드 거리 계산
-    return math.sqrt((coord1[0] - coord2[0]) ** 2 + (coord1[1] - coord2[1]) ** 2)
+ROUTE_MAP_ZOOM = 13  # 추천 경로 지도의 기본 zoom 레벨
 
 def load_image(image_file):
     with open(image_file, "rb") as f:
@@ -157,13 +160,12 @@ def select_page():
             print(st.session_state.locations)
             clicked_location = list(st.session_state.clicked_location)
 
-            closest_distance = float('inf')
-
-            for location, data in st.session_state.locations.items():
-                distance = calculate_distance(data["coordinates"], clicked_location)
-                if distance < closest_distance:
-                    closest_distance = distance
-                    closest_location = location
+            # 검색된 장소는 몇 개뿐이므로 클릭한 좌표와 가장 가까운(유클리드 거리) 장소를 선형 탐색
+            closest_location = min(
+                st.session_state.locations,
+                key=lambda location: math.dist(st.session_state.locations[location]["coordinates"], clicked_location),
+                default=None
+            )
 
             if closest_location is not None:
                 # 클릭한 주소 저장
@@ -201,24 +203,42 @@ def recommend_page():
         sample_file_name = 'tsp_top_routes.json'
         sample_data_path = os.path.join(RECOMMEND_SYS_PATH, 'data', sample_file_name)
         with open(sample_data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    else:
-        if len(st.session_state['route']) == 0:
-            print(st.session_state["selected_sigungu"], st.session_state["dest_addr"],)
-
-            data = route_optimizer.get_top_k_routes_tsp(
+            data = routes_from_json(json.load(f))
+        st.session_state['route'] = data
+    elif len(st.session_state['route']) == 0:
+        print(st.session_state["selected_sigungu"], st.session_state["dest_addr"],)
+
+        # 장소 조합의 경로가 완료될 때마다 현재 상위 경로를 표시하고, 탐색이 끝나면 최종 경로를 사용
+        progress = st.empty()
+        data = []
+        try:
+            for data in route_optimizer.iter_top_k_routes_tsp(
                 start_place=st.session_state['origin'],
                 end_place=st.session_state['origin'],
-                selected_region=st.session_state["selected_sigungu"],
-                selected_festival_place=st.session_state["dest_addr"],
+                region=st.session_state["selected_sigungu"],
+                festival_place=st.session_state["dest_addr"],
                 comb=2,
                 comb_k=5,
-                topk=3
-            )
-            
-            with open(r'..\recommend\data\my_route_sample2.json', 'w') as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-    st.session_state['route'] = data
+                top_k=3
+            ):
+                with progress.container():
+                    st.info("더 좋은 경로를 찾는 중입니다...")
+                    for rank, route in enumerate(data, start=1):
+                        route_names = ' → '.join(point['pointName'] for point in route['points'])
+                        st.write(f"{rank}. {route_names} (점수: {route['properties']['routeScore']})")
+        except QuotaExceededError as e:
+            progress.empty()
+            st.error(f"TMAP API 일일 호출 한도를 초과하여 경로를 추천할 수 없습니다. ({e.endpoint}) 내일 다시 시도해 주세요.")
+            return
+        progress.empty()
+
+        with open(os.path.join(RECOMMEND_SYS_PATH, 'data', 'my_route_sample2.json'), 'w', encoding='utf-8') as f:
+            json.dump(routes_to_json(data), f, ensure_ascii=False, indent=4)
+        st.session_state['route'] = data
+
+    if len(st.session_state['route']) == 0:
+        st.warning("추천 경로를 찾지 못했습니다.")
+        return
 
     # 경로의 모든 노드 좌표 수집
     all_points = []
@@ -245,8 +265,10 @@ def recommend_page():
     # 장소 좌표 (출발지 - (축제장소, 추천장소) - 도착지(출발지)) 
     points_coordinates = [(point['pointLatitude'], point['pointLongitude']) for point in route_points]
 
-    # 경로 시각화를 위한 좌표 추출
-    line_coordinates = [(coord[1], coord[0]) for coord in selected_route['lineCoordinates']]
+    # 현재 지도 zoom 레벨에 맞게 단순화된 경로 좌표 선택 ([경도, 위도] 배열 → [위도, 경도] 뷰, 복사 없음)
+    if 'route_zoom' not in st.session_state:
+        st.session_state.route_zoom = ROUTE_MAP_ZOOM
+    line_coordinates = select_polyline_level(selected_route['lineLevels'], st.session_state.route_zoom)[:, ::-1]
     color = colors[selected_route_index % len(colors)]
 
     if points_coordinates:
@@ -264,12 +286,12 @@ def recommend_page():
 
         print("######## center ########")
         print(center_lat, center_lon)
-        st.session_state.m = folium.Map(location=[center_lat, center_lon], zoom_start=13)
+        st.session_state.m = folium.Map(location=[center_lat, center_lon], zoom_start=st.session_state.route_zoom)
     else:
         st.session_state.m = folium.Map(location=[0, 0], zoom_start=2)
     
     # 경로 시각화
-    if line_coordinates:
+    if len(line_coordinates):
         folium.PolyLine(
             locations=line_coordinates,
             color=color,
@@ -296,7 +318,11 @@ def recommend_page():
 
 
     # Folium 지도 출력
-    st_folium(st.session_state.m, width=700, height=500)
+    st_data = st_folium(st.session_state.m, width=700, height=500)
+
+    # 지도 zoom 레벨이 바뀌면 다음 렌더링에서 해당 레벨의 단순화 경로 사용
+    if st_data and st_data.get('zoom'):
+        st.session_state.route_zoom = st_data['zoom']
 
     
     ############################# 선택된 경로에 대한 정보 표시  #############################
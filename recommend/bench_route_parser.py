@@ -0,0 +1,119 @@
+"""TMAP 경로 응답 파싱 성능 비교 스크립트.
+
+기존 get_top_k_routes_tsp 의 feature 순회 코드(feature 마다 re.match, 지점마다 defaultdict 생성,
+list.extend 로 좌표 누적) 후 좌표를 배열로 변환하는 시간과 route_parser.parse_route_response 의
+파싱 시간을 비교합니다.
+실제 응답 대신 recommend/data/tsp_top_routes.json 의 경로로 TMAP 응답 형식의 데이터를 만들어 사용합니다.
+
+Usage:
+    python recommend/bench_route_parser.py
+"""
+import os
+import re
+import sys
+import json
+import timeit
+import numpy as np
+from collections import defaultdict
+
+module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(module_dir, '..'))
+
+from recommend.func.route_parser import parse_route_response, VIRTUAL_LINE_DESCRIPTION
+
+
+def build_sample_response(route: dict, segment_size: int = 8) -> dict:
+    """저장된 경로(points, lineCoordinates)로 TMAP 경로 탐색 API 응답 형식의 데이터를 생성하는 함수."""
+    points = route['points']
+    coordinates = route['lineCoordinates']
+    features = []
+    for i, point in enumerate(points):
+        point_type = 'S' if i == 0 else ('E' if i == len(points) - 1 else f'B{i}')
+        features.append({
+            'type': 'Feature',
+            'geometry': {'type': 'Point', 'coordinates': [point['pointLongitude'], point['pointLatitude']]},
+            'properties': {'totalDistance': route['properties']['totalDistance'],
+                           'totalTime': route['properties']['totalTime'],
+                           'totalFare': route['properties']['totalFare'],
+                           'pointIndex': i, 'pointType': point_type, 'description': '안내 지점'}
+        })
+        features.append({
+            'type': 'Feature',
+            'geometry': {'type': 'LineString', 'coordinates': [[point['pointLongitude'], point['pointLatitude']]] * 2},
+            'properties': {'description': VIRTUAL_LINE_DESCRIPTION}
+        })
+
+    for start in range(0, len(coordinates), segment_size):
+        features.append({
+            'type': 'Feature',
+            'geometry': {'type': 'LineString', 'coordinates': coordinates[start:start + segment_size + 1]},
+            'properties': {'description': '도로 구간', 'distance': 100, 'time': 10}
+        })
+        features.append({
+            'type': 'Feature',
+            'geometry': {'type': 'Point', 'coordinates': coordinates[start]},
+            'properties': {'pointType': 'GP', 'pointIndex': start, 'description': '회전 안내'}
+        })
+
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def legacy_parse(optimal_route: dict, places: list) -> tuple:
+    """기존 get_top_k_routes_tsp 의 feature 순회 코드"""
+    points = []
+    coordinates = []
+    startPoint_pattern = 'S'
+    endPoint_pattern = 'E'
+    passList_pattern = r'^(B\d*)$'
+
+    places_index = 0
+    for _feature in optimal_route['features']:
+        if ('description' not in _feature['properties'].keys()) or _feature['properties']['description'] == '경유지와 연결된 가상의 라인입니다':
+            continue
+        _geometry = _feature['geometry']
+        if _geometry['type'] == 'Point':
+            point_type = _feature['properties']['pointType']
+            if (point_type == startPoint_pattern) or (point_type == endPoint_pattern) or (re.match(passList_pattern, point_type)):
+                point = defaultdict(str)
+                point['pointId'] = _feature['properties']['pointIndex']
+                point['pointName'] = places[places_index % len(places)]['name']
+                point['pointLatitude'] = _geometry['coordinates'][1]
+                point['pointLongitude'] = _geometry['coordinates'][0]
+                if point_type == startPoint_pattern:
+                    point['pointType'] = 'S'
+                elif point_type == endPoint_pattern:
+                    point['pointType'] = 'E'
+                elif re.match(passList_pattern, point_type):
+                    point['pointType'] = places[places_index % len(places)]['category']
+                points.append(point)
+                places_index += 1
+        elif _geometry['type'] == 'LineString':
+            coordinates.extend(_geometry['coordinates'])
+
+    return points, coordinates
+
+
+def main(repeat: int = 200):
+    with open(os.path.join(module_dir, 'data', 'tsp_top_routes.json'), 'r', encoding='utf-8') as f:
+        routes = json.load(f)
+
+    for r, route in enumerate(routes):
+        response = build_sample_response(route)
+        places = [{'name': point['pointName'], 'category': '관광지'} for point in route['points']]
+
+        legacy_points, legacy_coordinates = legacy_parse(response, places)
+        parsed = parse_route_response(response, places)
+        assert len(parsed['points']) == len(legacy_points)
+        assert parsed['lineCoordinates'].tolist() == legacy_coordinates
+
+        # 경로 데이터는 좌표를 (N, 2) 배열로 가지므로 기존 코드는 배열 변환까지 포함하여 측정
+        legacy_time = timeit.timeit(
+            lambda: np.asarray(legacy_parse(response, places)[1], dtype=np.float64), number=repeat) / repeat
+        parser_time = timeit.timeit(lambda: parse_route_response(response, places), number=repeat) / repeat
+        print(f"route {r + 1}: {len(response['features'])} features, {len(legacy_coordinates)} coordinates | "
+              f"legacy {legacy_time * 1e3:.3f} ms, parser {parser_time * 1e3:.3f} ms "
+              f"({legacy_time / parser_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+import os
+import heapq
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from recommend.func.tour_solver import solve_tour
+
+DEFAULT_COMBINATION_WORKERS = 4  # 동시에 처리할 장소 조합 수
+PROCESS_SOLVER_THRESHOLD = 12  # 이 장소 수 이상이면 순환 경로 탐색을 프로세스 풀에서 실행
+
+
+class CombinationExecutor:
+    """장소 조합 단위 작업을 병렬로 실행하고 결과를 전역 top-k 로 합치는 클래스.
+
+    조합 별 작업(구간 경로 요청, 경로 파싱 등 I/O 위주)은 스레드 풀에서 실행하고,
+    장소 수가 많은 조합의 순환 경로 탐색(CPU 위주)은 프로세스 풀에서 실행하여 GIL 의 영향을 받지 않게 합니다.
+    """
+    def __init__(self, max_workers: int = DEFAULT_COMBINATION_WORKERS, process_workers: int = None,
+                 process_threshold: int = PROCESS_SOLVER_THRESHOLD):
+        """
+        Args:
+            max_workers (int, optional): 조합을 동시에 처리할 스레드 수 (1 이면 순차 실행). Defaults to 4.
+            process_workers (int, optional): 순환 경로 탐색 프로세스 수. 0 이면 프로세스 풀을 사용하지 않음.
+                Defaults to None (CPU 코어 수).
+            process_threshold (int, optional): 프로세스 풀에서 탐색할 최소 장소 수. Defaults to 12.
+        """
+        self.max_workers = max_workers
+        self.process_workers = process_workers if process_workers is not None else (os.cpu_count() or 1)
+        self.process_threshold = process_threshold
+        self._process_pool = None
+        self._lock = threading.Lock()
+
+
+    def solve_tour(self, scores, method: str = 'held_karp') -> tuple:
+        """순환 경로 탐색 (tour_solver.solve_tour). 장소 수가 process_threshold 이상이면 프로세스 풀에서 실행."""
+        if self.process_workers <= 0 or len(scores) < self.process_threshold:
+            return solve_tour(scores, method)
+
+        with self._lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.process_workers)
+            process_pool = self._process_pool
+        return process_pool.submit(solve_tour, scores, method).result()
+
+
+    def map(self, fn, items: list, cancel_event: threading.Event = None) -> list:
+        """items 의 각 원소에 fn 을 병렬로 적용하고, 입력 순서대로 None 이 아닌 결과를 반환하는 함수.
+
+        Args:
+            fn (callable): 조합 하나를 처리하는 함수. 결과가 없으면 None 반환.
+            items (list): 처리할 조합 리스트
+            cancel_event (threading.Event, optional): 설정되면 아직 시작하지 않은 작업을 취소. Defaults to None.
+
+        Returns:
+            list: 완료된 작업의 결과 리스트 (입력 순서)
+        """
+        results = dict(self._run(fn, items, cancel_event))
+        return [results[i] for i in sorted(results)]
+
+
+    def map_top_k(self, fn, items: list, top_k: int, key, cancel_event: threading.Event = None) -> list:
+        """items 의 각 원소에 fn 을 병렬로 적용하고, 완료되는 대로 전역 top-k 힙에 합쳐 상위 결과를 반환하는 함수.
+
+        Args:
+            fn (callable): 조합 하나를 처리하는 함수. 결과가 없으면 None 반환.
+            items (list): 처리할 조합 리스트
+            top_k (int): 반환할 결과 수
+            key (callable): 결과의 순위 점수를 반환하는 함수 (높을수록 상위)
+            cancel_event (threading.Event, optional): 설정되면 아직 시작하지 않은 작업을 취소하고
+                그때까지 완료된 결과로 top-k 를 반환. Defaults to None.
+
+        Returns:
+            list: 점수 내림차순 결과 리스트 (점수가 같으면 입력 순서)
+        """
+        top_results = []
+        for top_results in self.iter_top_k(fn, items, top_k, key, cancel_event):
+            pass
+        return top_results
+
+
+    def iter_top_k(self, fn, items: list, top_k: int, key, cancel_event: threading.Event = None):
+        """map_top_k 와 같이 실행하되, 작업이 완료되어 top-k 가 바뀔 때마다 현재 상위 결과를 생성하는 제너레이터.
+
+        Args:
+            fn (callable): 조합 하나를 처리하는 함수. 결과가 없으면 None 반환.
+            items (list): 처리할 조합 리스트
+            top_k (int): 유지할 결과 수 (크기가 top_k 로 제한된 최소 힙)
+            key (callable): 결과의 순위 점수를 반환하는 함수 (높을수록 상위)
+            cancel_event (threading.Event, optional): 설정되면 아직 시작하지 않은 작업을 취소. Defaults to None.
+
+        Yields:
+            list: 점수 내림차순으로 정렬한 현재 상위 결과 리스트 (최대 top_k 개)
+        """
+        top = []  # (점수, -입력 순서, 결과) 최소 힙
+        for i, result in self._run(fn, items, cancel_event):
+            entry = (key(result), -i, result)
+            if len(top) < top_k:
+                heapq.heappush(top, entry)
+            elif entry[:2] > top[0][:2]:
+                heapq.heapreplace(top, entry)
+            else:
+                continue
+            yield [result for _, _, result in sorted(top, key=lambda entry: entry[:2], reverse=True)]
+
+
+    def _run(self, fn, items: list, cancel_event: threading.Event = None):
+        # (입력 순서, 결과) 를 완료되는 순서대로 생성. 결과가 None 인 작업은 제외
+        if self.max_workers <= 1 or len(items) <= 1:
+            for i, item in enumerate(items):
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                result = fn(item)
+                if result is not None:
+                    yield i, result
+            return
+
+        # 진행 중인 작업을 약 2 × max_workers 개로 제한하여 지연 생성되는 조합(PlaceCombinations)을 한 번에 만들지 않음
+        window = 2 * self.max_workers
+        items = iter(enumerate(items))
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        pending = dict()  # {future: 입력 순서}
+        try:
+            for i, item in itertools.islice(items, window):
+                pending[executor.submit(fn, item)] = i
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = pending.pop(future)
+                    if cancel_event is not None and cancel_event.is_set():
+                        return
+                    result = future.result()
+                    if result is not None:
+                        yield i, result
+                # 완료된 만큼 다음 작업을 채움
+                for i, item in itertools.islice(items, len(done)):
+                    if cancel_event is not None and cancel_event.is_set():
+                        break
+                    pending[executor.submit(fn, item)] = i
+        finally:
+            # 취소되었거나 예외가 발생하면 시작하지 않은 작업은 실행하지 않음
+            executor.shutdown(cancel_futures=True)
+
+
+    def close(self):
+        """프로세스 풀을 종료하는 함수."""
+        with self._lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(cancel_futures=True)
+                self._process_pool = None
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,171 @@
+import heapq
+import threading
+import numpy as np
+
+EARTH_RADIUS = 6371008.8  # 지구 평균 반지름(m)
+DEFAULT_MAX_SPEED = 130 / 3.6  # 경로 상 최대 주행 속도(m/s), 고속도로 최고 제한 속도(120km/h)보다 여유 있게 130km/h
+DEFAULT_TIME_WEIGHT = 1.0  # 이동 시간 1시간 당 차감할 장소 점수
+
+
+def haversine_matrix(coords) -> np.ndarray:
+    """[위도, 경도] 좌표 간의 대원 거리(m) 행렬을 계산하는 함수.
+
+    Args:
+        coords (np.ndarray | list): (N, 2) 크기의 [위도, 경도] 좌표
+
+    Returns:
+        np.ndarray: (N, N) 크기의 거리 행렬
+    """
+    radians = np.radians(np.asarray(coords, dtype=np.float64).reshape(-1, 2))
+    lat, lon = radians[:, 0], radians[:, 1]
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat[:, None]) * np.cos(lat[None, :]) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def mst_length(distances: np.ndarray) -> float:
+    """거리 행렬의 최소 신장 트리(MST) 길이를 Prim 알고리즘으로 계산하는 함수. O(N²)"""
+    num_nodes = len(distances)
+    if num_nodes <= 1:
+        return 0.0
+
+    in_tree = np.zeros(num_nodes, dtype=bool)
+    in_tree[0] = True
+    nearest = distances[0].copy()
+    total = 0.0
+    for _ in range(num_nodes - 1):
+        candidates = np.where(in_tree, np.inf, nearest)
+        node = int(np.argmin(candidates))
+        total += candidates[node]
+        in_tree[node] = True
+        nearest = np.minimum(nearest, distances[node])
+    return float(total)
+
+
+def travel_time_lower_bound(coords, max_speed: float = DEFAULT_MAX_SPEED) -> float:
+    """좌표를 모두 방문하는 경로의 최소 이동 시간(초) 하한을 계산하는 함수.
+
+    모든 지점을 잇는 경로의 길이는 직선 거리 기준 MST 길이 이상이고, 도로 거리는 직선 거리 이상이므로
+    MST 길이를 최대 주행 속도로 나눈 값은 실제 소요 시간을 넘지 않습니다.
+
+    Args:
+        coords (np.ndarray | list): (N, 2) 크기의 [위도, 경도] 좌표
+        max_speed (float, optional): 최대 주행 속도(m/s). Defaults to 130km/h.
+
+    Returns:
+        float: 이동 시간 하한(초)
+    """
+    return mst_length(haversine_matrix(coords)) / max_speed
+
+
+def place_coords(places: list) -> list:
+    """장소 정보(dict) 리스트에서 좌표가 있는 장소의 [위도, 경도] 리스트를 반환하는 함수."""
+    return [[float(place['latitude']), float(place['longitude'])] for place in places
+            if place.get('latitude') is not None and place.get('longitude') is not None]
+
+
+class CombinationSearch:
+    """장소 조합을 낙관적 상한(bound)이 높은 순서로 평가하여 상위 top_k 조합을 찾는 최선 우선(best-first) 탐색 클래스.
+
+    조합의 값은 '장소 점수(최종점수) 합 - time_weight × 이동 시간(시간)' 이며,
+    상한은 이동 시간 대신 직선 거리 기반 이동 시간 하한을 사용합니다.
+    다음 조합의 상한이 현재 k 번째 값 이하이면 남은 조합은 상위 k 에 들 수 없으므로 경로를 요청하지 않고 종료합니다.
+    """
+    def __init__(self, top_k: int, time_weight: float = DEFAULT_TIME_WEIGHT, max_speed: float = DEFAULT_MAX_SPEED):
+        """
+        Args:
+            top_k (int): 찾을 조합 수. None 이면 모든 조합을 평가 (생략 없음).
+            time_weight (float, optional): 이동 시간 1시간 당 차감할 장소 점수. Defaults to 1.0.
+            max_speed (float, optional): 이동 시간 하한 계산에 사용할 최대 주행 속도(m/s). Defaults to 130km/h.
+        """
+        self.top_k = top_k
+        self.time_weight = time_weight
+        self.max_speed = max_speed
+        self.evaluated = 0
+        self.pruned = 0
+
+
+    def combination_value(self, places: list, total_time: float) -> float:
+        """장소 조합과 실제 경로 소요 시간(초)으로 조합의 값을 계산하는 함수."""
+        return sum(float(place['최종점수']) for place in places) - self.time_weight * float(total_time) / 3600
+
+
+    def optimistic_value(self, places: list, anchors: list = ()) -> float:
+        """장소 조합 값의 상한을 계산하는 함수.
+
+        Args:
+            places (list): 장소 정보(dict) 리스트. 각 장소는 '최종점수', 'latitude', 'longitude' 키를 포함.
+            anchors (list, optional): 모든 조합이 함께 방문하는 지점(출발지, 축제 장소 등)의 [위도, 경도] 리스트.
+
+        Returns:
+            float: 조합 값의 상한
+        """
+        coords = list(anchors) + place_coords(places)
+        return self.combination_value(places, travel_time_lower_bound(coords, self.max_speed))
+
+
+    def search(self, combinations: list, evaluate, anchors: list = (), to_places=None,
+               executor=None, cancel_event: threading.Event = None) -> list:
+        """상한이 높은 조합부터 평가하여 값이 가장 높은 top_k 개의 조합을 찾는 함수.
+
+        executor 를 지정하면 상한이 높은 조합을 max_workers 개씩 묶어 병렬로 평가합니다. 묶음을 고를 때
+        상한이 현재 k 번째 값 이하인 조합은 제외하므로, 순차 평가와 같은 top_k 를 찾습니다.
+
+        Args:
+            combinations (list): 장소 정보(dict) 리스트의 리스트 (또는 PlaceCombinations 등 to_places 로 변환할 조합 시퀀스)
+            evaluate (callable): 조합을 받아 (값, 결과) 를 반환하는 함수. 경로를 만들 수 없으면 None 반환.
+            anchors (list, optional): 모든 조합이 함께 방문하는 지점의 [위도, 경도] 리스트.
+            to_places (callable, optional): 조합을 장소 정보(dict) 리스트로 변환하는 함수. Defaults to None (변환 없음).
+            executor (CombinationExecutor, optional): 조합을 병렬로 평가할 실행기. Defaults to None (순차 평가).
+            cancel_event (threading.Event, optional): 설정되면 남은 조합을 평가하지 않고
+                그때까지 평가한 조합의 상위 결과를 반환. Defaults to None.
+
+        Returns:
+            list: 값 내림차순으로 정렬한 (값, 조합, 결과) 튜플 리스트 (최대 top_k 개, top_k 가 None 이면 결과가 있는 모든 조합)
+        """
+        self.evaluated = self.pruned = 0
+        top_k = self.top_k if self.top_k is not None else len(combinations)
+        to_places = to_places or (lambda places: places)
+        candidates = [(-self.optimistic_value(to_places(combination), anchors), c)
+                      for c, combination in enumerate(combinations)]
+        heapq.heapify(candidates)
+        batch_size = executor.max_workers if executor is not None else 1
+
+        def evaluate_index(c):
+            evaluation = evaluate(combinations[c])
+            return None if evaluation is None else (c, evaluation)
+
+        top = []  # (값, -조합 인덱스, 결과) 최소 힙 (값이 같으면 앞 순서의 조합을 유지)
+        while candidates:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+
+            batch = []
+            while candidates and len(batch) < batch_size:
+                if len(top) >= top_k and -candidates[0][0] <= top[0][0]:
+                    break
+                batch.append(heapq.heappop(candidates)[1])
+            if not batch:
+                self.pruned = len(candidates)
+                break
+
+            self.evaluated += len(batch)
+            if executor is not None and len(batch) > 1:
+                evaluations = executor.map(evaluate_index, batch, cancel_event=cancel_event)
+            else:
+                evaluations = [evaluation for evaluation in map(evaluate_index, batch) if evaluation is not None]
+
+            for c, (value, result) in evaluations:
+                entry = (value, -c, result)
+                if len(top) < top_k:
+                    heapq.heappush(top, entry)
+                elif entry[:2] > top[0][:2]:
+                    heapq.heapreplace(top, entry)
+
+        return [(value, combinations[-c], result) for value, c, result in sorted(top, key=lambda x: x[:2], reverse=True)]
+
+
+    def stats(self) -> dict:
+        """마지막 탐색의 평가/생략한 조합 수를 반환하는 함수."""
+        return {'evaluated': self.evaluated, 'pruned': self.pruned}
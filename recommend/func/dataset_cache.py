@@ -0,0 +1,177 @@
+import os
+import json
+import hashlib
+import threading
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow 가 없으면 캐시 없이 CSV 를 직접 읽음
+    pa = None
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'cache', 'datasets')
+HASH_CHUNK_SIZE = 1 << 20  # 원본 파일 해시 계산 단위(byte)
+
+
+def file_digest(path: str) -> str:
+    """파일 내용의 sha256 해시를 계산하는 함수."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _dictionary_encode(table):
+    # 문자열 컬럼을 사전(dictionary) 인코딩하여 반복되는 값은 한 번만 저장
+    columns = [
+        pc.dictionary_encode(column) if pa.types.is_string(column.type) or pa.types.is_large_string(column.type) else column
+        for column in table.columns
+    ]
+    return pa.Table.from_arrays(columns, schema=None, names=table.column_names).replace_schema_metadata(table.schema.metadata)
+
+
+def _dictionary_decode(table, keep: tuple = ()):
+    # keep 이외의 사전 인코딩된 컬럼을 원래 문자열 타입으로 되돌림 (pd.read_csv 와 같은 dtype)
+    columns = [
+        column.cast(column.type.value_type) if pa.types.is_dictionary(column.type) and name not in keep else column
+        for name, column in zip(table.column_names, table.columns)
+    ]
+    return pa.Table.from_arrays(columns, names=table.column_names)
+
+
+class DatasetCache:
+    """CSV 데이터셋을 한 번만 파싱하여 Arrow IPC 파일로 저장하고, 이후에는 메모리 맵으로 읽는 캐시 클래스.
+
+    문자열 컬럼은 사전 인코딩하여 저장하며, 원본 CSV 의 크기/수정 시각이 바뀌면 내용 해시를 비교하여
+    내용이 달라진 경우에만 다시 변환합니다. 캐시 파일은 압축하지 않은 Arrow IPC 형식이므로
+    pa.memory_map 으로 열면 숫자 컬럼은 복사 없이(zero-copy) 읽습니다.
+    """
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        """
+        Args:
+            cache_dir (str, optional): 캐시 파일 디렉터리. Defaults to recommend/data/cache/datasets.
+        """
+        self.cache_dir = cache_dir
+
+        # 캐시 통계
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+
+    def cache_path(self, path: str, read_options: dict = None) -> str:
+        """원본 CSV 경로와 read_csv 옵션에 대응하는 캐시 파일 경로."""
+        key = json.dumps([os.path.abspath(path), read_options or {}], sort_keys=True, ensure_ascii=False, default=str)
+        stem = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.cache_dir, f"{stem}-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}.arrow")
+
+
+    def read_csv(self, path: str, categorical=False, **read_options) -> pd.DataFrame:
+        """CSV 파일을 캐시를 이용해 DataFrame 으로 읽는 함수.
+
+        Args:
+            path (str): CSV 파일 경로
+            categorical (bool | list, optional): True 이면 문자열 컬럼을 pandas Categorical 로 반환.
+                컬럼명 리스트이면 해당 컬럼만 Categorical 로 반환. Defaults to False (pd.read_csv 와 같은 dtype).
+            **read_options: 처음 변환할 때 pd.read_csv 에 전달할 옵션 (캐시 키에 포함)
+
+        Returns:
+            pd.DataFrame: CSV 데이터
+        """
+        if pa is None:
+            return pd.read_csv(path, **read_options)
+
+        table = self.read_table(path, **read_options)
+        if categorical is True:
+            return table.to_pandas()
+        return _dictionary_decode(table, keep=tuple(categorical or ())).to_pandas(split_blocks=True)
+
+
+    def read_table(self, path: str, **read_options):
+        """CSV 파일을 캐시를 이용해 (문자열 컬럼이 사전 인코딩된) pyarrow.Table 로 읽는 함수."""
+        stat = os.stat(path)
+        cache_path = self.cache_path(path, read_options)
+
+        table = self._load(cache_path)
+        if table is not None:
+            metadata = table.schema.metadata or {}
+            if metadata.get(b'source_size') == str(stat.st_size).encode() \
+                    and metadata.get(b'source_mtime_ns') == str(stat.st_mtime_ns).encode():
+                with self._lock:
+                    self.hits += 1
+                return table
+
+            # 수정 시각만 바뀐 경우(체크아웃 등) 내용 해시가 같으면 메타데이터만 갱신
+            digest = file_digest(path)
+            if metadata.get(b'source_sha256') == digest.encode():
+                table = self._write(cache_path, table, stat, digest)
+                with self._lock:
+                    self.hits += 1
+                return table
+
+        with self._lock:
+            self.misses += 1
+        data = pd.read_csv(path, **read_options)
+        table = _dictionary_encode(pa.Table.from_pandas(data, preserve_index=False))
+        return self._write(cache_path, table, stat, file_digest(path))
+
+
+    def _load(self, cache_path: str):
+        # 캐시 파일을 메모리 맵으로 열어 읽음. 없거나 손상된 경우 None
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with pa.memory_map(cache_path, 'r') as source:
+                return pa.ipc.open_file(source).read_all()
+        except (OSError, pa.ArrowInvalid):
+            return None
+
+
+    def _write(self, cache_path: str, table, stat, digest: str):
+        metadata = dict(table.schema.metadata or {})
+        metadata.update({
+            b'source_size': str(stat.st_size).encode(),
+            b'source_mtime_ns': str(stat.st_mtime_ns).encode(),
+            b'source_sha256': digest.encode(),
+        })
+        table = table.replace_schema_metadata(metadata)
+
+        # 다른 프로세스/스레드가 읽는 중에도 안전하도록 임시 파일에 쓴 뒤 교체
+        temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with pa.OSFile(temp_path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            # 캐시를 저장할 수 없어도 변환한 데이터는 그대로 사용
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return table
+
+
+    def clear(self):
+        """캐시 파일을 모두 삭제하는 함수."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for file_name in os.listdir(self.cache_dir):
+            if file_name.endswith('.arrow'):
+                os.remove(os.path.join(self.cache_dir, file_name))
+
+
+    def stats(self) -> dict:
+        """캐시 적중/미스 통계를 반환하는 함수."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+
+# 모듈 공용 캐시
+dataset_cache = DatasetCache()
+
+
+def read_cached_csv(path: str, categorical=False, **read_options) -> pd.DataFrame:
+    """공용 DatasetCache 로 CSV 파일을 읽는 함수 (pd.read_csv 대체)."""
+    return dataset_cache.read_csv(path, categorical=categorical, **read_options)
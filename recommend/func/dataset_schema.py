@@ -0,0 +1,86 @@
+import os
+import glob
+
+import pandas as pd
+
+from recommend.func.dataset_cache import read_cached_csv
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data')
+
+# 적은 수의 값이 반복되는 행정구역/분류 컬럼 → category
+REGION_DTYPES = {'목적지시군구명': 'category', '목적지읍면동명': 'category'}
+CATEGORY_DTYPES = {'대분류': 'category', '중분류': 'category', '소분류': 'category'}
+# 좌표는 float32 (약 1m 정밀도)
+COORDINATE_DTYPES = {'목적지X좌표': 'float32', '목적지Y좌표': 'float32'}
+# 0/1/2 값의 기간 구분 컬럼 → int8
+PERIOD_DTYPES = {'festival_period': 'int8', 'is_weekend': 'int8'}
+
+# 데이터셋 종류(파일명에서 지역 접두어 g_/b_/tt_ 를 뺀 이름) 별 컬럼 dtype.
+# 방문건수는 정수 데이터만 int32 로 줄이고, 평균값(소수)은 float64, 정수값이 float 으로 저장된 데이터는 float32 로 읽음
+DATASET_SCHEMAS = {
+    'togo_count': {**COORDINATE_DTYPES, **REGION_DTYPES, **CATEGORY_DTYPES, '방문건수': 'int32'},
+    'not_togo_count': {**COORDINATE_DTYPES, **REGION_DTYPES, **CATEGORY_DTYPES, '방문건수': 'int32'},
+    'fest_togo_count': {**COORDINATE_DTYPES, **REGION_DTYPES, **CATEGORY_DTYPES, **PERIOD_DTYPES, '방문건수': 'int32'},
+    'fest_not_togo_count': {**COORDINATE_DTYPES, **REGION_DTYPES, **CATEGORY_DTYPES, **PERIOD_DTYPES, '방문건수': 'float64'},
+    'fest_visit_count': {**COORDINATE_DTYPES, **PERIOD_DTYPES, '표시용행정구역': 'category', '요일': 'category', '방문건수': 'float32'},
+    'wkd_visit_count': {**COORDINATE_DTYPES, **PERIOD_DTYPES, '표시용행정구역': 'category', '요일': 'category', '방문건수': 'float32'},
+    'bj_navi_전처리데이터': {**COORDINATE_DTYPES, **REGION_DTYPES, **CATEGORY_DTYPES},
+}
+
+
+def dataset_kind(path: str) -> str:
+    """데이터셋 파일 경로에서 데이터셋 종류를 반환하는 함수. 예: './data/tt_togo_count.csv' → 'togo_count'"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    prefix, _, kind = stem.partition('_')
+    return kind if prefix in ('g', 'b', 'tt') else stem
+
+
+def get_schema(path: str) -> dict:
+    """데이터셋 파일의 {컬럼: dtype} 스키마. 등록되지 않은 데이터셋이면 빈 사전."""
+    return dict(DATASET_SCHEMAS.get(dataset_kind(path), {}))
+
+
+def read_dataset(path: str) -> pd.DataFrame:
+    """등록된 스키마의 dtype 으로 데이터셋을 읽는 함수 (DatasetCache 로 한 번만 변환).
+
+    스키마에 없는 컬럼은 pd.read_csv 와 같은 dtype 으로 읽으며, 스키마의 컬럼이 파일에 없으면 무시합니다.
+
+    Args:
+        path (str): CSV 파일 경로
+
+    Returns:
+        pd.DataFrame: 데이터셋
+    """
+    schema = get_schema(path)
+    if not schema:
+        return read_cached_csv(path)
+    categorical = [column for column, dtype in schema.items() if dtype == 'category']
+    return read_cached_csv(path, categorical=categorical, dtype=schema)
+
+
+def memory_report(paths: list = None) -> pd.DataFrame:
+    """데이터셋 별 스키마 적용 전/후 메모리 사용량(MB)을 비교하는 함수.
+
+    Args:
+        paths (list, optional): CSV 파일 경로 리스트. Defaults to None (data/*.csv 전체).
+
+    Returns:
+        pd.DataFrame: file, rows, before_mb, after_mb, ratio 컬럼
+    """
+    if paths is None:
+        paths = sorted(glob.glob(os.path.join(DATA_DIR, '*.csv')))
+
+    report = []
+    for path in paths:
+        before = pd.read_csv(path)
+        after = read_dataset(path)
+        before_mb = before.memory_usage(deep=True).sum() / 2 ** 20
+        after_mb = after.memory_usage(deep=True).sum() / 2 ** 20
+        report.append({
+            'file': os.path.basename(path),
+            'rows': len(after),
+            'before_mb': round(before_mb, 3),
+            'after_mb': round(after_mb, 3),
+            'ratio': round(after_mb / before_mb, 3) if before_mb else 1.0,
+        })
+    return pd.DataFrame(report, columns=['file', 'rows', 'before_mb', 'after_mb', 'ratio'])
@@ -0,0 +1,147 @@
+import os
+import threading
+from urllib.parse import urlsplit, urlunsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+# 기본 커넥션 풀 / 타임아웃 설정
+DEFAULT_POOL_CONNECTIONS = 4  # 캐싱할 호스트(커넥션 풀) 수
+DEFAULT_POOL_MAXSIZE = 16  # 호스트 당 유지할 keep-alive 커넥션 수
+DEFAULT_CONNECT_TIMEOUT = 3.05  # 연결 타임아웃(초)
+DEFAULT_READ_TIMEOUT = 15  # 응답 대기 타임아웃(초)
+DEFAULT_MAX_IN_FLIGHT_PER_HOST = 8  # 호스트 당 동시 진행 요청 수 상한
+
+# 공용 transport 동작 모드 환경 변수
+# - ODYSSEYES_HTTP_MODE: 'live'(기본), 'record'(요청/응답 기록), 'replay'(기록된 응답 재생)
+# - ODYSSEYES_HTTP_RECORD_DIR: 기록 파일 디렉터리
+# - ODYSSEYES_HTTP_BASE_URL: 모든 요청을 보낼 대체 서버 주소 (예: 로컬 stand-in 서버)
+HTTP_MODE_ENV = 'ODYSSEYES_HTTP_MODE'
+HTTP_RECORD_DIR_ENV = 'ODYSSEYES_HTTP_RECORD_DIR'
+HTTP_BASE_URL_ENV = 'ODYSSEYES_HTTP_BASE_URL'
+
+
+class HTTPTransport:
+    """외부 API 호출에 사용하는 공용 HTTP 전송 계층 클래스.
+
+    requests.Session 하나를 공유하여 호스트 별 keep-alive 커넥션 풀을 재사용하고,
+    모든 요청에 연결/응답 타임아웃과 gzip 압축 헤더를 기본으로 적용합니다.
+    """
+    def __init__(self,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT,
+                 max_in_flight_per_host: int = DEFAULT_MAX_IN_FLIGHT_PER_HOST,
+                 base_url: str = None):
+        """
+        Args:
+            pool_connections (int, optional): 커넥션 풀을 유지할 호스트 수. Defaults to 4.
+            pool_maxsize (int, optional): 호스트 당 최대 커넥션 수. Defaults to 16.
+            connect_timeout (float, optional): 연결 타임아웃(초). Defaults to 3.05.
+            read_timeout (float, optional): 응답 대기 타임아웃(초). Defaults to 15.
+            max_in_flight_per_host (int, optional): 호스트(upstream) 당 동시에 진행할 수 있는 요청 수. 
+                초과한 요청은 앞선 요청이 끝날 때까지 대기합니다. Defaults to 8.
+            base_url (str, optional): 지정하면 모든 요청 URL 의 scheme/host 를 이 주소로 바꿔 전송합니다.
+                로컬 stand-in 서버로 요청을 보낼 때 사용. Defaults to None.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_in_flight_per_host = max_in_flight_per_host
+        self.base_url = base_url
+
+        # 호스트 별 동시 요청 수 제한용 세마포어
+        self._host_semaphores = dict()
+        self._host_semaphores_lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        })
+
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """공용 세션으로 HTTP 요청을 전송하는 함수.
+
+        Args:
+            method (str): HTTP 메서드 (예: "GET", "POST")
+            url (str): 요청 URL
+            **kwargs: requests.Session.request 에 전달할 인자 (headers, params, json, verify 등)
+
+        Returns:
+            requests.Response: 응답 객체
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        if self.base_url:
+            url = self._rewrite_url(url)
+        with self._get_host_semaphore(urlsplit(url).netloc):
+            return self.session.request(method, url, **kwargs)
+
+
+    def _rewrite_url(self, url: str) -> str:
+        base = urlsplit(self.base_url)
+        parts = urlsplit(url)
+        return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, parts.fragment))
+
+
+    def _get_host_semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._host_semaphores_lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(self.max_in_flight_per_host)
+            return self._host_semaphores[host]
+
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+
+    def close(self):
+        self.session.close()
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HTTPTransport:
+    """프로세스 전역에서 공유하는 HTTPTransport 인스턴스를 반환하는 함수."""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = create_transport_from_env()
+    return _transport
+
+
+def create_transport_from_env() -> HTTPTransport:
+    """환경 변수(ODYSSEYES_HTTP_MODE 등)에 따라 live/record/replay transport 를 생성하는 함수."""
+    mode = os.getenv(HTTP_MODE_ENV, 'live').lower()
+    record_dir = os.getenv(HTTP_RECORD_DIR_ENV)
+    base_url = os.getenv(HTTP_BASE_URL_ENV)
+
+    if mode == 'live':
+        return HTTPTransport(base_url=base_url)
+
+    # 순환 import 를 피하기 위해 필요한 경우에만 import
+    from recommend.func.recording_transport import RecordingTransport, ReplayTransport, DEFAULT_RECORD_DIR
+    record_dir = record_dir or DEFAULT_RECORD_DIR
+    if mode == 'record':
+        return RecordingTransport(record_dir, base_url=base_url)
+    if mode == 'replay':
+        return ReplayTransport(record_dir)
+    raise ValueError(f"Unknown {HTTP_MODE_ENV} '{mode}'. Expected one of 'live', 'record', 'replay'.")
+
+
+def set_transport(transport: HTTPTransport):
+    """프로세스 전역 HTTPTransport 인스턴스를 교체하는 함수 (풀 크기/타임아웃 변경 시 사용)."""
+    global _transport
+    with _transport_lock:
+        _transport = transport
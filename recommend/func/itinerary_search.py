@@ -0,0 +1,270 @@
+import math
+import time
+import random
+
+from recommend.func.combination_search import haversine_matrix
+
+ESTIMATED_SPEED = 40 / 3.6  # 이동 시간 추정에 사용하는 평균 주행 속도(m/s)
+DETOUR_FACTOR = 1.3  # 도로 거리 / 직선 거리 추정 비율
+DEFAULT_TIME_LIMIT = 1.0  # 탐색 제한 시간(초)
+DEFAULT_ALPHA = 0.3  # GRASP 후보 제한 리스트(RCL) 비율
+DEFAULT_COOLING = 0.995  # 담금질 온도 감소율
+TIME_TIE_BREAK = 1e-6  # 점수가 같으면 소요 시간이 짧은 일정을 선호
+
+
+def estimate_travel_times(coords, speed: float = ESTIMATED_SPEED, detour_factor: float = DETOUR_FACTOR) -> list:
+    """[위도, 경도] 좌표 간 직선 거리로 이동 시간(초) 행렬을 추정하는 함수.
+
+    후보 장소가 많으면 모든 구간의 경로를 요청할 수 없으므로, 일정 탐색에는 추정 이동 시간을 사용하고
+    선택된 일정만 경로 API 로 요청합니다.
+    """
+    return (haversine_matrix(coords) * detour_factor / speed).tolist()
+
+
+class ItinerarySearch:
+    """이동 시간 예산 안에서 방문할 장소 선택과 방문 순서를 함께 정하는 일정 탐색 클래스 (Orienteering Problem).
+
+    GRASP 로 초기 일정을 만들고, 2-opt / Or-opt 로 방문 순서를 개선한 뒤 장소 추가/교체로 점수를 높입니다.
+    이후 제한 시간 동안 일부 장소를 제거하고 다시 채우는 교란(perturbation)을 담금질(simulated annealing)
+    기준으로 수용하며 탐색합니다. 같은 seed 와 반복 횟수에서는 같은 결과를 반환합니다.
+    """
+    def __init__(self, travel_times: list, scores: list, budget: float, dwell_times: list = None,
+                 start: int = 0, end: int = 0, required: tuple = (), categories: list = None,
+                 category_limits: dict = None, max_stops: int = None, time_limit: float = DEFAULT_TIME_LIMIT,
+                 max_iterations: int = None, seed: int = None, alpha: float = DEFAULT_ALPHA,
+                 cooling: float = DEFAULT_COOLING):
+        """
+        Args:
+            travel_times (list): travel_times[i][j] 가 i → j 이동 시간(초)인 N×N 행렬
+            scores (list): 장소 별 점수 (길이 N, 출발/도착지는 0)
+            budget (float): 총 소요 시간(이동 + 체류) 예산(초)
+            dwell_times (list, optional): 장소 별 체류 시간(초). Defaults to None (0).
+            start (int, optional): 출발지 인덱스. Defaults to 0.
+            end (int, optional): 도착지 인덱스. Defaults to 0 (출발지로 복귀).
+            required (tuple, optional): 반드시 방문할 장소 인덱스 (예: 축제 장소). Defaults to ().
+            categories (list, optional): 장소 별 분류 (category_limits 와 함께 사용). Defaults to None.
+            category_limits (dict, optional): {분류: 최대 방문 수}. Defaults to None (제한 없음).
+            max_stops (int, optional): 최대 방문 장소 수 (required 포함). Defaults to None (제한 없음).
+            time_limit (float, optional): 탐색 제한 시간(초). Defaults to 1.0.
+            max_iterations (int, optional): 최대 교란 반복 횟수. 재현 가능한 결과가 필요하면 지정. Defaults to None.
+            seed (int, optional): 난수 seed. Defaults to None.
+            alpha (float, optional): GRASP 후보 제한 리스트 비율 (0 이면 탐욕). Defaults to 0.3.
+            cooling (float, optional): 반복마다 곱하는 담금질 온도 감소율. Defaults to 0.995.
+        """
+        self.travel_times = [list(row) for row in travel_times]
+        self.scores = [float(score) for score in scores]
+        self.num_nodes = len(self.scores)
+        self.dwell_times = [float(dwell) for dwell in dwell_times] if dwell_times is not None else [0.0] * self.num_nodes
+        self.budget = budget
+        self.start = start
+        self.end = end
+        self.required = tuple(required)
+        self.categories = categories
+        self.category_limits = category_limits or {}
+        self.max_stops = max_stops if max_stops is not None else self.num_nodes
+        self.time_limit = time_limit
+        self.max_iterations = max_iterations
+        self.alpha = alpha
+        self.cooling = cooling
+        self.rng = random.Random(seed)
+        self.candidates = [node for node in range(self.num_nodes)
+                           if node not in (start, end) and node not in self.required]
+
+
+    def route_time(self, route: list) -> float:
+        """출발지 → route → 도착지 일정의 총 소요 시간(이동 + 체류, 초)."""
+        nodes = [self.start] + route + [self.end]
+        travel = sum(self.travel_times[a][b] for a, b in zip(nodes, nodes[1:]))
+        return travel + sum(self.dwell_times[node] for node in route)
+
+
+    def route_score(self, route: list) -> float:
+        """일정의 장소 점수 합."""
+        return sum(self.scores[node] for node in route)
+
+
+    def _objective(self, route: list) -> float:
+        return self.route_score(route) - TIME_TIE_BREAK * self.route_time(route)
+
+
+    def _category_allows(self, route: list, node: int) -> bool:
+        if not self.category_limits or self.categories is None:
+            return True
+        category = self.categories[node]
+        limit = self.category_limits.get(category)
+        return limit is None or sum(1 for n in route if self.categories[n] == category) < limit
+
+
+    def _best_insertion(self, route: list, node: int, route_time: float) -> tuple:
+        # node 를 가장 적은 추가 시간으로 넣을 수 있는 (추가 시간, 위치). 예산을 넘으면 (inf, None)
+        nodes = [self.start] + route + [self.end]
+        best_delta, best_position = math.inf, None
+        for position in range(len(nodes) - 1):
+            a, b = nodes[position], nodes[position + 1]
+            delta = self.travel_times[a][node] + self.travel_times[node][b] - self.travel_times[a][b] + self.dwell_times[node]
+            if delta < best_delta:
+                best_delta, best_position = delta, position
+        if route_time + best_delta > self.budget:
+            return math.inf, None
+        return best_delta, best_position
+
+
+    def _fill(self, route: list, alpha: float) -> list:
+        """GRASP: 점수/추가 시간 비율 상위 후보(RCL) 중 하나를 무작위로 넣는 과정을 더 넣을 수 없을 때까지 반복."""
+        route = list(route)
+        route_time = self.route_time(route)
+        while len(route) < self.max_stops:
+            insertions = []
+            for node in self.candidates:
+                if node in route or not self._category_allows(route, node):
+                    continue
+                delta, position = self._best_insertion(route, node, route_time)
+                if position is not None:
+                    insertions.append((self.scores[node] / (delta + 1.0), node, position, delta))
+            if not insertions:
+                break
+
+            insertions.sort(reverse=True)
+            restricted = insertions[:max(1, int(math.ceil(alpha * len(insertions))))]
+            _, node, position, delta = restricted[self.rng.randrange(len(restricted))]
+            route.insert(position, node)
+            route_time += delta
+        return route
+
+
+    def _two_opt(self, route: list) -> list:
+        """구간 뒤집기로 소요 시간이 줄어드는 동안 방문 순서를 개선."""
+        best_time = self.route_time(route)
+        improved = True
+        while improved:
+            improved = False
+            for i in range(len(route) - 1):
+                for j in range(i + 1, len(route)):
+                    candidate = route[:i] + route[i:j + 1][::-1] + route[j + 1:]
+                    candidate_time = self.route_time(candidate)
+                    if candidate_time < best_time - 1e-9:
+                        route, best_time, improved = candidate, candidate_time, True
+        return route
+
+
+    def _or_opt(self, route: list) -> list:
+        """길이 1~3 구간을 다른 위치로 옮겨 소요 시간이 줄어드는 동안 방문 순서를 개선."""
+        best_time = self.route_time(route)
+        improved = True
+        while improved:
+            improved = False
+            for length in (1, 2, 3):
+                for i in range(len(route) - length + 1):
+                    segment = route[i:i + length]
+                    rest = route[:i] + route[i + length:]
+                    for position in range(len(rest) + 1):
+                        if position == i:
+                            continue
+                        candidate = rest[:position] + segment + rest[position:]
+                        candidate_time = self.route_time(candidate)
+                        if candidate_time < best_time - 1e-9:
+                            route, best_time, improved = candidate, candidate_time, True
+                            break
+                    if improved:
+                        break
+                if improved:
+                    break
+        return route
+
+
+    def _swap(self, route: list) -> list:
+        """일정의 장소를 점수가 더 높은 미방문 장소로 교체할 수 있으면 교체."""
+        improved = True
+        while improved:
+            improved = False
+            for i, node in enumerate(route):
+                if node in self.required:
+                    continue
+                rest = route[:i] + route[i + 1:]
+                rest_time = self.route_time(rest)
+                for candidate in sorted(self.candidates, key=lambda n: -self.scores[n]):
+                    if self.scores[candidate] <= self.scores[node]:
+                        break
+                    if candidate in route or not self._category_allows(rest, candidate):
+                        continue
+                    _, position = self._best_insertion(rest, candidate, rest_time)
+                    if position is not None:
+                        route = rest[:position] + [candidate] + rest[position:]
+                        improved = True
+                        break
+                if improved:
+                    break
+        return route
+
+
+    def local_search(self, route: list) -> list:
+        """방문 순서 개선(2-opt, Or-opt) 후 남는 시간에 장소 추가/교체를 반복."""
+        while True:
+            before = self._objective(route)
+            route = self._or_opt(self._two_opt(route))
+            route = self._fill(self._swap(route), alpha=0.0)
+            if self._objective(route) <= before + 1e-12:
+                return route
+
+
+    def _initial_route(self) -> list:
+        # 반드시 방문할 장소를 추가 시간이 적은 위치에 차례로 넣음 (예산 확인은 search 에서)
+        route = []
+        for node in self.required:
+            _, position = self._best_insertion(route, node, -math.inf)
+            route.insert(position, node)
+        return route
+
+
+    def _perturb(self, route: list) -> list:
+        removable = [node for node in route if node not in self.required]
+        if removable:
+            for node in self.rng.sample(removable, self.rng.randint(1, min(2, len(removable)))):
+                route = [n for n in route if n != node]
+        return self._fill(route, self.alpha)
+
+
+    def search(self, top_k: int = 1) -> list:
+        """제한 시간(또는 최대 반복 횟수) 동안 탐색하여 점수가 높은 서로 다른 일정을 반환하는 함수.
+
+        Args:
+            top_k (int, optional): 반환할 일정 수 (방문 장소 집합이 서로 다른 일정). Defaults to 1.
+
+        Returns:
+            list: 점수 내림차순으로 정렬한 (점수, 소요 시간(초), 방문 순서 tuple) 리스트.
+                방문 순서에는 출발지/도착지가 포함되지 않습니다. 반드시 방문할 장소만으로 예산을 넘으면 빈 리스트.
+        """
+        initial = self._initial_route()
+        if self.route_time(initial) > self.budget:
+            return []
+
+        deadline = time.perf_counter() + self.time_limit
+        found = dict()  # {방문 장소 집합: (목적 함수 값, 방문 순서)}
+
+        def record(route):
+            key = frozenset(route)
+            value = self._objective(route)
+            if key not in found or value > found[key][0]:
+                found[key] = (value, tuple(route))
+
+        current = self.local_search(self._fill(initial, self.alpha))
+        record(current)
+        current_value = self._objective(current)
+        temperature = max(self.scores, default=1.0) or 1.0
+
+        iteration = 0
+        while time.perf_counter() < deadline and (self.max_iterations is None or iteration < self.max_iterations):
+            iteration += 1
+            # 교란 후 방문 순서만 개선한 일정도 서로 다른 장소 집합의 후보로 기록
+            perturbed = self._or_opt(self._two_opt(self._perturb(current)))
+            record(perturbed)
+            candidate = self.local_search(perturbed)
+            record(candidate)
+            candidate_value = self._objective(candidate)
+            delta = candidate_value - current_value
+            if delta >= 0 or self.rng.random() < math.exp(delta / temperature):
+                current, current_value = candidate, candidate_value
+            temperature = max(temperature * self.cooling, 1e-9)
+
+        best = sorted(found.values(), key=lambda item: (-item[0], item[1]))[:top_k]
+        return [(self.route_score(list(route)), self.route_time(list(route)), route) for _, route in best]
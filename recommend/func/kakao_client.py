@@ -4,11 +4,14 @@ from dotenv import load_dotenv
 import requests
 import json
 
+from recommend.func.http_transport import HTTPTransport, get_transport
+
 class KakaoMobilityClient:
     """Kakao Mobility API 호출을 담당하는 클래스 
     """
-    def __init__(self, api_key:str):
+    def __init__(self, api_key:str, transport: HTTPTransport = None):
         self.api_key = api_key
+        self.transport = transport if transport is not None else get_transport()
 
     def get_route_data(self, start_poi, end_poi, waypoints: list=None):
         url = "https://apis-navi.kakaomobility.com/v1/directions"
@@ -30,7 +33,11 @@ class KakaoMobilityClient:
             waypoints_str = "|".join([f"{wp['longitude']},{wp['latitude']}" for wp in waypoints])
             params["waypoints"] = waypoints_str
         
-        response = requests.get(url, headers=headers, params=params)
+        try:
+            response = self.transport.get(url, headers=headers, params=params)
+        except requests.RequestException as e:
+            print(f"Error: Request to Kakao Mobility API for route failed. ({e})")
+            return None
         if response.status_code == 200:
             route_data = response.json()
             return route_data
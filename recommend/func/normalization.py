@@ -0,0 +1,100 @@
+import numpy as np
+
+
+def _as_float_array(values) -> np.ndarray:
+    # 숫자 문자열(TMAP 경유지 최적화 응답 등)도 float 으로 변환
+    return np.asarray(values, dtype=np.float64)
+
+
+def min_max_normalize(values, axis: int = 0) -> np.ndarray:
+    """최솟값 0, 최댓값 1 이 되도록 값을 정규화하는 함수 (sklearn MinMaxScaler 와 동일).
+
+    범위(최댓값 - 최솟값)가 0 인 축은 모두 0 으로 변환합니다.
+
+    Args:
+        values (np.ndarray | list): 정규화할 값. 2차원이면 axis 방향으로 정규화 (기본: 열 별).
+        axis (int, optional): 정규화할 축. Defaults to 0.
+
+    Returns:
+        np.ndarray: 정규화된 float64 배열
+    """
+    values = _as_float_array(values)
+    if values.size == 0:
+        return values
+    minimum = values.min(axis=axis, keepdims=True)
+    value_range = values.max(axis=axis, keepdims=True) - minimum
+    value_range[value_range == 0] = 1.0
+    # MinMaxScaler 와 같은 연산 순서로 계산하여 반올림 결과를 일치시킴
+    scale = 1.0 / value_range
+    return values * scale - minimum * scale
+
+
+def z_score_normalize(values, axis: int = 0, ddof: int = 0) -> np.ndarray:
+    """평균 0, 표준편차 1 이 되도록 값을 정규화하는 함수.
+
+    표준편차가 0 인 축은 모두 0 으로 변환합니다.
+
+    Args:
+        values (np.ndarray | list): 정규화할 값
+        axis (int, optional): 정규화할 축. Defaults to 0.
+        ddof (int, optional): 표준편차 계산의 자유도 보정값. Defaults to 0.
+
+    Returns:
+        np.ndarray: 정규화된 float64 배열
+    """
+    values = _as_float_array(values)
+    if values.size == 0:
+        return values
+    std = values.std(axis=axis, ddof=ddof, keepdims=True)
+    std[std == 0] = 1.0
+    return (values - values.mean(axis=axis, keepdims=True)) / std
+
+
+def _average_ranks(column: np.ndarray) -> np.ndarray:
+    # 1 부터 시작하는 순위 (같은 값은 평균 순위)
+    _, inverse, counts = np.unique(column, return_inverse=True, return_counts=True)
+    average_ranks = np.cumsum(counts) - (counts - 1) / 2
+    return average_ranks[inverse.reshape(-1)]
+
+
+def rank_normalize(values, axis: int = 0) -> np.ndarray:
+    """값의 순위를 0 ~ 1 로 정규화하는 함수. 같은 값은 평균 순위를 사용합니다.
+
+    값이 하나뿐이거나 모두 같은 축은 모두 0 으로 변환합니다.
+
+    Args:
+        values (np.ndarray | list): 정규화할 값
+        axis (int, optional): 정규화할 축. Defaults to 0.
+
+    Returns:
+        np.ndarray: 정규화된 float64 배열
+    """
+    values = _as_float_array(values)
+    if values.size == 0:
+        return values
+    ranks = np.apply_along_axis(_average_ranks, axis, values)
+    return min_max_normalize(ranks, axis=axis)
+
+
+# 사용 가능한 정규화 방법
+NORMALIZERS = {
+    'min_max': min_max_normalize,
+    'z_score': z_score_normalize,
+    'rank': rank_normalize,
+}
+
+
+def normalize(values, method: str = 'min_max', axis: int = 0) -> np.ndarray:
+    """지정한 방법으로 값을 정규화하는 함수.
+
+    Args:
+        values (np.ndarray | list): 정규화할 값
+        method (str, optional): 'min_max', 'z_score', 'rank' 중 하나. Defaults to 'min_max'.
+        axis (int, optional): 정규화할 축. Defaults to 0.
+
+    Returns:
+        np.ndarray: 정규화된 float64 배열
+    """
+    if method not in NORMALIZERS:
+        raise ValueError(f"Unknown normalization method '{method}'. Expected one of {list(NORMALIZERS)}.")
+    return NORMALIZERS[method](values, axis=axis)
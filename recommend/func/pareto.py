@@ -0,0 +1,108 @@
+import numpy as np
+
+from recommend.func.normalization import min_max_normalize
+
+# 경로 목적 (properties 키, 최대화 여부)
+ROUTE_OBJECTIVES = (
+    ('totalDistance', False),
+    ('totalTime', False),
+    ('totalFare', False),
+    ('placeScore', True),  # 장소 점수 합 (이동 비용이 반영된 routeScore 는 거리/시간과 중복되므로 사용하지 않음)
+)
+# get_scaled_scores 의 totalRouteScore 와 같은 동일 가중치
+DEFAULT_OBJECTIVE_WEIGHTS = {'totalDistance': 1.0, 'totalTime': 1.0, 'totalFare': 1.0, 'placeScore': 1.0}
+
+
+def pareto_front(values, maximize) -> np.ndarray:
+    """다른 어떤 점에도 지배(dominate)되지 않는 점(skyline)의 인덱스를 정렬 기반으로 계산하는 함수.
+
+    모든 목적을 최소화로 바꾼 뒤 목적 값의 합으로 정렬하면(Sort-Filter-Skyline), 어떤 점을 지배하는 점은
+    항상 그 점보다 앞에 오므로 각 점을 지금까지 찾은 skyline 과만 비교하면 됩니다.
+
+    Args:
+        values (np.ndarray | list): (N, M) 크기의 목적 값
+        maximize (list): 목적 별 최대화 여부 (길이 M)
+
+    Returns:
+        np.ndarray: 지배되지 않는 점의 인덱스 (입력 순서)
+    """
+    values = np.asarray(values, dtype=np.float64).reshape(len(values), -1)
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.intp)
+
+    # 최대화 목적은 부호를 바꿔 최소화로 통일
+    costs = np.where(np.asarray(maximize, dtype=bool), -values, values)
+    order = np.lexsort(costs.T[::-1])  # 첫 번째 목적부터 사전식 정렬 (합이 같은 점의 순서 고정)
+    order = order[np.argsort(costs[order].sum(axis=1), kind='stable')]
+
+    skyline = np.empty((len(values), costs.shape[1]))
+    skyline_indices = []
+    for index in order:
+        cost = costs[index]
+        window = skyline[:len(skyline_indices)]
+        dominated = np.any(np.all(window <= cost, axis=1) & np.any(window < cost, axis=1))
+        if not dominated:
+            skyline[len(skyline_indices)] = cost
+            skyline_indices.append(index)
+
+    return np.sort(np.asarray(skyline_indices, dtype=np.intp))
+
+
+def route_objective_matrix(routes: list, objectives: tuple = ROUTE_OBJECTIVES) -> np.ndarray:
+    """경로 리스트의 properties 에서 목적 값을 (N, M) 배열로 추출하는 함수."""
+    return np.asarray(
+        [[route['properties'][key] for key, _ in objectives] for route in routes], dtype=np.float64
+    ).reshape(len(routes), len(objectives))
+
+
+def weighted_front_scores(values, front, maximize, weights) -> np.ndarray:
+    """Pareto front 의 점을 가중치 합으로 평가하는 함수.
+
+    목적 값은 전체 후보 기준으로 0 ~ 1 정규화하고, 최소화 목적은 1 - 정규화 값으로 바꿔 클수록 좋게 만듭니다.
+
+    Args:
+        values (np.ndarray): (N, M) 크기의 전체 후보 목적 값
+        front (np.ndarray): Pareto front 인덱스
+        maximize (list): 목적 별 최대화 여부
+        weights (list): 목적 별 가중치
+
+    Returns:
+        np.ndarray: front 순서의 가중치 점수
+    """
+    normalized = min_max_normalize(values)
+    goodness = np.where(np.asarray(maximize, dtype=bool), normalized, 1 - normalized)
+    return goodness[front] @ np.asarray(weights, dtype=np.float64)
+
+
+def select_pareto_routes(routes: list, weights: dict = None, objectives: tuple = ROUTE_OBJECTIVES) -> dict:
+    """후보 경로의 Pareto front 와 가중치에 따른 선택 결과를 반환하는 함수.
+
+    front 는 가중치와 무관하므로, 가중치를 바꿀 때는 같은 후보 경로로 다시 호출하면 API 호출 없이 선택만 바뀝니다.
+
+    Args:
+        routes (list): 'properties' 에 목적 값을 가진 후보 경로 리스트
+        weights (dict, optional): {목적 키: 가중치}. 없는 목적은 0. Defaults to None (동일 가중치).
+        objectives (tuple, optional): (properties 키, 최대화 여부) 튜플. Defaults to ROUTE_OBJECTIVES.
+
+    Returns:
+        dict:
+            - front (list): paretoScore 내림차순으로 정렬한 Pareto front 경로 리스트
+            - selected (dict): paretoScore 가 가장 높은 경로 (후보가 없으면 None)
+            - weights (dict): 사용한 가중치
+    """
+    weights = dict(DEFAULT_OBJECTIVE_WEIGHTS if weights is None else weights)
+    if not routes:
+        return {'front': [], 'selected': None, 'weights': weights}
+
+    values = route_objective_matrix(routes, objectives)
+    maximize = [is_maximized for _, is_maximized in objectives]
+    front = pareto_front(values, maximize)
+    scores = weighted_front_scores(values, front, maximize, [weights.get(key, 0.0) for key, _ in objectives])
+
+    front_routes = []
+    for index, score in sorted(zip(front.tolist(), scores.tolist()), key=lambda x: (-x[1], x[0])):
+        route = dict(routes[index])
+        route['properties'] = dict(route['properties'], paretoScore=round(score, 4))
+        front_routes.append(route)
+
+    return {'front': front_routes, 'selected': front_routes[0], 'weights': weights}
@@ -0,0 +1,102 @@
+import math
+from itertools import combinations, product
+
+import numpy as np
+import pandas as pd
+
+
+def unrank_combination(rank: int, n: int, r: int) -> tuple:
+    """itertools.combinations(range(n), r) 의 rank 번째 조합을 직접 계산하는 함수 (사전식 순서)."""
+    result = []
+    x = 0
+    for position in range(r):
+        remaining = r - position - 1
+        # x 를 이 위치에 두는 조합 수보다 rank 가 작아질 때까지 다음 원소로 이동
+        count = math.comb(n - x - 1, remaining)
+        while rank >= count:
+            rank -= count
+            x += 1
+            count = math.comb(n - x - 1, remaining)
+        result.append(x)
+        x += 1
+    return tuple(result)
+
+
+class PlaceCombinations:
+    """장소 조합을 행 번호 tuple 로 필요할 때마다 생성하는 지연(lazy) 시퀀스 클래스.
+
+    그룹(분류) 별로 r 개씩 고른 조합의 곱집합을 generate_place_combinations 와 같은 순서로 표현하며,
+    전체 조합 리스트를 만들지 않고 개수 계산, 인덱스 접근(unranking), 슬라이싱, 샤딩을 지원합니다.
+    장소 정보(dict)는 records() 로 필요한 조합에 대해서만 만들고, 행 별로 한 번만 변환하여 재사용합니다.
+    """
+    def __init__(self, data: pd.DataFrame, groups: list, indices: range = None):
+        """
+        Args:
+            data (pd.DataFrame): 장소 데이터 (행 번호는 iloc 위치)
+            groups (list): (행 번호 배열, 선택할 장소 수) 튜플 리스트. 조합은 그룹 순서대로 행 번호를 이어붙인 tuple.
+            indices (range, optional): 이 시퀀스가 나타내는 전체 조합의 순번. Defaults to None (전체).
+        """
+        self.data = data
+        self.groups = [(np.asarray(rows, dtype=np.intp), r) for rows, r in groups]
+        self._group_sizes = [math.comb(len(rows), r) for rows, r in self.groups]
+        self._indices = indices if indices is not None else range(math.prod(self._group_sizes))
+        self._records = dict()  # {행 번호: 장소 정보(dict)}
+
+
+    def __len__(self):
+        return len(self._indices)
+
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            view = PlaceCombinations.__new__(PlaceCombinations)
+            view.data, view.groups, view._group_sizes = self.data, self.groups, self._group_sizes
+            view._indices = self._indices[index]
+            view._records = self._records  # 변환한 장소 정보는 원본과 공유
+            return view
+        return self._unrank(self._indices[index])
+
+
+    def __iter__(self):
+        if self._indices == range(math.prod(self._group_sizes)):
+            # 전체 순회는 itertools 로 순서대로 생성
+            group_combinations = [combinations(rows.tolist(), r) for rows, r in self.groups]
+            for parts in product(*group_combinations):
+                yield sum(parts, ())
+        else:
+            for rank in self._indices:
+                yield self._unrank(rank)
+
+
+    def _unrank(self, rank: int) -> tuple:
+        # 마지막 그룹이 가장 빠르게 바뀌는 혼합 진법으로 그룹 별 순번을 분리
+        parts = []
+        for (rows, r), size in zip(reversed(self.groups), reversed(self._group_sizes)):
+            rank, group_rank = divmod(rank, size)
+            parts.append(tuple(rows[i] for i in unrank_combination(group_rank, len(rows), r)))
+        return tuple(int(row) for part in reversed(parts) for row in part)
+
+
+    def shard(self, index: int, count: int) -> 'PlaceCombinations':
+        """count 개로 나눈 조합 중 index 번째 묶음 (index, index + count, ... 번째 조합)."""
+        if not 0 <= index < count:
+            raise ValueError(f"Shard index {index} out of range for {count} shards.")
+        return self[index::count]
+
+
+    def record(self, row: int) -> dict:
+        """행 번호의 장소 정보(dict). 한 번 변환한 장소 정보는 재사용합니다."""
+        place = self._records.get(row)
+        if place is None:
+            place = self._records.setdefault(row, self.data.iloc[[row]].to_dict('records')[0])
+        return place
+
+
+    def records(self, rows: tuple) -> list:
+        """행 번호 tuple 을 장소 정보(dict) 리스트로 변환하는 함수."""
+        return [self.record(row) for row in rows]
+
+
+    def rows(self) -> list:
+        """조합에 등장할 수 있는 서로 다른 행 번호 리스트 (그룹 순서)."""
+        return list(dict.fromkeys(row for rows, r in self.groups if r > 0 for row in rows.tolist()))
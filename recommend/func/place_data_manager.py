@@ -1,7 +1,11 @@
 import os 
 import sys 
+import numpy as np
 import pandas as pd
-from itertools import combinations
+
+from recommend.func.dataset_cache import read_cached_csv
+from recommend.func.spatial_index import SpatialIndex
+from recommend.func.place_combinations import PlaceCombinations
 
 class PlaceDataManager:
     """장소 데이터를 로드하고 조합을 생성하는 클래스"""
@@ -18,7 +22,8 @@ class PlaceDataManager:
             data_path = os.path.join(self.module_dir, '..', 'data', f'{file_name}')
 
         self.data_path = data_path
-        self.place_data = pd.read_csv(data_path)
+        # CSV 는 처음 한 번만 파싱하고 이후에는 Arrow 캐시를 메모리 맵으로 읽음
+        self.place_data = read_cached_csv(data_path)
         # 컬럼명 변경
         self.place_data.rename(
             columns={
@@ -28,26 +33,113 @@ class PlaceDataManager:
                 '위도': 'latitude', 
                 '경도':'longitude'
             }, inplace=True)
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """장소명/지역·분류 조회용 인덱스 생성 (로드 시 한 번)"""
+        self._scores = self.place_data['최종점수'].to_numpy(dtype=np.float64)
+
+        # (지역, 장소명) → 행 번호, 장소명 → 첫 번째 행 번호
+        self._row_by_region_name = dict()
+        self._row_by_name = dict()
+        for row, (region, name) in enumerate(zip(self.place_data['region'], self.place_data['name'])):
+            self._row_by_region_name.setdefault((region, name), row)
+            self._row_by_name.setdefault(name, row)
+
+        # (지역, 분류) → 최종점수 내림차순으로 정렬한 행 번호 배열 (점수가 같으면 원래 순서, nlargest 와 동일)
+        self._partitions = dict()
+        for key, rows in self.place_data.groupby(['region', 'category'], sort=False).indices.items():
+            self._partitions[key] = rows[np.argsort(-self._scores[rows], kind='stable')]
+
+        # 위도/경도 반경·최근접 검색 인덱스 (분류 별)
+        self.spatial_index = SpatialIndex.from_dataframe(self.place_data, category='category')
+
+    def _find_row(self, name: str, region: str = None):
+        if region:
+            return self._row_by_region_name.get((region, name))
+        return self._row_by_name.get(name)
     
-    def get_filtered_places(self, region: str, category: str, top_k: int = 5) -> pd.DataFrame:
-        """특정 지역과 카테고리에 맞는 상위 장소 필터링"""
-        filtered_data = self.place_data[(self.place_data['region'] == region) & (self.place_data['category'] == category)]
-        return filtered_data.nlargest(top_k, '최종점수')
+    def get_filtered_places(self, region: str, category: str, top_k: int = 5,
+                            center: tuple = None, radius_km: float = None) -> pd.DataFrame:
+        """특정 지역과 카테고리에 맞는 상위 장소 필터링 (정렬된 파티션에서 앞의 top_k 행만 선택, O(k))
+
+        Args:
+            region (str): 지역명
+            category (str): 분류
+            top_k (int, optional): 선택할 장소 수. Defaults to 5.
+            center (tuple, optional): (위도, 경도). radius_km 와 함께 지정하면 반경 내 장소만 선택. Defaults to None.
+            radius_km (float, optional): 검색 반경(km). Defaults to None.
+        """
+        return self.place_data.iloc[self._filtered_rows(region, category, top_k, center, radius_km)]
+
+    def get_nearby_places(self, latitude: float, longitude: float, radius_km: float = None, k: int = None,
+                          category: str = None) -> pd.DataFrame:
+        """좌표 주변의 장소를 가까운 순서로 반환 (반경 radius_km 이내 또는 최근접 k 개)
+
+        Args:
+            latitude (float): 중심 위도
+            longitude (float): 중심 경도
+            radius_km (float, optional): 검색 반경(km). Defaults to None.
+            k (int, optional): 최대 장소 수 (radius_km 가 없으면 최근접 k 개). Defaults to None.
+            category (str, optional): 분류 필터. Defaults to None (전체).
+
+        Returns:
+            pd.DataFrame: 'distance'(m) 컬럼이 추가된 장소 데이터
+        """
+        if radius_km is not None:
+            rows, distances = self.spatial_index.query_radius(latitude, longitude, radius_km * 1000, category)
+            if k is not None:
+                rows, distances = rows[:k], distances[:k]
+        else:
+            rows, distances = self.spatial_index.query_nearest(latitude, longitude, k or 1, category)
+        return self.place_data.iloc[rows].assign(distance=distances)
+
+    def get_place_score(self, name: str, region: str = None) -> float:
+        """장소의 최종점수 조회 (O(1))
+
+        Args:
+            name (str): 장소명
+            region (str, optional): 지역명. Defaults to None (지역 구분 없이 첫 번째 장소).
+
+        Raises:
+            KeyError: 장소가 없는 경우
+        """
+        row = self._find_row(name, region)
+        if row is None:
+            raise KeyError(f"Place '{name}' not found in region '{region}'.")
+        return float(self._scores[row])
     
-    def generate_place_combinations(self, region: str, n: int = 3, k: int = 5) -> list:
-        """카페와 식당에서 각각 1개, 나머지는 관광지에서 선택하여 조합 생성"""
+    def _filtered_rows(self, region: str, category: str, top_k: int,
+                       center: tuple = None, radius_km: float = None) -> np.ndarray:
+        rows = self._partitions.get((region, category), np.zeros(0, dtype=np.intp))
+        if center is not None and radius_km is not None:
+            nearby_rows, _ = self.spatial_index.query_radius(center[0], center[1], radius_km * 1000, category)
+            rows = rows[np.isin(rows, nearby_rows)]
+        return rows[:top_k]
 
-        # 장소 별 전체 정보를 넘기도록 코드 수정
-        cafe_list = self.get_filtered_places(region, '카페', k).to_dict("records")
-        res_list = self.get_filtered_places(region, '식당', k).to_dict("records")
-        land_list = self.get_filtered_places(region, '관광지', k).to_dict("records")
+    def get_place_combinations(self, region: str, n: int = 3, k: int = 5,
+                               center: tuple = None, radius_km: float = None) -> PlaceCombinations:
+        """generate_place_combinations 와 같은 조합을 행 번호 tuple 로 필요할 때 생성하는 지연 시퀀스 반환
+
+        Returns:
+            PlaceCombinations: len, 인덱스/슬라이스 접근, shard 를 지원. 장소 정보는 records() 로 변환.
+        """
+        if n < 2:
+            raise ValueError(f"Combination size must be at least 2 (cafe and restaurant), got {n}.")
+        groups = [
+            (self._filtered_rows(region, '카페', k, center, radius_km), 1),
+            (self._filtered_rows(region, '식당', k, center, radius_km), 1),
+            (self._filtered_rows(region, '관광지', k, center, radius_km), n - 2),
+        ]
+        return PlaceCombinations(self.place_data, groups)
 
-        combinations_list = []
-        for cafe in cafe_list:
-            for res in res_list:
-                for land_comb in combinations(land_list, n - 2):
-                    combinations_list.append([cafe, res] + list(land_comb))
-        return combinations_list
+    def generate_place_combinations(self, region: str, n: int = 3, k: int = 5,
+                                    center: tuple = None, radius_km: float = None) -> list:
+        """카페와 식당에서 각각 1개, 나머지는 관광지에서 선택하여 조합 생성 (center/radius_km 지정 시 반경 내 장소만)"""
+
+        # 장소 별 전체 정보를 넘기도록 코드 수정
+        place_combinations = self.get_place_combinations(region, n, k, center, radius_km)
+        return [place_combinations.records(rows) for rows in place_combinations]
 
     
     def search_poi(self, keyword: str, region: str):
@@ -58,24 +150,18 @@ class PlaceDataManager:
             region (str): 지역명
 
         Returns:
-            _type_: dict
+            dict: {'name', 'latitude', 'longitude'} (TMAPClient.get_poi 와 같은 형식). 장소가 없으면 빈 사전.
         """
+        row = self._find_row(keyword, region)
+        if row is None:
+            return {}
 
-        if region:
-            filtered_data = self.place_data[self.place_data['지역'] == region]
-        
-        try:
-            poi_dict = filtered_data[filtered_data['목적지명'] == keyword].to_dict(orient='records')[0]
-            keys_to_extract = ['목적지명', '위도', '경도']
-
-            new_poi_dict = {key: poi_dict[key] for key in keys_to_extract if key in poi_dict}
-
-            return new_poi_dict
-            
-        except IndexError:
-            raise ValueError(f"Keyword '{keyword}' not found in '목적지명'.")
-        except KeyError as e:
-            raise KeyError(f"Key '{e.args[0]}' not found in the data for keyword '{keyword}'.")
+        poi_dict = self.place_data.iloc[row]
+        return {
+            'name': poi_dict['name'],
+            'latitude': float(poi_dict['latitude']),
+            'longitude': float(poi_dict['longitude'])
+        }
 
 
     def __str__(self):
@@ -0,0 +1,116 @@
+import time
+import threading
+from collections import OrderedDict
+
+from recommend.func.sqlite_cache import SQLiteCache, make_cache_key
+
+DEFAULT_MAX_SIZE = 4096  # 메모리에 유지할 최대 POI 수
+DEFAULT_NEGATIVE_TTL = 60 * 60  # 검색 결과가 없는 키워드를 다시 조회하지 않는 시간(초), 1시간
+
+
+class PoiCache:
+    """POI(지오코딩) 결과를 저장하는 2단계 캐시 클래스.
+
+    메모리 LRU 캐시를 먼저 조회하고, 없으면 디스크 저장소(SQLiteCache)를 조회합니다.
+    디스크에서 찾은 결과는 메모리 캐시에 다시 올려 이후 조회 비용을 줄입니다.
+    검색 결과가 없는 키워드는 negative_ttl 동안 메모리에만 빈 사전으로 저장하여 반복 조회를 막습니다.
+    """
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, disk_cache: SQLiteCache = None,
+                 negative_ttl: float = DEFAULT_NEGATIVE_TTL, clock=time.monotonic):
+        """
+        Args:
+            max_size (int, optional): 메모리 LRU 캐시의 최대 크기. Defaults to 4096.
+            disk_cache (SQLiteCache, optional): POI 결과를 영구 저장할 디스크 캐시. Defaults to None.
+            negative_ttl (float, optional): 검색 결과가 없는 키워드를 캐시할 시간(초). 0 이면 캐시하지 않음. Defaults to 1시간.
+            clock (callable, optional): negative_ttl 계산에 사용할 시계. Defaults to time.monotonic.
+        """
+        self.max_size = max_size
+        self.disk_cache = disk_cache
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+
+        self.hits = 0
+        self.misses = 0
+
+        self._memory = OrderedDict()
+        self._missing = dict()  # {키: 만료 시각} 검색 결과가 없는 키워드
+        self._lock = threading.Lock()
+
+
+    @staticmethod
+    def make_key(keyword: str, region: str = None) -> str:
+        return make_cache_key({'keyword': keyword.strip(), 'region': region.strip() if region else None})
+
+
+    def get(self, keyword: str, region: str = None):
+        """캐시된 POI 정보의 복사본을 반환하는 함수. 캐시에 없으면 None, 검색 결과가 없는 키워드이면 빈 사전을 반환합니다."""
+        key = self.make_key(keyword, region)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return dict(self._memory[key])
+
+            expires_at = self._missing.get(key)
+            if expires_at is not None:
+                if self.clock() < expires_at:
+                    self.hits += 1
+                    return {}
+                del self._missing[key]
+
+        poi = self.disk_cache.get(key) if self.disk_cache is not None else None
+
+        with self._lock:
+            if poi is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._put(key, poi)
+        return dict(poi)
+
+
+    def set(self, keyword: str, region: str, poi: dict):
+        """POI 정보를 메모리와 디스크 캐시에 저장하는 함수."""
+        key = self.make_key(keyword, region)
+        with self._lock:
+            self._missing.pop(key, None)
+            self._put(key, dict(poi))
+        if self.disk_cache is not None:
+            self.disk_cache.set(key, poi)
+
+
+    def set_missing(self, keyword: str, region: str = None):
+        """검색 결과가 없는 키워드를 negative_ttl 동안 저장하는 함수 (디스크에는 저장하지 않음)."""
+        if not self.negative_ttl:
+            return
+        key = self.make_key(keyword, region)
+        with self._lock:
+            # 만료된 항목을 정리하여 크기를 제한
+            if len(self._missing) >= self.max_size:
+                now = self.clock()
+                self._missing = {k: expires_at for k, expires_at in self._missing.items() if expires_at > now}
+                while len(self._missing) >= self.max_size:
+                    self._missing.pop(next(iter(self._missing)))
+            self._missing[key] = self.clock() + self.negative_ttl
+
+
+    def _put(self, key: str, poi: dict):
+        self._memory[key] = poi
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+
+    def __len__(self):
+        return len(self._memory)
+
+
+    def stats(self) -> dict:
+        """캐시 적중/미스 통계를 반환하는 함수."""
+        requests = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hitRate': round(self.hits / requests, 4) if requests else 0.0,
+            'entries': len(self)
+        }
@@ -0,0 +1,212 @@
+import numpy as np
+
+DEFAULT_PRECISION = 6  # 인코딩 좌표 정밀도 (소수점 6자리 ≒ 0.1m)
+DEFAULT_LEVEL_ZOOMS = (9, 11, 13, 15)  # 단순화 단계를 미리 계산할 지도 zoom 레벨
+EARTH_CIRCUMFERENCE = 40075016.686  # 적도 둘레(m)
+TILE_SIZE = 256  # 지도 타일 크기(px)
+
+
+def to_coord_array(coordinates) -> np.ndarray:
+    """[경도, 위도] 좌표 리스트를 (N, 2) 크기의 연속(contiguous) float64 배열로 변환하는 함수.
+
+    Args:
+        coordinates (list | np.ndarray): [[경도, 위도], ...] 형식의 좌표
+
+    Returns:
+        np.ndarray: (N, 2) 크기의 [경도, 위도] 배열
+    """
+    coords = np.ascontiguousarray(coordinates, dtype=np.float64)
+    return coords.reshape(-1, 2)
+
+
+def encode_polyline(coords, precision: int = DEFAULT_PRECISION) -> str:
+    """좌표 배열을 Encoded Polyline 문자열로 변환하는 함수.
+
+    Google Encoded Polyline 알고리즘을 사용하며, 좌표는 입력 순서([경도, 위도])대로 인코딩합니다.
+
+    Args:
+        coords (np.ndarray | list): (N, 2) 크기의 좌표
+        precision (int, optional): 인코딩할 소수점 자릿수. Defaults to 6.
+
+    Returns:
+        str: 인코딩된 polyline 문자열
+    """
+    coords = to_coord_array(coords)
+    if len(coords) == 0:
+        return ''
+
+    # 정수화 → 이전 좌표와의 차분 → zigzag 부호 변환
+    scaled = np.round(coords * (10 ** precision)).astype(np.int64)
+    deltas = np.diff(scaled, axis=0, prepend=np.zeros((1, 2), dtype=np.int64)).ravel()
+    values = np.where(deltas < 0, ~(deltas << 1), deltas << 1)
+
+    chars = []
+    for value in values.tolist():
+        while value >= 0x20:
+            chars.append(chr((0x20 | (value & 0x1f)) + 63))
+            value >>= 5
+        chars.append(chr(value + 63))
+    return ''.join(chars)
+
+
+def decode_polyline(encoded: str, precision: int = DEFAULT_PRECISION) -> np.ndarray:
+    """Encoded Polyline 문자열을 (N, 2) 크기의 좌표 배열로 변환하는 함수.
+
+    Args:
+        encoded (str): encode_polyline 으로 인코딩한 문자열
+        precision (int, optional): 인코딩에 사용한 소수점 자릿수. Defaults to 6.
+
+    Returns:
+        np.ndarray: (N, 2) 크기의 좌표 배열
+    """
+    values = []
+    value = shift = 0
+    for char in encoded:
+        byte = ord(char) - 63
+        value |= (byte & 0x1f) << shift
+        shift += 5
+        if byte < 0x20:
+            values.append(~(value >> 1) if value & 1 else value >> 1)
+            value = shift = 0
+
+    deltas = np.array(values, dtype=np.int64).reshape(-1, 2)
+    return np.cumsum(deltas, axis=0) / (10 ** precision)
+
+
+def meters_per_pixel(zoom: int, latitude: float) -> float:
+    """웹 메르카토르 지도에서 주어진 zoom 레벨/위도의 픽셀 당 거리(m)를 계산하는 함수."""
+    return EARTH_CIRCUMFERENCE * np.cos(np.radians(latitude)) / (TILE_SIZE * 2 ** zoom)
+
+
+def _project(coords: np.ndarray) -> np.ndarray:
+    # 경로 범위가 좁으므로 중심 위도 기준 등거리 원통 투영으로 [경도, 위도] → 미터 좌표 근사
+    lat0 = np.radians(coords[:, 1].mean())
+    meters_per_degree = EARTH_CIRCUMFERENCE / 360
+    return np.column_stack((coords[:, 0] * meters_per_degree * np.cos(lat0), coords[:, 1] * meters_per_degree))
+
+
+def simplify_polyline(coords, tolerance: float) -> np.ndarray:
+    """Douglas–Peucker 알고리즘으로 polyline 의 점 수를 줄이는 함수.
+
+    Args:
+        coords (np.ndarray | list): (N, 2) 크기의 [경도, 위도] 좌표
+        tolerance (float): 허용 오차(m). 원래 선과의 거리가 이 값 이하인 점은 제거합니다.
+
+    Returns:
+        np.ndarray: 단순화된 (M, 2) 좌표 배열 (M <= N, 시작/끝점 유지)
+    """
+    coords = to_coord_array(coords)
+    if len(coords) <= 2 or tolerance <= 0:
+        return coords
+
+    points = _project(coords)
+    keep = np.zeros(len(coords), dtype=bool)
+    keep[0] = keep[-1] = True
+
+    # 재귀 대신 스택으로 구간을 분할
+    stack = [(0, len(coords) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        segment = points[end] - points[start]
+        offsets = points[start + 1:end] - points[start]
+        length = np.hypot(segment[0], segment[1])
+        if length == 0:
+            distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            distances = np.abs(segment[0] * offsets[:, 1] - segment[1] * offsets[:, 0]) / length
+
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            index = start + 1 + farthest
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+
+    return coords[keep]
+
+
+def build_polyline_levels(coords, zooms: tuple = DEFAULT_LEVEL_ZOOMS) -> dict:
+    """지도 zoom 레벨 별로 단순화한 polyline 을 미리 계산하는 함수.
+
+    각 zoom 레벨의 허용 오차는 해당 레벨의 픽셀 당 거리(1px)로, 화면상 차이가 보이지 않는 수준입니다.
+
+    Args:
+        coords (np.ndarray | list): (N, 2) 크기의 [경도, 위도] 좌표
+        zooms (tuple, optional): 단순화할 zoom 레벨. Defaults to (9, 11, 13, 15).
+
+    Returns:
+        dict: {zoom 레벨: 단순화된 좌표 배열}
+    """
+    coords = to_coord_array(coords)
+    if len(coords) == 0:
+        return {zoom: coords for zoom in zooms}
+
+    latitude = float(coords[:, 1].mean())
+    return {zoom: simplify_polyline(coords, meters_per_pixel(zoom, latitude)) for zoom in zooms}
+
+
+def select_polyline_level(levels: dict, zoom: int) -> np.ndarray:
+    """지도 zoom 레벨에 맞는 단순화 단계를 선택하는 함수.
+
+    zoom 이상인 레벨 중 가장 낮은(가장 많이 단순화된) 레벨을 선택하고, 없으면 가장 상세한 레벨을 반환합니다.
+    """
+    candidates = [level for level in levels if level >= zoom]
+    return levels[min(candidates) if candidates else max(levels)]
+
+
+def routes_to_json(routes: list, precision: int = DEFAULT_PRECISION) -> list:
+    """경로 리스트의 lineCoordinates 를 Encoded Polyline 문자열로 바꿔 JSON 저장/전송용으로 변환하는 함수.
+
+    Args:
+        routes (list): 경로 리스트 (lineCoordinates 는 좌표 배열 또는 리스트)
+        precision (int, optional): 인코딩할 소수점 자릿수. Defaults to 6.
+
+    Returns:
+        list: lineCoordinates 대신 lineCoordinatesEncoded(문자열), lineCoordinatesPrecision 을 가진 경로 리스트
+    """
+    json_routes = []
+    for route in routes:
+        json_route = {key: value for key, value in route.items() if key not in ('lineCoordinates', 'lineLevels')}
+        json_route['lineCoordinatesEncoded'] = encode_polyline(route.get('lineCoordinates', []), precision)
+        json_route['lineCoordinatesPrecision'] = precision
+        if 'lineLevels' in route:
+            json_route['lineLevelsEncoded'] = {
+                str(zoom): encode_polyline(level, precision) for zoom, level in route['lineLevels'].items()
+            }
+        json_routes.append(json_route)
+    return json_routes
+
+
+def routes_from_json(routes: list) -> list:
+    """JSON 으로 읽어온 경로 리스트의 좌표를 (N, 2) 배열로 변환하는 함수.
+
+    Encoded Polyline 형식(lineCoordinatesEncoded)과 기존 리스트 형식(lineCoordinates)을 모두 지원하며,
+    zoom 레벨 별 단순화 단계(lineLevels)가 없으면 새로 계산합니다.
+
+    Args:
+        routes (list): JSON 에서 읽어온 경로 리스트
+
+    Returns:
+        list: lineCoordinates 가 (N, 2) 배열이고 lineLevels 를 가진 경로 리스트
+    """
+    array_routes = []
+    for route in routes:
+        array_route = {key: value for key, value in route.items()
+                       if key not in ('lineCoordinatesEncoded', 'lineCoordinatesPrecision', 'lineLevelsEncoded')}
+        precision = route.get('lineCoordinatesPrecision', DEFAULT_PRECISION)
+        if 'lineCoordinatesEncoded' in route:
+            array_route['lineCoordinates'] = decode_polyline(route['lineCoordinatesEncoded'], precision)
+        else:
+            array_route['lineCoordinates'] = to_coord_array(route.get('lineCoordinates', []))
+
+        if 'lineLevelsEncoded' in route:
+            array_route['lineLevels'] = {
+                int(zoom): decode_polyline(level, precision) for zoom, level in route['lineLevelsEncoded'].items()
+            }
+        else:
+            array_route['lineLevels'] = build_polyline_levels(array_route['lineCoordinates'])
+        array_routes.append(array_route)
+    return array_routes
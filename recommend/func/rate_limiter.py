@@ -0,0 +1,215 @@
+import os
+import time
+import datetime
+import threading
+
+# SK Open API(TMAP) 엔드포인트 별 기본 호출 한도
+# - rate: 초당 호출 수, burst: 순간 최대 호출 수, daily_quota: 일일 호출 한도 (None 이면 제한 없음)
+# 일일 한도는 프로세스 안에서만 집계되어 실제 API 키의 한도와 일치하지 않으므로 기본값은 제한 없음
+DEFAULT_LIMITS = {
+    'poi': {'rate': 10, 'burst': 10, 'daily_quota': None},
+    'route': {'rate': 10, 'burst': 10, 'daily_quota': None},
+    'routeOptimization': {'rate': 2, 'burst': 2, 'daily_quota': None},
+}
+
+# 일일 한도 설정 환경 변수. 예: ODYSSEYES_TMAP_DAILY_QUOTAS="route=1000,routeOptimization=100"
+DAILY_QUOTAS_ENV = 'ODYSSEYES_TMAP_DAILY_QUOTAS'
+
+
+class QuotaExceededError(RuntimeError):
+    """엔드포인트의 일일 호출 한도를 모두 사용한 경우 발생하는 예외."""
+    def __init__(self, endpoint: str, limit: int):
+        super().__init__(f"Daily quota of {limit} calls exhausted for TMAP API endpoint '{endpoint}'.")
+        self.endpoint = endpoint
+        self.limit = limit
+
+
+def limits_from_env(limits: dict = None) -> dict:
+    """기본 한도에 환경 변수(ODYSSEYES_TMAP_DAILY_QUOTAS)의 일일 한도를 적용한 한도 설정을 반환하는 함수."""
+    limits = {endpoint: dict(limit) for endpoint, limit in (limits or DEFAULT_LIMITS).items()}
+    for item in filter(None, (part.strip() for part in os.getenv(DAILY_QUOTAS_ENV, '').split(','))):
+        endpoint, _, value = item.partition('=')
+        endpoint = endpoint.strip()
+        if endpoint not in limits or not value.strip():
+            raise ValueError(f"Invalid {DAILY_QUOTAS_ENV} entry '{item}'. Expected one of {list(limits)} as '<endpoint>=<calls>'.")
+        limits[endpoint]['daily_quota'] = int(value) if value.strip().lower() != 'none' else None
+    return limits
+
+
+class TokenBucket:
+    """토큰 버킷 방식의 호출 속도 제한 클래스.
+
+    초당 rate 개의 토큰이 최대 burst 개까지 채워지며, 호출 시 토큰이 없으면
+    다음 토큰이 채워질 때까지 대기합니다.
+    """
+    def __init__(self, rate: float, burst: int, clock=time.monotonic, sleep=time.sleep):
+        """
+        Args:
+            rate (float): 초당 토큰 충전 속도 (초당 허용 호출 수)
+            burst (int): 버킷 최대 크기 (순간 최대 호출 수)
+            clock (callable, optional): 현재 시각(초)을 반환하는 함수. Defaults to time.monotonic.
+            sleep (callable, optional): 대기 함수. Defaults to time.sleep.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = float(burst)
+        self.updated_at = clock()
+        self._lock = threading.Lock()
+
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+
+    def acquire(self, timeout: float = None) -> bool:
+        """토큰 하나를 획득하는 함수. 토큰이 없으면 충전될 때까지 대기합니다.
+
+        Args:
+            timeout (float, optional): 최대 대기 시간(초). None 이면 토큰을 얻을 때까지 대기. Defaults to None.
+
+        Returns:
+            bool: 토큰 획득 여부 (timeout 내에 획득하지 못한 경우 False)
+        """
+        deadline = None if timeout is None else self.clock() + timeout
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+
+            if deadline is not None:
+                if now + wait > deadline:
+                    return False
+            self.sleep(wait)
+
+
+class DailyQuota:
+    """엔드포인트의 일일 호출 한도 사용량을 집계하는 클래스. 날짜가 바뀌면 사용량을 초기화합니다."""
+    def __init__(self, limit: int, today=datetime.date.today):
+        """
+        Args:
+            limit (int): 일일 호출 한도. None 이면 제한 없음.
+            today (callable, optional): 오늘 날짜를 반환하는 함수. Defaults to datetime.date.today.
+        """
+        self.limit = limit
+        self.today = today
+        self.used = 0
+        self.day = today()
+        self._lock = threading.Lock()
+
+
+    def _reset_if_new_day(self):
+        today = self.today()
+        if today != self.day:
+            self.day = today
+            self.used = 0
+
+
+    def consume(self) -> bool:
+        """한도가 남아 있으면 사용량을 1 증가시키고 True 를 반환하는 함수."""
+        with self._lock:
+            self._reset_if_new_day()
+            if self.limit is not None and self.used >= self.limit:
+                return False
+            self.used += 1
+            return True
+
+
+    def refund(self):
+        """consume 으로 차감한 사용량을 되돌리는 함수 (실제로 호출하지 않은 경우)."""
+        with self._lock:
+            self.used = max(0, self.used - 1)
+
+
+    def remaining(self):
+        with self._lock:
+            self._reset_if_new_day()
+            return None if self.limit is None else self.limit - self.used
+
+
+    def usage(self) -> dict:
+        """오늘 사용량, 한도, 남은 한도를 한 번에 반환하는 함수."""
+        with self._lock:
+            self._reset_if_new_day()
+            return {'used': self.used, 'limit': self.limit,
+                    'remaining': None if self.limit is None else self.limit - self.used}
+
+
+class RateLimiter:
+    """엔드포인트(poi, route, routeOptimization) 별 호출 속도 제한과 일일 한도를 관리하는 클래스."""
+    def __init__(self, limits: dict = None):
+        """
+        Args:
+            limits (dict, optional): {엔드포인트: {'rate', 'burst', 'daily_quota'}} 형식의 한도 설정.
+                Defaults to None (DEFAULT_LIMITS 에 ODYSSEYES_TMAP_DAILY_QUOTAS 환경 변수를 적용).
+        """
+        limits = limits if limits is not None else limits_from_env()
+        self.buckets = {endpoint: TokenBucket(limit['rate'], limit['burst']) for endpoint, limit in limits.items()}
+        self.quotas = {endpoint: DailyQuota(limit.get('daily_quota')) for endpoint, limit in limits.items()}
+
+
+    def acquire(self, endpoint: str, timeout: float = None) -> bool:
+        """엔드포인트 호출 전에 일일 한도를 차감하고 호출 속도 제한에 맞춰 대기하는 함수.
+
+        Args:
+            endpoint (str): 엔드포인트명 ('poi', 'route', 'routeOptimization')
+            timeout (float, optional): 속도 제한으로 대기할 최대 시간(초). Defaults to None.
+
+        Returns:
+            bool: 호출 가능 여부. timeout 내에 토큰을 얻지 못하면 False.
+
+        Raises:
+            QuotaExceededError: 일일 한도를 모두 사용한 경우
+        """
+        if endpoint not in self.buckets:
+            return True
+
+        if not self.quotas[endpoint].consume():
+            raise QuotaExceededError(endpoint, self.quotas[endpoint].limit)
+
+        if not self.buckets[endpoint].acquire(timeout=timeout):
+            # 호출하지 않았으므로 차감한 한도를 되돌림
+            self.quotas[endpoint].refund()
+            print(f"Error: Rate limit wait timed out for TMAP API endpoint '{endpoint}'.")
+            return False
+
+        return True
+
+
+    def remaining(self, endpoint: str = None):
+        """엔드포인트 별 남은 일일 호출 한도를 반환하는 함수.
+
+        Args:
+            endpoint (str, optional): 엔드포인트명. None 이면 전체 엔드포인트의 {엔드포인트: 남은 한도} 를 반환.
+
+        Returns:
+            int | dict: 남은 일일 호출 한도
+        """
+        if endpoint is not None:
+            return self.quotas[endpoint].remaining()
+        return {endpoint: quota.remaining() for endpoint, quota in self.quotas.items()}
+
+
+    def usage(self) -> dict:
+        """엔드포인트 별 오늘 사용량과 한도를 반환하는 함수."""
+        return {endpoint: quota.usage() for endpoint, quota in self.quotas.items()}
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """프로세스 전역에서 공유하는 RateLimiter 인스턴스를 반환하는 함수."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter()
+    return _rate_limiter
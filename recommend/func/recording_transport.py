@@ -0,0 +1,165 @@
+import os
+import json
+import time
+import hashlib
+import threading
+import requests
+from urllib.parse import urlsplit, parse_qsl
+
+from recommend.func.http_transport import HTTPTransport
+
+DEFAULT_RECORD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'recordings')
+
+# 기록 파일과 요청 식별에서 제외하는 인증 관련 쿼리 파라미터
+SECRET_QUERY_PARAMS = ('appKey', 'ServiceKey', 'serviceKey')
+
+
+def _parse_body(body):
+    """요청 본문(bytes/str/dict)을 비교 가능한 JSON 객체로 변환하는 함수."""
+    if body is None or body == b'' or body == '':
+        return None
+    if isinstance(body, (bytes, bytearray)):
+        body = body.decode('utf-8')
+    if isinstance(body, str):
+        try:
+            return json.loads(body)
+        except json.JSONDecodeError:
+            return body
+    return body
+
+
+def request_fingerprint(method: str, url: str, body=None) -> dict:
+    """요청을 식별하는 정보(method, path, 정렬된 쿼리, 본문)를 반환하는 함수.
+
+    scheme/host 와 인증 키는 제외하므로, 실제 API 로 기록한 요청과
+    로컬 stand-in 서버로 들어온 요청이 같은 식별 정보를 가집니다.
+
+    Args:
+        method (str): HTTP 메서드
+        url (str): 쿼리 파라미터가 포함된 전체 URL
+        body (optional): 요청 본문 (bytes, str 또는 dict)
+
+    Returns:
+        dict: {'method', 'path', 'query', 'body', 'key'} 형식의 식별 정보
+    """
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in SECRET_QUERY_PARAMS)
+    fingerprint = {
+        'method': method.upper(),
+        'path': parts.path,
+        'query': [list(item) for item in query],
+        'body': _parse_body(body)
+    }
+    serialized = json.dumps(fingerprint, sort_keys=True, ensure_ascii=False)
+    fingerprint['key'] = hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+    return fingerprint
+
+
+def _prepare_fingerprint(method: str, url: str, kwargs: dict) -> dict:
+    # params/json 인자를 실제 전송되는 URL/본문 형태로 변환한 뒤 식별 정보를 생성
+    prepared = requests.Request(method, url, params=kwargs.get('params'),
+                                json=kwargs.get('json'), data=kwargs.get('data')).prepare()
+    return request_fingerprint(method, prepared.url, prepared.body)
+
+
+def load_recording(record_dir: str, key: str):
+    """기록 디렉터리에서 식별 키에 해당하는 기록을 읽어오는 함수. 없으면 None 을 반환합니다."""
+    path = os.path.join(record_dir, f'{key}.json')
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def build_response(recording: dict, url: str = None) -> requests.Response:
+    """기록된 응답 정보로 requests.Response 객체를 생성하는 함수."""
+    response = requests.Response()
+    response.status_code = recording['status_code']
+    response._content = recording['body'].encode('utf-8')
+    response.headers['Content-Type'] = recording.get('content_type', 'application/json')
+    response.encoding = 'utf-8'
+    response.url = url
+    return response
+
+
+class RecordingTransport(HTTPTransport):
+    """실제 API 를 호출하면서 모든 요청/응답을 디스크에 기록하는 transport 클래스.
+
+    요청 식별 키(request_fingerprint)마다 하나의 JSON 파일로 저장하며, 인증 키는 기록하지 않습니다.
+    """
+    def __init__(self, record_dir: str = DEFAULT_RECORD_DIR, **kwargs):
+        """
+        Args:
+            record_dir (str, optional): 기록 파일을 저장할 디렉터리. Defaults to recommend/data/recordings.
+            **kwargs: HTTPTransport 생성 인자
+        """
+        super().__init__(**kwargs)
+        self.record_dir = record_dir
+        os.makedirs(record_dir, exist_ok=True)
+
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        response = super().request(method, url, **kwargs)
+
+        fingerprint = _prepare_fingerprint(method, url, kwargs)
+        recording = {
+            'request': {k: v for k, v in fingerprint.items() if k != 'key'},
+            'status_code': response.status_code,
+            'content_type': response.headers.get('Content-Type', 'application/json'),
+            'elapsed': response.elapsed.total_seconds(),
+            'body': response.text
+        }
+        path = os.path.join(self.record_dir, f"{fingerprint['key']}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(recording, f, ensure_ascii=False, indent=4)
+
+        return response
+
+
+class ReplayTransport(HTTPTransport):
+    """RecordingTransport 로 기록한 응답을 네트워크 호출 없이 재생하는 transport 클래스.
+
+    기록이 없는 요청에는 404 응답을 반환하며, 재생/누락 건수를 집계합니다.
+    """
+    def __init__(self, record_dir: str = DEFAULT_RECORD_DIR, latency: float = 0.0, **kwargs):
+        """
+        Args:
+            record_dir (str, optional): 기록 파일 디렉터리. Defaults to recommend/data/recordings.
+            latency (float, optional): 응답마다 추가할 지연 시간(초). Defaults to 0.0.
+            **kwargs: HTTPTransport 생성 인자
+        """
+        super().__init__(**kwargs)
+        self.record_dir = record_dir
+        self.latency = latency
+
+        self.replayed = 0
+        self.missing = 0
+        self._recordings = dict()
+        self._lock = threading.Lock()
+
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        fingerprint = _prepare_fingerprint(method, url, kwargs)
+        key = fingerprint['key']
+
+        with self._lock:
+            if key not in self._recordings:
+                self._recordings[key] = load_recording(self.record_dir, key)
+            recording = self._recordings[key]
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if recording is None:
+            print(f"Error: No recording for {fingerprint['method']} {fingerprint['path']} ({key}).")
+            with self._lock:
+                self.missing += 1
+            return build_response({'status_code': 404, 'body': '{}'}, url)
+
+        with self._lock:
+            self.replayed += 1
+        return build_response(recording, url)
+
+
+    def stats(self) -> dict:
+        return {'replayed': self.replayed, 'missing': self.missing}
@@ -0,0 +1,139 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_MAX_WORKERS = 8  # 동시에 요청할 구간(leg) 수
+
+
+class RouteMatrixBuilder:
+    """장소 리스트의 모든 (출발지, 도착지) 쌍에 대한 경로 데이터를 병렬로 수집하는 클래스.
+
+    구간 별 경로 요청은 서로 독립적이므로 스레드 풀에서 동시에 요청하고,
+    결과는 직렬 반복문과 동일한 (i, j) 순서의 dict 로 반환합니다.
+    호스트 당 동시 요청 수는 HTTPTransport 의 max_in_flight_per_host 로 제한됩니다.
+    """
+    def __init__(self, fetch_route, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Args:
+            fetch_route (callable): (start, end) 를 받아 경로 데이터를 반환하는 함수.
+                예: RouteOptimizer.fetch_route_data
+            max_workers (int, optional): 스레드 풀 크기. Defaults to 8.
+        """
+        self.fetch_route = fetch_route
+        self.max_workers = max_workers
+
+
+    def build(self, places: list) -> dict:
+        """장소 리스트의 모든 쌍에 대한 경로 데이터를 수집하는 함수.
+
+        Args:
+            places (list): 장소 정보(dict) 리스트. 각 장소는 'name', 'latitude', 'longitude' 키를 포함.
+
+        Returns:
+            dict: {(i, j): 경로 데이터} 형식의 경로 행렬. 키 순서는 (0, 1), (0, 2), ..., (n-1, n-2) 로 고정.
+        """
+        pairs = [(i, j) for i in range(len(places)) for j in range(len(places)) if i != j]
+        legs = self.fetch_legs([(places[i], places[j]) for i, j in pairs])
+        return dict(zip(pairs, legs))
+
+
+    def fetch_legs(self, legs: list) -> list:
+        """(출발지, 도착지) 구간 리스트의 경로 데이터를 병렬로 수집하는 함수.
+
+        Args:
+            legs (list): (출발지 장소 정보, 도착지 장소 정보) 튜플 리스트
+
+        Returns:
+            list: 입력 순서와 같은 순서의 경로 데이터 리스트
+        """
+        if self.max_workers <= 1 or len(legs) <= 1:
+            return [self.fetch_route(src, dst) for src, dst in legs]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(legs))) as executor:
+            futures = [executor.submit(self.fetch_route, src, dst) for src, dst in legs]
+            # 제출 순서대로 결과를 모아 결정적(deterministic)인 순서를 유지
+            return [future.result() for future in futures]
+
+
+def place_key(place: dict) -> tuple:
+    """장소를 식별하는 키 (장소명, 위도, 경도) 를 반환하는 함수."""
+    return (place['name'], place.get('latitude'), place.get('longitude'))
+
+
+def _leg_view(route: dict) -> dict:
+    # 조합 별 정규화 점수(scaledProperties)를 기록할 첫 번째 feature 의 properties 만 복사하고
+    # 나머지 경로 데이터(좌표 등)는 지역 행렬과 공유
+    if not route.get('features'):
+        return route
+    first_feature = route['features'][0]
+    view_first_feature = dict(first_feature, properties=dict(first_feature['properties']))
+    return dict(route, features=[view_first_feature] + route['features'][1:])
+
+
+class RegionRouteMatrix:
+    """한 지역의 장소 조합 전체가 공유하는 구간(leg) 경로 행렬 클래스.
+
+    장소 조합들은 같은 출발지/축제 장소/카페/식당을 공유하므로, 조합 별로 행렬을 새로 만드는 대신
+    서로 다른 (출발지, 도착지) 구간을 한 번씩만 요청하여 저장하고 조합 별 부분 행렬을 만들어 제공합니다.
+    여러 스레드에서 조합을 동시에 처리할 수 있도록 구간 저장소 접근은 lock 으로 보호하며, 구간 요청은 lock 밖에서 합니다.
+    """
+    def __init__(self, builder: RouteMatrixBuilder):
+        """
+        Args:
+            builder (RouteMatrixBuilder): 구간 경로 데이터를 병렬로 수집할 행렬 빌더
+        """
+        self.builder = builder
+        self.legs = dict()  # {(출발지 키, 도착지 키): 경로 데이터}
+        self._lock = threading.Lock()
+
+
+    def prefetch(self, place_lists: list):
+        """장소 조합 리스트에 필요한 구간 중 아직 없는 구간만 한 번에 병렬로 수집하는 함수.
+
+        Args:
+            place_lists (list): 장소 정보(dict) 리스트의 리스트 (출발지/축제 장소 포함)
+        """
+        missing = dict()
+        with self._lock:
+            for places in place_lists:
+                keys = [place_key(place) for place in places]
+                for i, src in enumerate(places):
+                    for j, dst in enumerate(places):
+                        leg_key = (keys[i], keys[j])
+                        if i != j and leg_key not in self.legs and leg_key not in missing:
+                            missing[leg_key] = (src, dst)
+
+        # 다른 스레드가 같은 구간을 동시에 요청하더라도 TMAPClient 의 single-flight/경로 캐시로 합쳐짐
+        if missing:
+            routes = self.builder.fetch_legs(list(missing.values()))
+            with self._lock:
+                for leg_key, route in zip(missing.keys(), routes):
+                    # 실패한 구간({})은 저장하지 않아 다음 조합에서 다시 요청
+                    if route.get('features'):
+                        self.legs.setdefault(leg_key, route)
+
+
+    def submatrix(self, places: list) -> dict:
+        """장소 조합의 {(i, j): 경로 데이터} 행렬을 반환하는 함수. 없는 구간은 먼저 수집합니다.
+
+        반환된 경로 데이터의 첫 번째 feature properties 는 조합마다 별도로 복사되므로,
+        get_scaled_properties 로 조합 별 정규화 점수를 기록해도 다른 조합에 영향을 주지 않습니다.
+        경로 요청에 실패한 구간은 빈 dict({}) 로 반환됩니다.
+
+        Args:
+            places (list): 장소 정보(dict) 리스트
+
+        Returns:
+            dict: {(i, j): 경로 데이터} 형식의 경로 행렬
+        """
+        self.prefetch([places])
+        keys = [place_key(place) for place in places]
+        with self._lock:
+            return {
+                (i, j): _leg_view(self.legs.get((keys[i], keys[j]), {}))
+                for i in range(len(places)) for j in range(len(places)) if i != j
+            }
+
+
+    def __len__(self):
+        with self._lock:
+            return len(self.legs)
@@ -1,46 +1,58 @@
-from itertools import permutations
-import re
-import pandas as pd
-from collections import OrderedDict, defaultdict
-from sklearn.preprocessing import MinMaxScaler
+import threading
+import numpy as np
+from collections import OrderedDict
 
 from recommend.func.tmap_client import TMAPClient  # new 
 from recommend.func.place_data_manager import PlaceDataManager  # new
+from recommend.func.route_matrix import RouteMatrixBuilder, RegionRouteMatrix, DEFAULT_MAX_WORKERS
+from recommend.func.polyline import build_polyline_levels
+from recommend.func.normalization import min_max_normalize
+from recommend.func.pareto import select_pareto_routes
+from recommend.func.route_parser import parse_route_response, parse_optimized_route_response
+from recommend.func.tour_solver import score_tours
+from recommend.func.via_point_optimizer import LocalRouteOptimizer
+from recommend.func.combination_search import CombinationSearch, place_coords, DEFAULT_TIME_WEIGHT
+from recommend.func.combination_executor import CombinationExecutor, DEFAULT_COMBINATION_WORKERS
+from recommend.func.itinerary_search import ItinerarySearch, estimate_travel_times, DEFAULT_TIME_LIMIT
 
 
 class RouteOptimizer:
     """경로 최적화를 수행하고 상위 경로를 반환하는 클래스"""
-    def __init__(self, tmap_client: TMAPClient, place_data_manager: PlaceDataManager):
+    def __init__(self, tmap_client: TMAPClient, place_data_manager: PlaceDataManager, 
+                 max_workers: int = DEFAULT_MAX_WORKERS, solver: str = 'held_karp',
+                 combination_workers: int = DEFAULT_COMBINATION_WORKERS, process_workers: int = None):
         self.tmap_client = tmap_client
         self.place_data_manager = place_data_manager
+        # 순환 경로 탐색 방법 ('brute_force', 'held_karp', 'branch_and_bound')
+        self.solver = solver
+        # 장소 쌍 별 경로 데이터를 병렬로 수집하는 행렬 빌더
+        self.max_workers = max_workers
+        self.route_matrix_builder = RouteMatrixBuilder(self.fetch_route_data, max_workers=max_workers)
+        # 장소 조합 단위 병렬 실행기 (조합 처리는 스레드 풀, 장소 수가 많은 순환 경로 탐색은 프로세스 풀)
+        self.combination_executor = CombinationExecutor(max_workers=combination_workers, process_workers=process_workers)
 
     def calculate_place_score(self, place_list: list, region: str) -> float:
         """경로 점수 계산"""
-        scores = [float(self.place_data_manager.place_data[(self.place_data_manager.place_data['지역'] == region) &
-                                                           (self.place_data_manager.place_data['목적지명'] == place)]['최종점수'].values[0]) 
-                  for place in place_list]
-        return sum(scores)
+        return sum(self.place_data_manager.get_place_score(place, region) for place in place_list)
 
     def get_scaled_scores(self, route_list: list) -> list:
         """경로 리스트의 점수를 스케일링하여 총 점수 계산"""
-        properties_data = [route['properties'] for route in route_list]
-        scaler = MinMaxScaler()
-        scaled_properties = scaler.fit_transform(pd.DataFrame(properties_data))
-        scaled_scores = []
-        for i in range(len(scaled_properties[0])):
-            scaled_score = []
-            for j in range(len(scaled_properties)):
-                scaled_score.append(round(float(scaled_properties[j][i]), 3))
-            scaled_scores.append(scaled_score)
-                
+        # 열: 거리, 소요 시간, 요금, 장소 점수
+        properties_data = [
+            [route['properties']['totalDistance'], route['properties']['totalTime'],
+             route['properties']['totalFare'], route['properties']['routeScore']]
+            for route in route_list
+        ]
+        scaled_scores = min_max_normalize(properties_data).tolist()
+
         scaledProperties = []
         totalRouteScores = []
-        for i in range(len(scaled_scores[0])):
+        for scaled_distance, scaled_time, scaled_fare, scaled_place_score in scaled_scores:
             scaledProperty = {
-                'scaledDistance': round(1 - scaled_scores[0][i], 2),
-                'scaledTime': round(1 - scaled_scores[1][i], 2),
-                'scaledFare': round(1 - scaled_scores[2][i], 2),
-                'scaledPlaceScore': scaled_scores[3][i],
+                'scaledDistance': round(1 - round(scaled_distance, 3), 2),
+                'scaledTime': round(1 - round(scaled_time, 3), 2),
+                'scaledFare': round(1 - round(scaled_fare, 3), 2),
+                'scaledPlaceScore': round(scaled_place_score, 3),
             }
             
             scaledProperties.append(scaledProperty)
@@ -56,7 +68,8 @@ class RouteOptimizer:
                 ('totalRouteScore', totalRouteScores[i]),
                 ('points', route.get('points')),
                 ('paths', route.get('paths')),
-                ('lineCoordinates', route.get('lineCoordinates'))
+                ('lineCoordinates', route.get('lineCoordinates')),
+                ('lineLevels', route.get('lineLevels'))
             ])
             route_list[i] = ordered_route
         
@@ -95,27 +108,27 @@ class RouteOptimizer:
         """
         # 모든 경로의 'totalDistance', 'totalTime', 'totalFare'만 추출
         selected_properties_data = [
-            {
-                'totalDistance': route['features'][0]['properties']['totalDistance'],
-                'totalTime': route['features'][0]['properties']['totalTime'],
-                'totalFare': route['features'][0]['properties']['totalFare']
-            }
+            [
+                route['features'][0]['properties']['totalDistance'],
+                route['features'][0]['properties']['totalTime'],
+                route['features'][0]['properties']['totalFare']
+            ]
             for route in routes.values()
         ]
 
-        # DataFrame 변환 및 정규화
-        scaler = MinMaxScaler()
-        scaled_data = scaler.fit_transform(pd.DataFrame(selected_properties_data))
+        # 정규화 후 값이 작을수록 높은 점수가 되도록 반전
+        inverted = 1 - min_max_normalize(selected_properties_data)
+        dtf_scores = inverted.sum(axis=1)
 
         # 정규화된 데이터를 바탕으로 scaledProperties 생성
         scaled_properties = [
             {
-                'scaledDistance': round(1 - scaled[0], 2),
-                'scaledTime': round(1 - scaled[1], 2),
-                'scaledFare': round(1 - scaled[2], 2),
-                'scaledDTFScore': round(1 - scaled[0] + 1 - scaled[1] + 1 - scaled[2], 2)
+                'scaledDistance': round(distance, 2),
+                'scaledTime': round(time, 2),
+                'scaledFare': round(fare, 2),
+                'scaledDTFScore': round(dtf_score, 2)
             }
-            for scaled in scaled_data
+            for (distance, time, fare), dtf_score in zip(inverted.tolist(), dtf_scores.tolist())
         ]
 
         # 원본 데이터에 정규화된 점수 추가
@@ -125,48 +138,58 @@ class RouteOptimizer:
         return routes
     
     
-    def calculate_route_score(self, route, routes_data, weight_distance=0.4, weight_time=0.4, weight_fare=0.2):
-        # print(route)
-        score = 0
-        for i in range(len(route) - 1):
-            route_info = routes_data[(route[i], route[i + 1])]
-            # print(0000)
-            # print(type(route_info))
-            # route_info = get_scaled_properties(route_info)
-            route_features = route_info['features'][0]
-            # print_json(route_info)0
-            route_properties = route_features['properties']
-            route_scaled_properties = route_properties['scaledProperties']
-            # print(route_info_scaled_properties)
-            score += route_scaled_properties['scaledDTFScore']
-        return score
+    def calculate_route_score(self, route, scores: np.ndarray) -> float:
+        """경로(장소 인덱스 순서)의 구간 별 정규화 점수 합을 계산하는 함수.
+
+        Args:
+            route (list): 장소 인덱스 순서
+            scores (np.ndarray): build_score_matrix 로 만든 N×N 점수 행렬
+
+        Returns:
+            float: 경로 점수
+        """
+        return float(score_tours(scores, [route])[0])
     
+    def build_score_matrix(self, num_places: int, routes_data: dict) -> np.ndarray:
+        """경로 행렬의 구간 별 정규화 점수(scaledDTFScore)를 N×N 점수 행렬로 한 번에 변환하는 함수.
+
+        경로 탐색(solver)과 경로 점수 계산은 이 행렬만 사용하므로 탐색 중에는 dict 조회가 없습니다.
+
+        Args:
+            num_places (int): 장소 수 (N)
+            routes_data (dict): {(i, j): 경로 데이터} 형식의 정규화 점수가 추가된 경로 행렬
+
+        Returns:
+            np.ndarray: scores[i, j] 가 i → j 구간 점수인 N×N 배열 (대각 원소는 0)
+        """
+        scores = np.zeros((num_places, num_places), dtype=np.float64)
+        pairs = np.array(list(routes_data.keys()), dtype=np.intp).reshape(-1, 2)
+        scores[pairs[:, 0], pairs[:, 1]] = [
+            route_info['features'][0]['properties']['scaledProperties']['scaledDTFScore']
+            for route_info in routes_data.values()
+        ]
+        return scores
+
     # 출발지에서 시작하여 모든 장소를 방문 후 출발지로 돌아오는 최적 경로 탐색
     def find_optimal_route(self, places, routes_data):
-        num_places = len(places)
-        all_routes = list(permutations(range(1, num_places)))  # 출발지를 제외한 경유지들의 순열 생성
-        best_score = 0
-        best_route = None
-
-        print(f'출발지 제외 경유지 순열: {list(all_routes)}')   
-        # print(f"routes_data:")
-        # print_json(routes_data)
-
-        for route in all_routes:
-            # print(route)
-            route = (0,) + route + (0,)  # 출발지(0)를 추가해 순환 경로 형성
-            # print(route)
-            score = round(self.calculate_route_score(route, routes_data), 4)
-            print(f'{route}: {score}')
-            if score > best_score:
-                best_score = score
-                best_route = route
-                
-        return best_route, best_score
+        """출발지(0)에서 시작하여 모든 장소를 방문 후 출발지로 돌아오는 점수 합이 가장 높은 경로를 찾는 함수.
+
+        Args:
+            places (list): 장소 정보 리스트 (0번은 출발지)
+            routes_data (dict): {(i, j): 경로 데이터} 형식의 정규화 점수가 추가된 경로 행렬
+
+        Returns:
+            tuple: (최적 경로 (0, ..., 0), 최적 점수)
+        """
+        scores = self.build_score_matrix(len(places), routes_data)
+        best_route, best_score = self.combination_executor.solve_tour(scores, method=self.solver)
+        return best_route, round(best_score, 4)
 
     
     def get_top_k_routes_tsp(self, start_place: str, end_place: str, region: str, festival_place: str, 
-                         comb: int = 2, comb_k: int = 5, top_k: int = 3) -> list:
+                         comb: int = 2, comb_k: int = 5, top_k: int = 3,
+                         prune_combinations: bool = False, time_weight: float = DEFAULT_TIME_WEIGHT,
+                         cancel_event: threading.Event = None) -> list:
         """_summary_
 
         Args:
@@ -176,108 +199,144 @@ class RouteOptimizer:
             festival_place (str): _description_
             comb (int, optional): _description_. Defaults to 2.
             comb_k (int, optional): _description_. Defaults to 5.
-            top_k (int, optional): _description_. Defaults to 3.
+            top_k (int, optional): _description_. None 이면 모든 조합의 경로 (Pareto 선택용). Defaults to 3.
+            prune_combinations (bool, optional): True 이면 모든 조합의 경로를 요청하지 않고 CombinationSearch 로 
+                '장소 점수 합 - time_weight × 이동 시간(시간)' (searchScore) 상위 top_k 조합만 찾습니다. 
+                기본 모드의 routeScore 와는 다른 목적 함수이므로 반환되는 경로와 순서가 기본 모드와 다를 수 있으며, 
+                결과는 searchScore 내림차순입니다 (생략한 조합이 top_k 에 들 수 없다는 보장도 searchScore 기준). 
+                Defaults to False.
+            time_weight (float, optional): prune_combinations 사용 시 이동 시간 1시간 당 차감할 장소 점수. Defaults to 1.0.
+            cancel_event (threading.Event, optional): 설정되면 남은 조합을 처리하지 않고 
+                그때까지 완료된 조합의 상위 경로를 반환. Defaults to None.
 
         Returns:
             list: _description_
         """
-        place_combinations = self.place_data_manager.generate_place_combinations(region, comb, comb_k)
-        
-        # 각 장소 조합 별 최적 경로를 담는 리스트
-        best_routes_for_each_place_comb = []
+        if prune_combinations:
+            place_combinations = self.place_data_manager.get_place_combinations(region, comb, comb_k)
+            region_matrix = RegionRouteMatrix(self.route_matrix_builder)
+
+            # 상한이 높은 조합부터 필요한 구간만 요청하여 평가
+            search = CombinationSearch(top_k, time_weight=time_weight)
+            # 모든 조합이 함께 방문하는 출발지/축제 장소도 상한 계산에 포함 (구간 요청과 같은 POI 사용)
+            anchors = place_coords([self.tmap_client.get_poi(start_place), self.tmap_client.get_poi(festival_place)])
+
+            def evaluate(rows):
+                place_combination = place_combinations.records(rows)
+                places = self.add_start_and_festival_places(places=place_combination, start=start_place, festival_place=festival_place)
+                route = self.build_tsp_route(places, region_matrix, region)
+                if route is None:
+                    return None
+                value = search.combination_value(place_combination, route['properties']['totalTime'])
+                route['properties']['searchScore'] = round(value, 4)
+                return value, route
+
+            return [route for _, _, route in search.search(place_combinations, evaluate, anchors,
+                                                           to_places=place_combinations.records,
+                                                           executor=self.combination_executor, cancel_event=cancel_event)]
+
+        top_routes = []
+        for top_routes in self.iter_top_k_routes_tsp(start_place, end_place, region, festival_place, comb, comb_k, top_k,
+                                                     prefetch=True, cancel_event=cancel_event):
+            pass
+        return top_routes
+
+
+    def iter_top_k_routes_tsp(self, start_place: str, end_place: str, region: str, festival_place: str,
+                              comb: int = 2, comb_k: int = 5, top_k: int = 3, prefetch: bool = False,
+                              cancel_event: threading.Event = None):
+        """get_top_k_routes_tsp 의 스트리밍 버전. 장소 조합의 경로가 완료되어 상위 경로가 바뀔 때마다 현재 상위 경로를 생성.
 
-        # 장소 조합 별 경유지 순서 최적화 진행 
-        for p, places in enumerate(place_combinations):
-            places = self.add_start_and_festival_places(places=places, start=start_place, festival_place=festival_place)
-            
+        Args:
+            start_place (str): 출발지
+            end_place (str): 도착지 (unused @241113)
+            region (str): 지역명
+            festival_place (str): 축제 장소
+            comb (int, optional): 조합 당 장소 수. Defaults to 2.
+            comb_k (int, optional): 분류 별 후보 장소 수. Defaults to 5.
+            top_k (int, optional): 유지할 경로 수. None 이면 모든 조합의 경로. Defaults to 3.
+            prefetch (bool, optional): True 이면 모든 조합의 구간을 먼저 한 번에 수집 (전체 완료 시간 단축). 
+                False 이면 조합마다 필요한 구간을 수집하여 첫 결과를 빨리 반환. Defaults to False.
+            cancel_event (threading.Event, optional): 설정되면 남은 조합을 처리하지 않고 종료. Defaults to None.
+
+        Yields:
+            list: routeScore 내림차순으로 정렬한 현재 상위 경로 리스트 (최대 top_k 개)
+        """
+        # 조합은 행 번호 tuple 로만 다루고, 장소 정보 리스트는 조합을 처리할 때 만듦
+        place_combinations = self.place_data_manager.get_place_combinations(region, comb, comb_k)
 
-            routes_for_place_comb = dict()
+        def to_place_list(rows):
+            return self.add_start_and_festival_places(
+                places=place_combinations.records(rows), start=start_place, festival_place=festival_place
+            )
 
-            for i, src in enumerate(places):
-                for j, dst in enumerate(places):
-                    if i != j:
-                        routes_for_place_comb[(i, j)] = self.fetch_route_data(start=src, end=dst)
-            
-            # 정규화된 Properties를 추가
-            routes_for_place_comb = self.get_scaled_properties(routes=routes_for_place_comb)
+        if top_k is None:
+            top_k = len(place_combinations)
 
-            # 출발지에서 시작하여 모든 장소를 방문 후 출발지로 돌아오는 최적 경로 탐색 
-            best_route, best_score = self.find_optimal_route(places=places, routes_data=routes_for_place_comb)
+        region_matrix = RegionRouteMatrix(self.route_matrix_builder)
+        if prefetch:
+            # 모든 조합에 필요한 서로 다른 구간(leg)의 경로 데이터를 한 번씩만 병렬로 수집
+            region_matrix.prefetch(to_place_list(rows) for rows in place_combinations)
 
-            start = places[best_route[0]]
-            end = places[best_route[-1]]
-            passList = [places[pl] for pl in best_route[1:-1]]
-            optimal_route = self.tmap_client.get_route_data(start=start, end=end, passList=passList)
-            
-            # print_json(optimal_route)
+        # 장소 조합 별 경유지 순서 최적화를 병렬로 진행하고 route_score 기준 상위 top_k 로 합침
+        yield from self.combination_executor.iter_top_k(
+            lambda rows: self.build_tsp_route(to_place_list(rows), region_matrix, region), place_combinations, top_k,
+            key=lambda route: route['properties']['routeScore'], cancel_event=cancel_event
+        )
 
-            
-            _properties = optimal_route['features'][0]['properties']
-            properties = {
-                'totalDistance': _properties['totalDistance'],
-                'totalTime': _properties['totalTime'],
-                'totalFare': _properties['totalFare'],
-                'routeScore': best_score
-            }
 
-            points = []
-            coordinates = []
-            # 장소 안내 지점 유형
-            pointType_pattern = r'^(S|E|B\d*)$'  # S(출발지), E(경유지), B*(경유지)
-            startPoint_pattern = 'S'
-            endPoint_pattern = 'E'
-            passList_pattern = r'^(B\d*)$'
-
-            places_index = 0
-            for _feature in optimal_route['features']:
-                if ('description' not in _feature['properties'].keys()) or _feature['properties']['description'] == '경유지와 연결된 가상의 라인입니다':
-                    continue
-                _geometry = _feature['geometry']
-                # point_type = _feature['properties']['pointType']
-                # if _geometry['type'] == 'Point' and re.match(pointType_pattern, _feature['properties']['pointType']):
-                if _geometry['type'] == 'Point':
-                    point_type = _feature['properties']['pointType']
-                    if (point_type == startPoint_pattern) or (point_type == endPoint_pattern) or (re.match(passList_pattern, point_type)):
-                        point = defaultdict(str)
-                        point['pointId'] = _feature['properties']['pointIndex']
-                        point['pointName'] =  places[places_index % len(places)]['name']  # 장소명 
-                        point['pointLatitude'] = _geometry['coordinates'][1]  # 위도
-                        point['pointLongitude'] = _geometry['coordinates'][0]  # 경도 
-
-                        if point_type == startPoint_pattern:
-                            point['pointType'] = 'S'
-                        elif point_type == endPoint_pattern:
-                            point['pointType'] = 'E'
-                        elif re.match(passList_pattern, point_type):
-                            point['pointType'] = places[places_index % len(places)]['category']
-                        else: 
-                            point['pointType'] = '축제 장소'
-
-
-                        points.append(point)
-                        places_index += 1
-                elif _geometry['type'] == 'LineString':
-                    coordinates.extend(_geometry['coordinates'])
-
-
-            # 현재 장소 조합에 대한 경유지 순서 최적화 경로 데이터
-            best_route_dict = {
-                'properties': properties,
-                'points': points,
-                'lineCoordinates': coordinates
-            }
-            
-            best_routes_for_each_place_comb.append(best_route_dict)
+    def build_tsp_route(self, places: list, region_matrix: RegionRouteMatrix, region: str) -> dict:
+        """출발지/축제 장소를 포함한 장소 조합의 최적 순환 경로를 찾아 경로 데이터를 만드는 함수.
 
-        # route_score 기준 내림차순 정렬
-        best_routes_for_each_place_comb.sort(key=lambda x: x['properties']['routeScore'], reverse=True)
+        Args:
+            places (list): 장소 정보(dict) 리스트 (0번은 출발지)
+            region_matrix (RegionRouteMatrix): 구간 경로 데이터를 공유하는 지역 행렬
+            region (str): 지역명
 
-        return best_routes_for_each_place_comb[:top_k]
+        Returns:
+            dict: {'properties', 'points', 'lineCoordinates', 'lineLevels'} 형식의 경로 데이터.
+                구간 또는 최종 경로 요청이 실패하면 None.
+        """
+        # 지역 행렬에서 현재 조합의 장소 쌍 (i, j) 경로 데이터를 가져옴
+        routes_for_place_comb = region_matrix.submatrix(places)
+        if any(not route.get('features') for route in routes_for_place_comb.values()):
+            return None
+
+        # 정규화된 Properties를 추가
+        routes_for_place_comb = self.get_scaled_properties(routes=routes_for_place_comb)
+
+        # 출발지에서 시작하여 모든 장소를 방문 후 출발지로 돌아오는 최적 경로 탐색 
+        best_route, best_score = self.find_optimal_route(places=places, routes_data=routes_for_place_comb)
+
+        start = places[best_route[0]]
+        end = places[best_route[-1]]
+        passList = [places[pl] for pl in best_route[1:-1]]
+        optimal_route = self.tmap_client.get_route_data(start=start, end=end, passList=passList)
+        if not optimal_route.get('features'):
+            return None
+
+        # 방문 순서대로 정렬한 장소 정보로 경로 응답 파싱
+        visit_places = [places[i] for i in best_route]
+        parsed_route = parse_route_response(optimal_route, visit_places)
+        properties = parsed_route['properties']
+        properties['routeScore'] = best_score
+        # 출발지/축제 장소 제외한 추천 장소 점수 (routeScore 는 이동 비용이 반영된 순환 경로 점수)
+        properties['placeScore'] = self.calculate_place_score([place['name'] for place in places[1:-1]], region)
+
+        # 현재 장소 조합에 대한 경유지 순서 최적화 경로 데이터
+        line_coordinates = parsed_route['lineCoordinates']  # (N, 2) [경도, 위도] 배열
+        return {
+            'properties': properties,
+            'points': parsed_route['points'],
+            'lineCoordinates': line_coordinates,
+            'lineLevels': build_polyline_levels(line_coordinates)  # zoom 레벨 별 단순화 경로
+        }
 
 
-    
     def get_top_k_routes(self, start_place: str, end_place: str, region: str, festival_place: str, 
-                         comb: int = 2, comb_k: int = 5, top_k: int = 3) -> list:
+                         comb: int = 2, comb_k: int = 5, top_k: int = 3, via_optimizer: str = 'tmap',
+                         prune_combinations: bool = False, time_weight: float = DEFAULT_TIME_WEIGHT,
+                         cancel_event: threading.Event = None) -> list:
         """TMAP 경유지 순서 최적화 API를 활용한 여행 경로 추천 함수.
 
         Args:
@@ -287,12 +346,26 @@ class RouteOptimizer:
             festival_place (str): _description_
             comb (int, optional): _description_. Defaults to 2.
             comb_k (int, optional): _description_. Defaults to 5.
-            top_k (int, optional): _description_. Defaults to 3.
+            top_k (int, optional): _description_. None 이면 모든 조합의 경로 (Pareto 선택용). Defaults to 3.
+            via_optimizer (str, optional): 경유지 순서 최적화 방법. Defaults to 'tmap'.
+                - 'tmap': TMAP 경유지 순서 최적화 API (조합마다 API 호출)
+                - 'local': LocalRouteOptimizer (구간 경로 캐시를 이용해 로컬에서 최적화)
+            prune_combinations (bool, optional): True 이면 모든 조합을 최적화하지 않고 CombinationSearch 로 
+                '장소 점수 합 - time_weight × 이동 시간(시간)' (searchScore) 상위 top_k 조합만 찾습니다. 
+                기본 모드의 totalRouteScore 와는 다른 목적 함수이므로 반환되는 경로와 순서가 기본 모드와 다를 수 있으며, 
+                결과는 totalRouteScore 로 다시 정렬하지 않고 searchScore 내림차순으로 반환합니다 
+                (totalRouteScore 등 정규화 점수는 참고용으로 함께 기록). Defaults to False.
+            time_weight (float, optional): prune_combinations 사용 시 이동 시간 1시간 당 차감할 장소 점수. Defaults to 1.0.
+            cancel_event (threading.Event, optional): 설정되면 남은 조합을 처리하지 않고 
+                그때까지 완료된 조합으로 경로를 추천. Defaults to None.
 
         Returns:
             list: _description_
         """
-        place_combinations = self.place_data_manager.generate_place_combinations(region, comb, comb_k)
+        if via_optimizer not in ('tmap', 'local'):
+            raise ValueError(f"Unknown via point optimizer '{via_optimizer}'. Expected 'tmap' or 'local'.")
+
+        place_combinations = self.place_data_manager.get_place_combinations(region, comb, comb_k)
         
         # place_data_manager.search_poi() 로직 추가 
         search_poi_result_start_place = self.place_data_manager.search_poi(start_place, region)
@@ -303,7 +376,7 @@ class RouteOptimizer:
 
 
         if start_place == end_place:
-            end_poi = search_poi_result_start_place
+            end_poi = start_poi
         else:
             search_poi_result_end_place = self.place_data_manager.search_poi(end_place, region)
             if search_poi_result_end_place:
@@ -312,77 +385,220 @@ class RouteOptimizer:
                 end_poi = self.tmap_client.get_poi(end_place, region)
 
 
-        route_list = []
-        for place_combination in place_combinations:
-            via_pois = []
-            place_combination = place_combination + [festival_place]
-            # print(place_combination)
-            for j, via_point_name in enumerate(place_combination):
-                via_poi = self.tmap_client.get_poi(via_point_name, region)
-                if not via_poi: continue 
-                via_point = {
-                    'viaPointId': str(j+1),
-                    'viaPointName': via_point_name,
-                    'viaDetailAddress': '',
-                    'viaX': via_poi['longitude'],
-                    'viaY': via_poi['latitude'],
-                    'viaPoiId': '',
-                    'viaTime': 600,
-                    'wishStartTime': '',
-                    'wishEndTime': ''
-                }
-                via_pois.append(via_point)
-        
+        # 모든 조합에 등장하는 장소의 POI 를 중복 없이 한 번에 조회
+        via_point_names = [place['name'] for place in place_combinations.records(place_combinations.rows())]
+        via_point_pois = self.tmap_client.get_pois(via_point_names + [festival_place], region)
+
+        if via_optimizer == 'local':
+            # 구간 행렬이 계속 커지지 않도록 로컬 최적화기는 요청마다 새로 만듦 (구간 경로는 TMAPClient 경로 캐시에서 재사용)
+            local_route_optimizer = LocalRouteOptimizer(self.tmap_client.get_route_data, max_workers=self.max_workers)
+            optimize_route = local_route_optimizer.get_optimized_route
+        else:
+            optimize_route = self.tmap_client.get_optimized_route
+
+        if prune_combinations:
+            # 상한이 높은 조합부터 경유지 순서를 최적화하여 평가
+            search = CombinationSearch(top_k, time_weight=time_weight)
+            anchors = place_coords([start_poi, end_poi, via_point_pois[festival_place]])
+
+            def evaluate(rows):
+                place_combination = place_combinations.records(rows)
+                place_names = [place['name'] for place in place_combination] + [festival_place]
+                via_pois = self.build_via_points(place_names, via_point_pois)
+                route = self.build_via_route(place_names, optimize_route(start_poi, end_poi, via_pois), region)
+                if route is None:
+                    return None
+                value = search.combination_value(place_combination, route['properties']['totalTime'])
+                route['properties']['searchScore'] = round(value, 4)
+                return value, route
+
+            route_list = [route for _, _, route in search.search(place_combinations, evaluate, anchors,
+                                                                 to_places=place_combinations.records,
+                                                                 executor=self.combination_executor,
+                                                                 cancel_event=cancel_event)]
+
+        else:
+            def to_request(rows):
+                place_names = [place['name'] for place in place_combinations.records(rows)] + [festival_place]
+                return place_names, self.build_via_points(place_names, via_point_pois)
+
+            if via_optimizer == 'local':
+                # 모든 조합에 필요한 구간 경로를 중복 없이 한 번에 수집
+                local_route_optimizer.prefetch(
+                    (start_poi, end_poi, to_request(rows)[1]) for rows in place_combinations
+                )
+
+            def optimize(rows):
+                place_names, via_pois = to_request(rows)
+                return self.build_via_route(place_names, optimize_route(start_poi, end_poi, via_pois), region)
+
+            # 조합 별 경유지 순서 최적화 요청을 병렬로 진행 
+            route_list = self.combination_executor.map(optimize, place_combinations, cancel_event=cancel_event)
+
+        if not route_list:
+            return []
 
-            # route = self.tmap_client.get_route(start_poi, end_poi, via_points)
-
-            # 경유지 순서 최적화 요청 
-            via_optimized_route = self.tmap_client.get_optimized_route(start_poi, end_poi, via_pois)
-
-            properties = via_optimized_route['properties']
-            features = via_optimized_route['features']
-
-            result = dict()
-            points = []  # 장소 정보 리스트 
-            paths = []  # 경로 정보 리스트 
-            # places = []
-            coordinates = []
-            for feature in features:
-                _geometry = feature['geometry']
-                # type = _geometry['type']
-                if _geometry['type'] == 'Point':
-                    _point = defaultdict(str)
-                    _point['pointId'] = feature['properties']['index']  # 장소 id (방문 순서)
-                    _point['pointName'] = feature['properties']['viaPointName'].split()[-1]  # 장소 명 
-                    _point['pointLatitude'] = feature['geometry']['coordinates'][1]  # 위도
-                    _point['pointLongitude']= feature['geometry']['coordinates'][0]  # 경도 
-                    points.append(_point)
-                    # places.append(_point['pointName'])
-
-                elif _geometry['type'] == 'LineString':
-                    _path = defaultdict(str)
-                    _path['pathId'] = feature['properties']['index']
-                    _path['pathTime'] = feature['properties']['time']
-                    _path['pathDistance'] = feature['properties']['distance']
-                    _path['pathFare'] = feature['properties']['Fare']
-                    paths.append(_path)
-                    
-                    # 경로(Line의 좌표 정보)
-                    coordinates.extend(_geometry['coordinates'])
-
-            # 축제 장소 제외한 추천 장소 리스트 
-            # recommended_places = place_combination[:-1]
-            properties['routeScore'] = self.calculate_place_score(place_combination[:-1], region)
-
-            result = {
-                'properties': properties,
-                'points': points,
-                'paths': paths,
-                'lineCoordinates': coordinates
-            }
-            route_list.append(result)
-        
         route_list = self.get_scaled_scores(route_list)
+        if prune_combinations:
+            # 탐색에 사용한 목적 함수(searchScore) 순서를 유지
+            return route_list
         route_list.sort(key=lambda x: x['totalRouteScore'], reverse=True)
         return route_list[:top_k]
-    
+
+
+    def build_via_points(self, place_names: list, via_point_pois: dict) -> list:
+        """장소명 리스트를 경유지 순서 최적화 요청의 경유지(viaPoints) 리스트로 변환하는 함수. POI 가 없는 장소는 제외."""
+        via_pois = []
+        for j, via_point_name in enumerate(place_names):
+            via_poi = via_point_pois[via_point_name]
+            if not via_poi: continue 
+            via_point = {
+                'viaPointId': str(j+1),
+                'viaPointName': via_point_name,
+                'viaDetailAddress': '',
+                'viaX': via_poi['longitude'],
+                'viaY': via_poi['latitude'],
+                'viaPoiId': '',
+                'viaTime': 600,
+                'wishStartTime': '',
+                'wishEndTime': ''
+            }
+            via_pois.append(via_point)
+        return via_pois
+
+
+    def build_via_route(self, place_names: list, via_optimized_route: dict, region: str) -> dict:
+        """경유지 순서 최적화 결과를 경로 데이터로 변환하는 함수. 결과가 없으면 None 반환.
+
+        Args:
+            place_names (list): 추천 장소명 리스트 (마지막은 축제 장소)
+            via_optimized_route (dict): 경유지 순서 최적화 API (또는 LocalRouteOptimizer) 응답
+            region (str): 지역명
+
+        Returns:
+            dict: {'properties', 'points', 'paths', 'lineCoordinates', 'lineLevels'} 형식의 경로 데이터
+        """
+        if not via_optimized_route.get('features'):
+            return None
+
+        parsed_route = parse_optimized_route_response(via_optimized_route)
+        properties = parsed_route['properties']
+
+        # 축제 장소 제외한 추천 장소 리스트 
+        properties['routeScore'] = self.calculate_place_score(place_names[:-1], region)
+        properties['placeScore'] = properties['routeScore']
+
+        line_coordinates = parsed_route['lineCoordinates']  # (N, 2) [경도, 위도] 배열
+        return {
+            'properties': properties,
+            'points': parsed_route['points'],
+            'paths': parsed_route['paths'],
+            'lineCoordinates': line_coordinates,
+            'lineLevels': build_polyline_levels(line_coordinates)  # zoom 레벨 별 단순화 경로
+        }
+
+
+    def get_itinerary_routes(self, start_place: str, region: str, festival_place: str, time_budget: int = 8 * 3600,
+                             candidates_per_category: int = 50, top_k: int = 3, max_stops: int = 5,
+                             dwell_time: int = 600, time_limit: float = DEFAULT_TIME_LIMIT, seed: int = None,
+                             radius_km: float = None, max_iterations: int = None) -> list:
+        """분류 별 상위 후보 장소 중 방문할 장소와 순서를 함께 정하는 일정 탐색 기반 여행 경로 추천 함수.
+
+        장소 조합을 모두 만들지 않고, 추정 이동 시간으로 ItinerarySearch 를 실행해 총 소요 시간 예산 안에서
+        장소 점수(최종점수) 합이 높은 일정을 찾은 뒤 선택된 일정만 TMAP 경로 탐색 API 로 요청합니다.
+        조합 방식과 같이 카페와 식당은 각각 최대 1곳만 방문합니다.
+
+        Args:
+            start_place (str): 출발지 (출발지로 돌아오는 순환 경로)
+            region (str): 지역명
+            festival_place (str): 축제 장소 (반드시 방문)
+            time_budget (int, optional): 총 소요 시간(이동 + 체류) 예산(초). Defaults to 8시간.
+            candidates_per_category (int, optional): 분류 별 후보 장소 수. Defaults to 50.
+            top_k (int, optional): 반환할 경로 수. Defaults to 3.
+            max_stops (int, optional): 최대 방문 장소 수 (축제 장소 포함, TMAP 경유지 최대 5개). Defaults to 5.
+            dwell_time (int, optional): 장소 별 체류 시간(초). Defaults to 600.
+            time_limit (float, optional): 일정 탐색 제한 시간(초). Defaults to 1.0.
+            seed (int, optional): 일정 탐색 난수 seed. seed 만 지정하면 time_limit 안에 수행한 반복 횟수에 따라
+                결과가 달라질 수 있으므로, 재현 가능한 결과가 필요하면 max_iterations 와 함께 지정. Defaults to None.
+            radius_km (float, optional): 축제 장소에서 이 반경(km) 이내의 장소만 후보로 사용. Defaults to None (지역 전체).
+            max_iterations (int, optional): 일정 탐색 최대 교란 반복 횟수. Defaults to None (time_limit 까지 반복).
+
+        Returns:
+            list: get_top_k_routes_tsp 와 같은 형식의 경로 리스트 (routeScore 내림차순).
+                축제 장소만 다녀와도 예산을 넘으면 빈 리스트.
+        """
+        start_poi = self.tmap_client.get_poi(start_place, region)
+        festival_poi = self.tmap_client.get_poi(festival_place, region)
+        if not start_poi or not festival_poi:
+            return []
+
+        start = {'name': start_place, 'category': '출발지',
+                 'latitude': float(start_poi['latitude']), 'longitude': float(start_poi['longitude'])}
+        festival = {'name': festival_place, 'category': '축제장소',
+                    'latitude': float(festival_poi['latitude']), 'longitude': float(festival_poi['longitude'])}
+        candidates = [
+            place
+            for category in ('카페', '식당', '관광지')
+            for place in self.place_data_manager.get_filtered_places(
+                region, category, candidates_per_category,
+                center=(festival['latitude'], festival['longitude']), radius_km=radius_km
+            ).to_dict('records')
+            if place['name'] not in (start_place, festival_place)
+        ]
+
+        nodes = [start] + candidates + [festival]
+        search = ItinerarySearch(
+            travel_times=estimate_travel_times([[place['latitude'], place['longitude']] for place in nodes]),
+            scores=[0.0] + [place['최종점수'] for place in candidates] + [0.0],
+            budget=time_budget,
+            dwell_times=[0] + [dwell_time] * (len(nodes) - 1),
+            required=(len(nodes) - 1,),
+            categories=[place['category'] for place in nodes],
+            category_limits={'카페': 1, '식당': 1},
+            max_stops=max_stops,
+            time_limit=time_limit,
+            max_iterations=max_iterations,
+            seed=seed
+        )
+
+        route_list = []
+        for score, _, itinerary in search.search(top_k):
+            stops = [nodes[node] for node in itinerary]
+            optimal_route = self.tmap_client.get_route_data(start=start, end=start, passList=stops)
+            if not optimal_route.get('features'):
+                continue
+
+            parsed_route = parse_route_response(optimal_route, [start] + stops + [start])
+            properties = parsed_route['properties']
+            properties['routeScore'] = round(score, 4)
+            properties['placeScore'] = self.calculate_place_score(
+                [place['name'] for place in stops if place is not festival], region
+            )
+
+            line_coordinates = parsed_route['lineCoordinates']  # (N, 2) [경도, 위도] 배열
+            route_list.append({
+                'properties': properties,
+                'points': parsed_route['points'],
+                'lineCoordinates': line_coordinates,
+                'lineLevels': build_polyline_levels(line_coordinates)  # zoom 레벨 별 단순화 경로
+            })
+
+        route_list.sort(key=lambda x: x['properties']['routeScore'], reverse=True)
+        return route_list
+
+
+    def get_pareto_routes(self, route_list: list, weights: dict = None) -> dict:
+        """후보 경로 중 거리/시간/요금/장소 점수에 대해 지배되지 않는 경로(Pareto front)와 가중치 선택 결과를 반환하는 함수.
+
+        get_top_k_routes(_tsp) 를 top_k=None 으로 호출해 얻은 전체 후보 경로를 넘기면,
+        가중치를 바꿔 다시 호출해도 API 호출 없이 선택만 바뀝니다.
+
+        Args:
+            route_list (list): 후보 경로 리스트
+            weights (dict, optional): {'totalDistance', 'totalTime', 'totalFare', 'placeScore'} 별 가중치.
+                Defaults to None (동일 가중치).
+
+        Returns:
+            dict: {'front': paretoScore 내림차순 Pareto front 경로 리스트, 'selected': 선택된 경로, 'weights': 가중치}
+        """
+        return select_pareto_routes(route_list, weights)
@@ -0,0 +1,155 @@
+import numpy as np
+from itertools import chain
+from typing import TypedDict
+
+# 경유지와 출발/도착지를 잇는 TMAP 가상 경로 feature 설명
+VIRTUAL_LINE_DESCRIPTION = '경유지와 연결된 가상의 라인입니다'
+
+
+class RoutePoint(TypedDict, total=False):
+    """경로 상의 장소 안내 지점"""
+    pointId: int
+    pointName: str
+    pointLatitude: float
+    pointLongitude: float
+    pointType: str
+
+
+class RoutePath(TypedDict):
+    """경유지 순서 최적화 결과의 구간(장소 → 장소) 정보"""
+    pathId: str
+    pathTime: str
+    pathDistance: str
+    pathFare: str
+
+
+class ParsedRoute(TypedDict):
+    """TMAP 경로 응답 파싱 결과"""
+    properties: dict
+    points: list
+    paths: list
+    lineCoordinates: np.ndarray
+
+
+def _is_pass_point(point_type: str) -> bool:
+    # 'B', 'B1', 'B2', ... (경유지)
+    return point_type[:1] == 'B' and (len(point_type) == 1 or point_type[1:].isdigit())
+
+
+def _fill_coordinates(lines: list, total: int) -> np.ndarray:
+    # LineString 좌표를 크기를 미리 지정한(count) 배열에 중간 리스트 없이 순서대로 채움
+    values = chain.from_iterable(chain.from_iterable(lines))
+    return np.fromiter(values, dtype=np.float64, count=total * 2).reshape(total, 2)
+
+
+def parse_route_response(route_data: dict, places: list) -> ParsedRoute:
+    """TMAP 경로 탐색(routes) API 응답을 한 번의 순회로 파싱하는 함수.
+
+    경유지 가상 라인과 description 이 없는 feature 는 건너뛰며, 출발지(S)/경유지(B*)/도착지(E) 지점을
+    방문 순서대로 places 의 장소명/분류와 매칭합니다. 경로 좌표는 미리 할당한 배열에 채웁니다.
+
+    Args:
+        route_data (dict): TMAP 경로 탐색 API 응답 (출발지, 경유지, 도착지 포함)
+        places (list): 방문 순서대로 정렬한 장소 정보(dict) 리스트. 각 장소는 'name', 'category' 키를 포함.
+
+    Returns:
+        ParsedRoute: {'properties', 'points', 'paths', 'lineCoordinates'}
+            - properties: 첫 번째 feature 의 totalDistance, totalTime, totalFare
+            - points: RoutePoint 리스트
+            - paths: 빈 리스트 (경로 탐색 API 는 구간 정보를 제공하지 않음)
+            - lineCoordinates: (N, 2) 크기의 [경도, 위도] 배열
+    """
+    features = route_data['features']
+    first_properties = features[0]['properties']
+    properties = {
+        'totalDistance': first_properties['totalDistance'],
+        'totalTime': first_properties['totalTime'],
+        'totalFare': first_properties['totalFare']
+    }
+
+    points = []
+    lines = []
+    total = 0
+    num_places = len(places)
+
+    for feature in features:
+        feature_properties = feature['properties']
+        description = feature_properties.get('description')
+        if description is None or description == VIRTUAL_LINE_DESCRIPTION:
+            continue
+
+        geometry = feature['geometry']
+        geometry_type = geometry['type']
+        if geometry_type == 'LineString':
+            line = geometry['coordinates']
+            lines.append(line)
+            total += len(line)
+
+        elif geometry_type == 'Point':
+            point_type = feature_properties['pointType']
+            if point_type == 'S' or point_type == 'E' or _is_pass_point(point_type):
+                place = places[len(points) % num_places]
+                coordinates = geometry['coordinates']
+                points.append(RoutePoint(
+                    pointId=feature_properties['pointIndex'],
+                    pointName=place['name'],  # 장소명
+                    pointLatitude=coordinates[1],  # 위도
+                    pointLongitude=coordinates[0],  # 경도
+                    pointType=point_type if point_type in ('S', 'E') else place['category']
+                ))
+
+    return ParsedRoute(properties=properties, points=points, paths=[], lineCoordinates=_fill_coordinates(lines, total))
+
+
+def parse_optimized_route_response(route_data: dict) -> ParsedRoute:
+    """TMAP 경유지 순서 최적화(routeOptimization) API 응답을 한 번의 순회로 파싱하는 함수.
+
+    Args:
+        route_data (dict): TMAP 경유지 순서 최적화 API 응답
+
+    Returns:
+        ParsedRoute: {'properties', 'points', 'paths', 'lineCoordinates'}
+            - properties: 응답의 properties (totalDistance, totalTime, totalFare 등)
+            - points: 방문 순서대로 정렬된 RoutePoint 리스트
+            - paths: 구간 별 RoutePath 리스트
+            - lineCoordinates: (N, 2) 크기의 [경도, 위도] 배열
+    """
+    points = []
+    paths = []
+    lines = []
+    total = 0
+
+    for feature in route_data['features']:
+        feature_properties = feature['properties']
+        geometry = feature['geometry']
+        geometry_type = geometry['type']
+
+        if geometry_type == 'Point':
+            coordinates = geometry['coordinates']
+            points.append(RoutePoint(
+                pointId=feature_properties['index'],  # 장소 id (방문 순서)
+                pointName=feature_properties['viaPointName'].split()[-1],  # 장소명
+                pointLatitude=coordinates[1],  # 위도
+                pointLongitude=coordinates[0]  # 경도
+            ))
+
+        elif geometry_type == 'LineString':
+            paths.append(RoutePath(
+                pathId=feature_properties['index'],
+                pathTime=feature_properties['time'],
+                pathDistance=feature_properties['distance'],
+                pathFare=feature_properties['Fare']
+            ))
+            line = geometry['coordinates']
+            lines.append(line)
+            total += len(line)
+
+    return ParsedRoute(properties=route_data['properties'], points=points, paths=paths,
+                       lineCoordinates=_fill_coordinates(lines, total))
+
+
+def parse_line_coordinates(route_data: dict) -> np.ndarray:
+    """TMAP 경로 응답의 모든 LineString 좌표를 (N, 2) 배열로 추출하는 함수."""
+    lines = [feature['geometry']['coordinates'] for feature in route_data['features']
+             if feature['geometry']['type'] == 'LineString']
+    return _fill_coordinates(lines, sum(len(line) for line in lines))
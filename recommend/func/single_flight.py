@@ -0,0 +1,79 @@
+import threading
+
+
+class _Call:
+    """진행 중인 upstream 호출 하나를 나타내는 내부 클래스"""
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """동일한 키로 동시에 들어온 요청을 하나의 upstream 호출로 합치는(coalescing) 클래스.
+
+    같은 키의 호출이 이미 진행 중이면 새로 호출하지 않고 진행 중인 호출이 끝나기를 기다려
+    그 결과(또는 예외)를 함께 반환합니다. 호출이 끝나면 키는 해제되므로 결과를 캐싱하지는 않습니다.
+    """
+    def __init__(self, copy_shared=None):
+        """
+        Args:
+            copy_shared (callable, optional): 결과를 공유받는 호출자에게 반환하기 전에 적용할 복사 함수.
+                호출자가 결과를 수정하는 경우 copy.deepcopy 등을 지정합니다. Defaults to None (같은 객체 공유).
+        """
+        self.copy_shared = copy_shared
+        self.calls = 0  # 실제로 수행된 upstream 호출 수
+        self.shared = 0  # 진행 중인 호출의 결과를 공유하여 절약된 호출 수
+
+        self._in_flight = dict()
+        self._lock = threading.Lock()
+
+
+    def do(self, key, fn, *args, **kwargs):
+        """key 에 해당하는 호출이 진행 중이면 그 결과를 기다리고, 아니면 fn 을 호출하는 함수.
+
+        Args:
+            key (hashable): 동일한 요청을 식별하는 키
+            fn (callable): upstream 호출 함수
+            *args, **kwargs: fn 에 전달할 인자
+
+        Returns:
+            fn 의 반환 값. fn 에서 예외가 발생하면 대기 중인 모든 호출자에게 같은 예외를 발생시킵니다.
+        """
+        with self._lock:
+            call = self._in_flight.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._in_flight[key] = call
+                self.calls += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return self.copy_shared(call.result) if self.copy_shared else call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+
+        return call.result
+
+
+    def stats(self) -> dict:
+        """호출 합치기 통계를 반환하는 함수."""
+        return {
+            'calls': self.calls,
+            'saved': self.shared,
+            'inFlight': len(self._in_flight)
+        }
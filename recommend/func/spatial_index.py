@@ -0,0 +1,129 @@
+import os
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from recommend.func.dataset_schema import read_dataset
+
+EARTH_RADIUS = 6371008.8  # 지구 평균 반지름(m)
+# data/ 방문 데이터셋(*_togo_count.csv 등)의 좌표/분류 컬럼
+VISIT_DATASET_COLUMNS = {'latitude': '목적지Y좌표', 'longitude': '목적지X좌표', 'category': '대분류'}
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data')
+
+
+def to_unit_vectors(latitudes, longitudes) -> np.ndarray:
+    """위도/경도를 단위 구 위의 3차원 좌표 (N, 3) 로 변환하는 함수."""
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def chord_to_meters(chord) -> np.ndarray:
+    """단위 구 위의 현(chord) 길이를 대원 거리(m)로 변환하는 함수."""
+    return 2 * EARTH_RADIUS * np.arcsin(np.clip(np.asarray(chord) / 2, 0, 1))
+
+
+def meters_to_chord(meters: float) -> float:
+    """대원 거리(m)를 단위 구 위의 현(chord) 길이로 변환하는 함수."""
+    return 2 * np.sin(min(meters / EARTH_RADIUS, np.pi) / 2)
+
+
+class SpatialIndex:
+    """위도/경도 좌표에 대한 반경/최근접 검색 인덱스 클래스.
+
+    좌표를 단위 구 위의 3차원 벡터로 바꿔 KD-tree(cKDTree)에 저장합니다. 3차원 직선(현) 거리는
+    대원(haversine) 거리와 단조 관계이므로 반경/최근접 결과가 haversine 기준과 같습니다.
+    분류 별 검색을 위해 분류마다 별도의 트리를 만듭니다.
+    """
+    def __init__(self, latitudes, longitudes, categories=None):
+        """
+        Args:
+            latitudes (np.ndarray | list): 위도 (길이 N)
+            longitudes (np.ndarray | list): 경도 (길이 N)
+            categories (np.ndarray | list, optional): 분류 (길이 N). Defaults to None.
+        """
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        # 좌표가 없는 행은 인덱스에서 제외 (원래 행 번호는 유지)
+        valid = np.isfinite(latitudes) & np.isfinite(longitudes)
+        self.rows = np.flatnonzero(valid)
+        self.tree = cKDTree(to_unit_vectors(latitudes[valid], longitudes[valid]))
+
+        self.category_trees = dict()
+        if categories is not None:
+            categories = np.asarray(categories, dtype=object)[valid]
+            for category in pd.unique(categories):
+                positions = np.flatnonzero(categories == category)
+                self.category_trees[category] = (cKDTree(self.tree.data[positions]), self.rows[positions])
+
+
+    @classmethod
+    def from_dataframe(cls, data: pd.DataFrame, latitude: str = 'latitude', longitude: str = 'longitude',
+                       category: str = None) -> 'SpatialIndex':
+        """DataFrame 의 좌표/분류 컬럼으로 인덱스를 만드는 함수. 반환되는 행 번호는 DataFrame 의 위치(iloc) 입니다."""
+        return cls(data[latitude].to_numpy(), data[longitude].to_numpy(),
+                   data[category].to_numpy() if category else None)
+
+
+    def _tree(self, category: str = None) -> tuple:
+        if category is None:
+            return self.tree, self.rows
+        return self.category_trees.get(category, (None, None))
+
+
+    def query_radius(self, latitude: float, longitude: float, radius_m: float, category: str = None) -> tuple:
+        """중심 좌표에서 radius_m 이내의 장소를 가까운 순서로 찾는 함수.
+
+        Args:
+            latitude (float): 중심 위도
+            longitude (float): 중심 경도
+            radius_m (float): 반경(m)
+            category (str, optional): 분류 필터. Defaults to None (전체).
+
+        Returns:
+            tuple: (행 번호 배열, 거리(m) 배열)
+        """
+        tree, rows = self._tree(category)
+        if tree is None or tree.n == 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0)
+
+        center = to_unit_vectors([latitude], [longitude])[0]
+        positions = np.asarray(tree.query_ball_point(center, meters_to_chord(radius_m)), dtype=np.intp)
+        distances = chord_to_meters(np.linalg.norm(tree.data[positions] - center, axis=1))
+        order = np.argsort(distances, kind='stable')
+        return rows[positions[order]], distances[order]
+
+
+    def query_nearest(self, latitude: float, longitude: float, k: int = 1, category: str = None) -> tuple:
+        """중심 좌표에서 가장 가까운 k 개의 장소를 찾는 함수.
+
+        Args:
+            latitude (float): 중심 위도
+            longitude (float): 중심 경도
+            k (int, optional): 찾을 장소 수. Defaults to 1.
+            category (str, optional): 분류 필터. Defaults to None (전체).
+
+        Returns:
+            tuple: (행 번호 배열, 거리(m) 배열) 가까운 순서, 최대 k 개
+        """
+        tree, rows = self._tree(category)
+        if tree is None or tree.n == 0 or k <= 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0)
+
+        chords, positions = tree.query(to_unit_vectors([latitude], [longitude])[0], k=min(k, tree.n))
+        positions = np.atleast_1d(positions)
+        return rows[positions], chord_to_meters(np.atleast_1d(chords))
+
+
+    def __len__(self):
+        return len(self.rows)
+
+
+def load_visit_spatial_index(file_name: str) -> tuple:
+    """data/ 방문 데이터셋(예: 'g_togo_count.csv')을 읽어 (DataFrame, SpatialIndex) 를 반환하는 함수."""
+    data = read_dataset(os.path.join(DATA_DIR, file_name))
+    has_category = VISIT_DATASET_COLUMNS['category'] in data.columns
+    index = SpatialIndex.from_dataframe(data, VISIT_DATASET_COLUMNS['latitude'], VISIT_DATASET_COLUMNS['longitude'],
+                                        VISIT_DATASET_COLUMNS['category'] if has_category else None)
+    return data, index
@@ -0,0 +1,152 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'cache')
+DEFAULT_CACHE_PATH = os.path.join(DEFAULT_CACHE_DIR, 'tmap_cache.sqlite')
+DEFAULT_TTL = 7 * 24 * 60 * 60  # 캐시 유효 기간(초), 7일
+DEFAULT_MAX_ENTRIES = 50000  # 테이블 당 최대 저장 건수
+
+
+def make_cache_key(data: dict) -> str:
+    """dict 형태의 요청 정보를 정렬된 JSON 으로 직렬화한 뒤 해시하여 캐시 키를 생성하는 함수."""
+    serialized = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+
+
+class SQLiteCache:
+    """SQLite 기반의 영구(on-disk) 키-값 캐시 클래스.
+
+    값은 JSON 으로 직렬화하여 저장하며, TTL 이 지난 항목은 만료 처리하고
+    저장 건수가 max_entries 를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다.
+    여러 스레드에서 동시에 사용할 수 있습니다.
+    """
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH, table: str = 'routes',
+                 ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            db_path (str, optional): SQLite 파일 경로. ":memory:" 를 지정하면 메모리에만 저장.
+                Defaults to recommend/data/cache/tmap_cache.sqlite.
+            table (str, optional): 캐시 테이블명. 하나의 파일에 여러 캐시를 구분하여 저장할 때 사용. Defaults to 'routes'.
+            ttl (float, optional): 캐시 유효 기간(초). None 이면 만료되지 않음. Defaults to 7일.
+            max_entries (int, optional): 최대 저장 건수. Defaults to 50000.
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid cache table name '{table}'.")
+
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self.db_path = db_path
+        self.table = table
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        # 캐시 통계
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.table} ('
+                'key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+                'created_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+            )
+            self._conn.execute(f'CREATE INDEX IF NOT EXISTS {self.table}_accessed_at ON {self.table} (accessed_at)')
+
+
+    def get(self, key: str):
+        """캐시에서 값을 조회하는 함수. 값이 없거나 만료된 경우 None 을 반환합니다."""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(f'SELECT value, created_at FROM {self.table} WHERE key = ?', (key,)).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, created_at = row
+            if self.ttl is not None and now - created_at > self.ttl:
+                self._conn.execute(f'DELETE FROM {self.table} WHERE key = ?', (key,))
+                self.expired += 1
+                self.misses += 1
+                return None
+
+            self._conn.execute(f'UPDATE {self.table} SET accessed_at = ? WHERE key = ?', (now, key))
+            self.hits += 1
+
+        return json.loads(value)
+
+
+    def set(self, key: str, value):
+        """캐시에 값을 저장하는 함수. 저장 건수가 max_entries 를 넘으면 오래 사용되지 않은 항목을 삭제합니다."""
+        now = time.time()
+        serialized = json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+        with self._lock, self._conn:
+            self._conn.execute(
+                f'INSERT OR REPLACE INTO {self.table} (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)',
+                (key, serialized, now, now)
+            )
+            self._evict()
+
+
+    def _evict(self):
+        if self.max_entries is None:
+            return
+
+        count = self._conn.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                f'DELETE FROM {self.table} WHERE key IN '
+                f'(SELECT key FROM {self.table} ORDER BY accessed_at ASC LIMIT ?)',
+                (overflow,)
+            )
+            self.evictions += overflow
+
+
+    def purge_expired(self) -> int:
+        """만료된 항목을 일괄 삭제하고 삭제한 건수를 반환하는 함수."""
+        if self.ttl is None:
+            return 0
+
+        with self._lock, self._conn:
+            cursor = self._conn.execute(f'DELETE FROM {self.table} WHERE created_at < ?', (time.time() - self.ttl,))
+            self.expired += cursor.rowcount
+        return cursor.rowcount
+
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute(f'DELETE FROM {self.table}')
+
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+
+
+    def stats(self) -> dict:
+        """캐시 적중/미스 통계를 반환하는 함수."""
+        requests = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'expired': self.expired,
+            'evictions': self.evictions,
+            'hitRate': round(self.hits / requests, 4) if requests else 0.0,
+            'entries': len(self)
+        }
+
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,169 @@
+"""기록된 TMAP/Kakao 응답을 제공하는 로컬 stand-in HTTP 서버.
+
+RecordingTransport 로 기록한 요청/응답을 실제 API 대신 제공하여, 실제 호출 한도를 사용하지 않고
+추천 파이프라인 전체의 성능을 재현 가능하게 측정할 수 있습니다.
+
+Example:
+    ```bash
+    # 1. 기록: 실제 API 를 호출하면서 요청/응답 저장
+    ODYSSEYES_HTTP_MODE=record streamlit run main.py
+
+    # 2. stand-in 서버 실행 (응답 지연 200ms, 오류 5%)
+    python -m recommend.func.stand_in_server --port 8765 --latency 0.2 --error-rate 0.05
+
+    # 3. 모든 요청을 stand-in 서버로 보내 실행
+    ODYSSEYES_HTTP_BASE_URL=http://127.0.0.1:8765 streamlit run main.py
+    ```
+"""
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from recommend.func.recording_transport import DEFAULT_RECORD_DIR, request_fingerprint, load_recording
+
+
+class StandInServer:
+    """기록된 응답을 제공하는 로컬 HTTP 서버 클래스. 응답 지연과 오류 주입을 설정할 수 있습니다."""
+    def __init__(self, record_dir: str = DEFAULT_RECORD_DIR, host: str = '127.0.0.1', port: int = 8765,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 503, seed: int = None):
+        """
+        Args:
+            record_dir (str, optional): 기록 파일 디렉터리. Defaults to recommend/data/recordings.
+            host (str, optional): 바인딩할 주소. Defaults to '127.0.0.1'.
+            port (int, optional): 바인딩할 포트. 0 이면 빈 포트를 자동 선택. Defaults to 8765.
+            latency (float, optional): 응답마다 추가할 지연 시간(초). Defaults to 0.0.
+            jitter (float, optional): 지연 시간에 더할 무작위 편차의 최대값(초). Defaults to 0.0.
+            error_rate (float, optional): 오류 응답을 반환할 확률 (0 ~ 1). Defaults to 0.0.
+            error_status (int, optional): 주입할 오류 응답의 상태 코드. Defaults to 503.
+            seed (int, optional): 지연/오류 주입 난수 시드. Defaults to None.
+        """
+        self.record_dir = record_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+
+        self.served = 0
+        self.missing = 0
+        self.injected_errors = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else None
+                status, content_type, payload = server.respond(self.command, self.path, body)
+
+                data = payload.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = _handle
+            do_POST = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+    def respond(self, method: str, path: str, body=None) -> tuple:
+        """요청에 대한 (상태 코드, Content-Type, 본문) 을 반환하는 함수."""
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            inject_error = self.error_rate > 0 and self._random.random() < self.error_rate
+
+        if delay:
+            time.sleep(delay)
+
+        if inject_error:
+            with self._lock:
+                self.injected_errors += 1
+            return self.error_status, 'application/json', json.dumps({'error': {'code': 'INJECTED_ERROR'}})
+
+        fingerprint = request_fingerprint(method, path, body)
+        recording = load_recording(self.record_dir, fingerprint['key'])
+        if recording is None:
+            with self._lock:
+                self.missing += 1
+            return 404, 'application/json', json.dumps({'error': {'code': 'NO_RECORDING', 'key': fingerprint['key']}})
+
+        with self._lock:
+            self.served += 1
+        return recording['status_code'], recording.get('content_type', 'application/json'), recording['body']
+
+
+    def start(self):
+        """백그라운드 스레드에서 서버를 실행하는 함수."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+    def stats(self) -> dict:
+        return {'served': self.served, 'missing': self.missing, 'injectedErrors': self.injected_errors}
+
+
+    def __enter__(self):
+        return self.start()
+
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기록된 TMAP/Kakao 응답을 제공하는 로컬 stand-in 서버')
+    parser.add_argument('--record-dir', default=DEFAULT_RECORD_DIR)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    server = StandInServer(record_dir=args.record_dir, host=args.host, port=args.port,
+                           latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                           error_status=args.error_status, seed=args.seed)
+    print(f'Stand-in server listening on {server.base_url} (recordings: {args.record_dir})')
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(server.stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -1,20 +1,56 @@
 from dotenv import load_dotenv
 import requests
 import json
+import copy
 import urllib3
+from concurrent.futures import ThreadPoolExecutor
+
+from recommend.func.http_transport import HTTPTransport, get_transport
+from recommend.func.sqlite_cache import SQLiteCache, make_cache_key
+from recommend.func.poi_cache import PoiCache
+from recommend.func.single_flight import SingleFlight
+from recommend.func.rate_limiter import RateLimiter, get_rate_limiter
+from recommend.func.route_parser import parse_line_coordinates
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# 경로 캐시 키에 사용하는 좌표 정규화 자릿수 (소수점 6자리 ≒ 0.1m)
+COORD_PRECISION = 6
+# 경로 결과에 영향을 주는 요청 옵션 (경로 캐시 키에 포함)
+ROUTE_CACHE_KEY_FIELDS = ('startX', 'startY', 'endX', 'endY', 'passList', 'roadType', 'tollgateFareOption', 'carType')
+
+
+def normalize_coord(value) -> float:
+    """좌표 값을 float 으로 변환하고 COORD_PRECISION 자리로 반올림하는 함수."""
+    return round(float(value), COORD_PRECISION)
+
 
 class TMAPClient:
     """TMAP API 호출을 담당하는 클래스"""
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, transport: HTTPTransport = None, route_cache: SQLiteCache = None,
+                 poi_cache: PoiCache = None, max_workers: int = 8, rate_limiter: RateLimiter = None):
         """_summary_
 
         Args:
             api_key (str): _description_
+            transport (HTTPTransport, optional): API 호출에 사용할 HTTP 전송 계층. 
+                Defaults to None (프로세스 공용 transport 사용).
+            route_cache (SQLiteCache, optional): get_route_data 결과를 저장하는 영구 캐시. 
+                Defaults to None (캐시 사용 안 함).
+            poi_cache (PoiCache, optional): get_poi 결과를 저장하는 POI 캐시. 
+                Defaults to None (메모리 LRU 캐시 사용).
+            max_workers (int, optional): get_pois 에서 캐시에 없는 POI 를 동시에 조회할 스레드 수. Defaults to 8.
+            rate_limiter (RateLimiter, optional): 엔드포인트 별 호출 속도/일일 한도 제한기. 일일 한도를 모두 사용하면
+                API 호출 함수가 QuotaExceededError 를 발생시킵니다. Defaults to None (프로세스 공용 rate limiter 사용).
         """
         self.api_key = api_key
+        self.transport = transport if transport is not None else get_transport()
+        self.route_cache = route_cache
+        self.poi_cache = poi_cache if poi_cache is not None else PoiCache()
+        self.max_workers = max_workers
+        # 동시에 들어온 동일한 POI/경로 요청을 하나의 API 호출로 합침
+        self.single_flight = SingleFlight(copy_shared=copy.deepcopy)
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_rate_limiter()
 
 
     def get_poi(self, keyword: str, region: str = None) -> dict:
@@ -33,6 +69,7 @@ class TMAPClient:
         
         Raises:
             json.JSONDecodeError: 응답이 JSON 형식이 아닐 경우 발생하는 예외.
+            QuotaExceededError: POI 검색 API 의 일일 호출 한도를 모두 사용한 경우 발생하는 예외.
         
         Example:
             ```python
@@ -41,9 +78,30 @@ class TMAPClient:
             # Output: {'latitude': '36.30662608', 'longitude': '126.90670093', 'name': '백제문화단지'}
             ```
         """
+        cached_poi = self.poi_cache.get(keyword, region)
+        if cached_poi is not None:
+            return cached_poi
+
+        return self.single_flight.do(('poi', PoiCache.make_key(keyword, region)), self._request_poi, keyword, region)
+
+
+    def _request_poi(self, keyword: str, region: str = None) -> dict:
+        """TMAP POI 검색 API 를 호출하고 결과를 POI 캐시에 저장하는 함수."""
+        if not self.rate_limiter.acquire('poi'):
+            return {}
+
         search_keyword = f"{region} {keyword}" if region else keyword
         url = f'https://apis.openapi.sk.com/tmap/pois?version=1&appKey={self.api_key}&searchKeyword={search_keyword}'
-        response = requests.get(url, verify=False)
+        try:
+            response = self.transport.get(url, verify=False)
+        except requests.RequestException as e:
+            print(f"Error: Request to TMAP API for POI failed. ({e})")
+            return {}
+
+        if response.status_code == 204:
+            # 검색 결과 없음
+            self.poi_cache.set_missing(keyword, region)
+            return {}
 
         if response.status_code != 200:
             print(f"Error: Received status code {response.status_code} from TMAP API for POI.")
@@ -58,12 +116,47 @@ class TMAPClient:
 
         if data and 'searchPoiInfo' in data:
             first_poi = data['searchPoiInfo']['pois']['poi'][0]
-            return {
+            poi = {
                 'latitude': first_poi['noorLat'],
                 'longitude': first_poi['noorLon'],
                 'name': first_poi['name']
             }
+            self.poi_cache.set(keyword, region, poi)
+            return poi
+
+        self.poi_cache.set_missing(keyword, region)
         return {}
+
+
+    def get_pois(self, keywords: list, region: str = None) -> dict:
+        """여러 키워드의 POI 정보를 한 번에 가져오는 함수.
+
+        중복된 키워드는 한 번만 조회하며, POI 캐시에 없는 키워드만 스레드 풀에서 동시에 조회합니다.
+
+        Args:
+            keywords (list): 검색할 POI 키워드 리스트.
+            region (str, optional): 검색할 지역 이름. Defaults to None.
+
+        Returns:
+            dict: {키워드: POI 정보} 형식의 사전. 입력 순서를 유지하며, 검색 결과가 없는 키워드는 빈 사전.
+
+        Example:
+            ```python
+            pois = get_pois(["솥뚜껑매운탕", "곰골식당", "솥뚜껑매운탕"], region="공주")
+            print(pois["곰골식당"])
+            # Output: {'latitude': '36.45184527', 'longitude': '127.12054302', 'name': '곰골식당'}
+            ```
+        """
+        unique_keywords = list(dict.fromkeys(keywords))
+        pois = {keyword: self.poi_cache.get(keyword, region) for keyword in unique_keywords}
+
+        missing_keywords = [keyword for keyword, poi in pois.items() if poi is None]
+        if missing_keywords:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(missing_keywords)))) as executor:
+                results = executor.map(lambda keyword: self.single_flight.do(('poi', PoiCache.make_key(keyword, region)), self._request_poi, keyword, region), missing_keywords)
+                pois.update(zip(missing_keywords, results))
+
+        return pois
     
 
     def get_route_data(self, start: dict, end: dict, passList: list=None):
@@ -91,6 +184,7 @@ class TMAPClient:
             
             Raises:
                 json.JSONDecodeError: 응답이 JSON 형식이 아닐 경우 발생하는 예외.
+                QuotaExceededError: 경로 탐색 API 의 일일 호출 한도를 모두 사용한 경우 발생하는 예외.
 
             Example:
                 ```python
@@ -145,19 +239,72 @@ class TMAPClient:
             passList_str = "_".join(passList_lst)
             payload["passList"] = passList_str
 
-        response = requests.post(url, json=payload, headers=headers)
+        # 동일한 좌표/옵션의 경로는 캐시된 결과를 사용
+        cache_key = self.get_route_cache_key(payload)
+        if self.route_cache is not None:
+            cached_route = self.route_cache.get(cache_key)
+            if cached_route is not None:
+                return cached_route
+
+        # 동시에 들어온 동일한 경로 요청은 하나의 API 호출 결과를 공유
+        return self.single_flight.do(('route', cache_key), self._request_route, url, payload, headers, cache_key)
+
+
+    def _request_route(self, url: str, payload: dict, headers: dict, cache_key: str) -> dict:
+        """TMAP 경로 탐색 API 를 호출하고 정상 응답을 경로 캐시에 저장하는 함수."""
+        if not self.rate_limiter.acquire('route'):
+            return {}
+
+        try:
+            response = self.transport.post(url, json=payload, headers=headers)
+        except requests.RequestException as e:
+            print(f"Error: Request to TMAP API for route failed. ({e})")
+            return {}
 
         if response.status_code != 200:
             print(f"Error: Received status code {response.status_code} from TMAP API for route.")
-            return response.json()
+            print("Response content:", response.text)
+            return {}
 
         try:
-            return response.json()
+            route_data = response.json()
         except json.JSONDecodeError:
             print("Error: Response is not in JSON format.")
             print("Response content:", response.text)  # 응답 내용을 출력해 문제를 확인합니다.
             return {}
 
+        # 정상적인 경로 응답만 캐시에 저장
+        if self.route_cache is not None and route_data.get('features'):
+            self.route_cache.set(cache_key, route_data)
+
+        return route_data
+
+
+    @staticmethod
+    def get_route_cache_key(payload: dict) -> str:
+        """경로 탐색 요청 payload 로부터 경로 캐시 키를 생성하는 함수.
+
+        좌표는 소수점 COORD_PRECISION 자리로 정규화하고, 경로 결과에 영향을 주지 않는 
+        장소명(startName, endName) 등은 키에서 제외합니다.
+
+        Args:
+            payload (dict): get_route_data 의 요청 payload
+
+        Returns:
+            str: 캐시 키
+        """
+        key_data = {field: payload[field] for field in ROUTE_CACHE_KEY_FIELDS if field in payload}
+        for field in ('startX', 'startY', 'endX', 'endY'):
+            key_data[field] = normalize_coord(key_data[field])
+
+        if 'passList' in key_data:
+            key_data['passList'] = [
+                [normalize_coord(value) for value in via_point.split(',')]
+                for via_point in key_data['passList'].split('_')
+            ]
+
+        return make_cache_key(key_data)
+
 
     def get_optimized_route(self, start_poi:dict, end_poi:dict, via_pois: list = []) -> dict:
         """경유지 순서 최적화 API 호출"""
@@ -183,9 +330,26 @@ class TMAPClient:
         }
 
         # api 요청 
-        print('############### 경유지 순서 최적화 요청 ###############')
-        response = requests.post(url, json=data, headers=headers, verify=False)
-        result = response.json()
+        if not self.rate_limiter.acquire('routeOptimization'):
+            return {}
+
+        try:
+            response = self.transport.post(url, json=data, headers=headers, verify=False)
+        except requests.RequestException as e:
+            print(f"Error: Request to TMAP API for route optimization failed. ({e})")
+            return {}
+
+        if response.status_code != 200:
+            print(f"Error: Received status code {response.status_code} from TMAP API for route optimization.")
+            print("Response content:", response.text)
+            return {}
+
+        try:
+            result = response.json()
+        except json.JSONDecodeError:
+            print("Error: Response is not in JSON format.")
+            print("Response content:", response.text)  # 응답 내용을 출력해 문제를 확인합니다.
+            return {}
 
         return result
     
@@ -201,11 +365,5 @@ class TMAPClient:
             list[tuple]: 경로 좌표 정보(PolyLine) 리스트 
         """
 
-        polyline_points = []
-        _features = route_data['features']
-        for _feature in _features:
-            _geometry = _feature['geometry']
-            if _geometry['type'] == 'LineString':
-                polyline_points.extend([(coords[0], coords[1]) for coords in _geometry['coordinates']])
-
-        return polyline_points
\ No newline at end of file
+        polyline_points = parse_line_coordinates(route_data)
+        return [tuple(coords) for coords in polyline_points.tolist()]
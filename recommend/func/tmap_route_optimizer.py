@@ -5,9 +5,10 @@ from dotenv import load_dotenv
 from collections import defaultdict, OrderedDict
 import pandas as pd
 from itertools import combinations
-from sklearn.preprocessing import MinMaxScaler
 from tqdm import tqdm
 
+from recommend.func.normalization import min_max_normalize
+
 import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -208,8 +209,7 @@ class RouteOptimizer:
     def get_scaled_scores(self, route_list: list) -> list:
         """경로 리스트의 점수를 스케일링하여 총 점수 계산"""
         properties_data = [route['properties'] for route in route_list]
-        scaler = MinMaxScaler()
-        scaled_properties = scaler.fit_transform(pd.DataFrame(properties_data))
+        scaled_properties = min_max_normalize(pd.DataFrame(properties_data).to_numpy(dtype=float))
         scaled_scores = []
         for i in range(len(scaled_properties[0])):
             scaled_score = []
@@ -295,6 +295,7 @@ class RouteOptimizer:
 
             # 경유지 순서 최적화 요청 
             via_optimized_route = self.tmap_client.get_optimized_route(start_poi, end_poi, via_pois)
+            if not via_optimized_route: continue  # 요청 실패 또는 오류 응답
 
             properties = via_optimized_route['properties']
             features = via_optimized_route['features']
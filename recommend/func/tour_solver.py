@@ -0,0 +1,215 @@
+import numpy as np
+from itertools import permutations, islice
+
+BATCH_SIZE = 4096  # 한 번에 점수를 계산할 순열 수
+
+
+def score_tours(scores, tours) -> np.ndarray:
+    """여러 경로의 구간 점수 합을 한 번에 계산하는 함수.
+
+    Args:
+        scores: scores[i][j] 가 i → j 구간 점수인 N×N 행렬
+        tours: (T, L) 크기의 장소 인덱스 배열 (예: [[0, 2, 1, 3, 0], ...])
+
+    Returns:
+        np.ndarray: (T,) 크기의 경로 별 점수 합
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    tours = np.asarray(tours, dtype=np.intp)
+    return scores[tours[:, :-1], tours[:, 1:]].sum(axis=1)
+
+
+def tour_score(tour: tuple, scores) -> float:
+    """순환 경로(tour)의 구간 점수 합을 계산하는 함수.
+
+    Args:
+        tour (tuple): 장소 인덱스 순서 (예: (0, 2, 1, 3, 0))
+        scores: scores[i][j] 가 i → j 구간 점수인 N×N 행렬
+
+    Returns:
+        float: 구간 점수 합
+    """
+    return float(score_tours(scores, [tour])[0])
+
+
+def solve_brute_force(scores) -> tuple:
+    """출발지(0)를 제외한 장소들의 모든 순열을 평가하여 점수가 가장 높은 순환 경로를 찾는 함수. O(N!)
+
+    순열을 BATCH_SIZE 개씩 배열로 만들어 점수를 한 번에 계산합니다.
+
+    Args:
+        scores: scores[i][j] 가 i → j 구간 점수인 N×N 행렬
+
+    Returns:
+        tuple: (최적 경로 (0, ..., 0), 최적 점수)
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    num_places = len(scores)
+    best_route = None
+    best_score = float('-inf')
+
+    route_permutations = permutations(range(1, num_places))
+    while True:
+        batch = list(islice(route_permutations, BATCH_SIZE))
+        if not batch:
+            break
+        # 출발지(0)를 앞뒤에 추가해 순환 경로 형성
+        tours = np.zeros((len(batch), num_places + 1), dtype=np.intp)
+        tours[:, 1:-1] = np.array(batch, dtype=np.intp).reshape(len(batch), num_places - 1)
+        batch_scores = score_tours(scores, tours)
+
+        best_index = int(np.argmax(batch_scores))
+        if batch_scores[best_index] > best_score:
+            best_score = float(batch_scores[best_index])
+            best_route = tuple(int(place) for place in tours[best_index])
+
+    return best_route, best_score
+
+
+def solve_held_karp(scores) -> tuple:
+    """Held–Karp 동적 계획법(비트마스크)으로 점수가 가장 높은 순환 경로를 찾는 함수. O(N² · 2^N)
+
+    dp[mask, j] 는 출발지(0)에서 시작해 mask 에 포함된 장소를 모두 방문하고 j 에서 끝나는 경로의 최대 점수입니다.
+    방문한 장소 수가 같은 mask 들을 한 번에 배열 연산으로 계산합니다.
+
+    Args:
+        scores: scores[i][j] 가 i → j 구간 점수인 N×N 행렬
+
+    Returns:
+        tuple: (최적 경로 (0, ..., 0), 최적 점수)
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    num_places = len(scores)
+    if num_places <= 2:
+        return solve_brute_force(scores)
+
+    # 출발지를 제외한 장소 1..N-1 을 비트 0..N-2 로 표현
+    n = num_places - 1
+    num_masks = 1 << n
+    full_mask = num_masks - 1
+    inner_scores = scores[1:, 1:]
+
+    dp = np.full((num_masks, n), -np.inf)
+    parent = np.full((num_masks, n), -1, dtype=np.int64)
+    singles = np.arange(n)
+    dp[1 << singles, singles] = scores[0, 1:]
+
+    masks = np.arange(num_masks)
+    popcount = np.zeros(num_masks, dtype=np.int64)
+    for bit in range(n):
+        popcount += (masks >> bit) & 1
+
+    for visited in range(2, n + 1):
+        layer = masks[popcount == visited]
+        for k in range(n):
+            bit = 1 << k
+            layer_masks = layer[(layer & bit) != 0]
+            # k 를 마지막으로 방문하기 직전 상태(prev_masks)의 모든 j 에서 j → k 구간 점수를 더해 최댓값 선택
+            candidates = dp[layer_masks ^ bit] + inner_scores[:, k]
+            best_previous = np.argmax(candidates, axis=1)
+            dp[layer_masks, k] = candidates[np.arange(len(layer_masks)), best_previous]
+            parent[layer_masks, k] = best_previous
+
+    # 마지막 장소에서 출발지로 돌아오는 구간 추가
+    final_scores = dp[full_mask] + scores[1:, 0]
+    last = int(np.argmax(final_scores))
+    best_score = float(final_scores[last])
+
+    # 역추적으로 경로 복원
+    route = []
+    mask = full_mask
+    while last != -1:
+        route.append(last + 1)
+        previous = int(parent[mask, last])
+        mask ^= 1 << last
+        last = previous
+
+    return (0,) + tuple(reversed(route)) + (0,), best_score
+
+
+def solve_branch_and_bound(scores) -> tuple:
+    """분기 한정법(branch and bound)으로 점수가 가장 높은 순환 경로를 찾는 함수.
+
+    각 장소에서 나가는 구간 점수의 최댓값을 이용한 상한(bound)이 현재 최적 점수 이하인 분기는 탐색하지 않으며,
+    탐욕(greedy) 경로로 초기 최적 점수를 설정합니다.
+
+    Args:
+        scores: scores[i][j] 가 i → j 구간 점수인 N×N 행렬
+
+    Returns:
+        tuple: (최적 경로 (0, ..., 0), 최적 점수)
+    """
+    # 재귀 탐색에서는 배열 원소 접근보다 리스트 접근이 빠르므로 리스트로 변환
+    scores = np.asarray(scores, dtype=np.float64).tolist()
+    num_places = len(scores)
+    if num_places <= 2:
+        return solve_brute_force(scores)
+
+    # 장소 별로 나가는 구간 점수의 최댓값 (상한 계산용)
+    max_out = [max(scores[i][j] for j in range(num_places) if j != i) for i in range(num_places)]
+
+    # 탐욕 경로로 초기 해 설정
+    greedy = [0]
+    unvisited = set(range(1, num_places))
+    while unvisited:
+        next_place = max(sorted(unvisited), key=lambda j: scores[greedy[-1]][j])
+        greedy.append(next_place)
+        unvisited.remove(next_place)
+    best_route = tuple(greedy) + (0,)
+    best_score = sum(scores[best_route[k]][best_route[k + 1]] for k in range(num_places))
+
+    # 방문 순서 후보를 구간 점수 내림차순으로 미리 정렬
+    ordered_next = [sorted(range(1, num_places), key=lambda j: -scores[i][j]) for i in range(num_places)]
+
+    path = [0]
+    visited = [False] * num_places
+    visited[0] = True
+
+    def search(current_score: float, remaining_bound: float):
+        nonlocal best_route, best_score
+        last = path[-1]
+        if len(path) == num_places:
+            score = current_score + scores[last][0]
+            if score > best_score:
+                best_score = score
+                best_route = tuple(path) + (0,)
+            return
+
+        # 상한: 현재 점수 + 마지막 장소와 남은 장소들이 각각 나가는 구간 점수의 최댓값
+        if current_score + max_out[last] + remaining_bound <= best_score:
+            return
+
+        for j in ordered_next[last]:
+            if visited[j]:
+                continue
+            visited[j] = True
+            path.append(j)
+            search(current_score + scores[last][j], remaining_bound - max_out[j])
+            path.pop()
+            visited[j] = False
+
+    search(0.0, sum(max_out[1:]))
+    return best_route, best_score
+
+
+# 사용 가능한 순환 경로 탐색 방법
+TOUR_SOLVERS = {
+    'brute_force': solve_brute_force,
+    'held_karp': solve_held_karp,
+    'branch_and_bound': solve_branch_and_bound,
+}
+
+
+def solve_tour(scores, method: str = 'held_karp') -> tuple:
+    """지정한 방법으로 출발지(0)에서 시작해 모든 장소를 방문하고 돌아오는 최고 점수 경로를 찾는 함수.
+
+    Args:
+        scores: scores[i][j] 가 i → j 구간 점수인 N×N 행렬
+        method (str, optional): 'brute_force', 'held_karp', 'branch_and_bound' 중 하나. Defaults to 'held_karp'.
+
+    Returns:
+        tuple: (최적 경로 (0, ..., 0), 최적 점수)
+    """
+    if method not in TOUR_SOLVERS:
+        raise ValueError(f"Unknown tour solver '{method}'. Expected one of {list(TOUR_SOLVERS)}.")
+    return TOUR_SOLVERS[method](scores)
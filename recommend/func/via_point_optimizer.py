@@ -0,0 +1,226 @@
+from datetime import datetime, timedelta
+
+from recommend.func.route_matrix import RouteMatrixBuilder, RegionRouteMatrix, DEFAULT_MAX_WORKERS
+from recommend.func.route_parser import parse_line_coordinates
+
+TIME_FORMAT = '%Y%m%d%H%M%S'  # 응답의 arriveTime, completeTime 형식
+REQUEST_TIME_FORMAT = '%Y%m%d%H%M'  # 요청의 startTime, wishStartTime, wishEndTime 형식
+INFEASIBLE = float('inf')
+
+
+def _parse_request_time(value: str, start_time: datetime):
+    # 'YYYYMMDDHHMM' 시각을 출발 시각 기준 경과 시간(초)으로 변환 (빈 값은 None)
+    if not value:
+        return None
+    return (datetime.strptime(value, REQUEST_TIME_FORMAT) - start_time).total_seconds()
+
+
+def _leg_summary(route: dict) -> tuple:
+    # 구간 경로 데이터의 (소요 시간(초), 거리(m), 요금)
+    # 빈 응답이나 요약 정보가 없는 응답(요청 실패)은 갈 수 없는 구간으로 처리
+    try:
+        properties = route['features'][0]['properties']
+        return int(properties['totalTime']), int(properties['totalDistance']), int(properties['totalFare'])
+    except (KeyError, IndexError, TypeError, ValueError):
+        return INFEASIBLE, 0, 0
+
+
+def solve_via_point_order(travel_times: list, via_times: list, time_windows: list) -> tuple:
+    """출발지(0)에서 경유지(1..N)를 모두 방문하고 도착지(N+1)에 가장 빨리 도착하는 방문 순서를 찾는 함수.
+
+    dp[mask][k] 는 mask 의 경유지를 모두 방문하고 k 에서 체류(viaTime)를 마친 가장 이른 시각입니다.
+    희망 시작 시각 전에 도착하면 기다리고, 희망 종료 시각 이후에 도착하는 경우는 제외합니다.
+
+    Args:
+        travel_times (list): travel_times[i][j] 가 i → j 구간 소요 시간(초)인 (N+2)×(N+2) 행렬
+        via_times (list): 경유지 별 체류 시간(초) (길이 N)
+        time_windows (list): 경유지 별 (희망 시작, 희망 종료) 경과 시간(초) 튜플. 제한이 없으면 None (길이 N)
+
+    Returns:
+        tuple: (경유지 방문 순서 (1..N 의 순열), 도착지 도착 시각(초)). 가능한 순서가 없으면 (None, inf)
+    """
+    num_vias = len(via_times)
+    end = num_vias + 1
+    if num_vias == 0:
+        return (), travel_times[0][end]
+
+    def complete_time(k: int, arrival: float) -> float:
+        # 경유지 k 에 arrival 에 도착했을 때 체류를 마치는 시각
+        window_start, window_end = time_windows[k - 1] or (None, None)
+        if window_start is not None and arrival < window_start:
+            arrival = window_start
+        if window_end is not None and arrival > window_end:
+            return INFEASIBLE
+        return arrival + via_times[k - 1]
+
+    num_masks = 1 << num_vias
+    dp = [[INFEASIBLE] * (num_vias + 1) for _ in range(num_masks)]
+    parent = [[0] * (num_vias + 1) for _ in range(num_masks)]
+    for k in range(1, num_vias + 1):
+        dp[1 << (k - 1)][k] = complete_time(k, travel_times[0][k])
+
+    for mask in range(1, num_masks):
+        row = dp[mask]
+        for j in range(1, num_vias + 1):
+            current = row[j]
+            if current == INFEASIBLE:
+                continue
+            travel_from_j = travel_times[j]
+            for k in range(1, num_vias + 1):
+                bit = 1 << (k - 1)
+                if mask & bit:
+                    continue
+                completed = complete_time(k, current + travel_from_j[k])
+                if completed < dp[mask | bit][k]:
+                    dp[mask | bit][k] = completed
+                    parent[mask | bit][k] = j
+
+    full_mask = num_masks - 1
+    best_last, best_arrival = None, INFEASIBLE
+    for k in range(1, num_vias + 1):
+        arrival = dp[full_mask][k] + travel_times[k][end]
+        if arrival < best_arrival:
+            best_last, best_arrival = k, arrival
+    if best_last is None:
+        return None, INFEASIBLE
+
+    # 역추적으로 방문 순서 복원
+    order = []
+    mask, last = full_mask, best_last
+    while last:
+        order.append(last)
+        mask, last = mask ^ (1 << (last - 1)), parent[mask][last]
+    return tuple(reversed(order)), best_arrival
+
+
+class LocalRouteOptimizer:
+    """TMAPClient.get_optimized_route 를 대신하는 로컬 경유지 순서 최적화 클래스.
+
+    구간 경로(TMAP 경로 탐색 결과, 경로 캐시 사용)를 지역 행렬에 한 번씩만 수집해 소요 시간 행렬을 만들고,
+    경유지 체류 시간(viaTime)과 희망 방문 시각(wishStartTime, wishEndTime)을 고려해 방문 순서를 정합니다.
+    결과는 routeOptimization API 응답과 같은 FeatureCollection 형식이며, 경로 좌표는 구간 경로에서 가져옵니다.
+    """
+    def __init__(self, fetch_route, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Args:
+            fetch_route (callable): (start, end) 장소 정보를 받아 TMAP 경로 탐색 결과를 반환하는 함수.
+                예: TMAPClient.get_route_data
+            max_workers (int, optional): 구간 경로를 동시에 요청할 스레드 수. Defaults to 8.
+        """
+        self.route_matrix = RegionRouteMatrix(RouteMatrixBuilder(fetch_route, max_workers=max_workers))
+
+
+    @staticmethod
+    def to_places(start_poi: dict, end_poi: dict, via_pois: list) -> list:
+        """출발지/경유지/도착지 정보를 장소 정보(dict) 리스트 [출발지, 경유지..., 도착지] 로 변환하는 함수."""
+        start = {'name': start_poi.get('name', '출발'),
+                 'latitude': float(start_poi['latitude']), 'longitude': float(start_poi['longitude'])}
+        end = {'name': end_poi.get('name', '도착'),
+               'latitude': float(end_poi['latitude']), 'longitude': float(end_poi['longitude'])}
+        vias = [{'name': via_poi['viaPointName'], 'latitude': float(via_poi['viaY']), 'longitude': float(via_poi['viaX'])}
+                for via_poi in via_pois]
+        return [start] + vias + [end]
+
+
+    def prefetch(self, requests: list):
+        """여러 최적화 요청에 필요한 구간 경로를 한 번에 병렬로 수집하는 함수.
+
+        Args:
+            requests (list): (start_poi, end_poi, via_pois) 튜플 리스트
+        """
+        self.route_matrix.prefetch([self.to_places(*request) for request in requests])
+
+
+    def get_optimized_route(self, start_poi: dict, end_poi: dict, via_pois: list = [], start_time: str = None) -> dict:
+        """경유지 순서 최적화 (routeOptimization API 와 같은 입력/출력 형식)
+
+        Args:
+            start_poi (dict): 출발지 정보 ('latitude', 'longitude' 포함)
+            end_poi (dict): 도착지 정보 ('latitude', 'longitude' 포함)
+            via_pois (list): 경유지 리스트. 각 경유지는 'viaPointId', 'viaPointName', 'viaX', 'viaY',
+                'viaTime', 'wishStartTime', 'wishEndTime' 키를 포함.
+            start_time (str, optional): 출발 시각 ('YYYYMMDDHHMM'). Defaults to None (현재 시각).
+
+        Returns:
+            dict: routeOptimization 응답 형식의 경로. 구간 경로가 없거나 희망 방문 시각을 만족하는 순서가 없으면 빈 사전.
+        """
+        departure = datetime.strptime(start_time, REQUEST_TIME_FORMAT) if start_time \
+            else datetime.now().replace(second=0, microsecond=0)
+
+        places = self.to_places(start_poi, end_poi, via_pois)
+        legs = self.route_matrix.submatrix(places)
+        summaries = {pair: _leg_summary(route) for pair, route in legs.items()}
+        travel_times = [[summaries[(i, j)][0] if i != j else 0 for j in range(len(places))] for i in range(len(places))]
+
+        via_times = [int(via_poi.get('viaTime') or 0) for via_poi in via_pois]
+        time_windows = []
+        for via_poi in via_pois:
+            window = (_parse_request_time(via_poi.get('wishStartTime'), departure),
+                      _parse_request_time(via_poi.get('wishEndTime'), departure))
+            time_windows.append(window if window != (None, None) else None)
+
+        order, arrival = solve_via_point_order(travel_times, via_times, time_windows)
+        if order is None or arrival == INFEASIBLE:
+            # 구간 경로 요청이 실패했거나 희망 방문 시각을 만족하는 순서가 없으면 TMAPClient 와 같이 빈 사전 반환
+            return {}
+
+        return self.build_response(places, via_pois, order, legs, departure)
+
+
+    @staticmethod
+    def build_response(places: list, via_pois: list, order: tuple, legs: dict, departure: datetime) -> dict:
+        """방문 순서와 구간 경로로 routeOptimization API 응답 형식의 FeatureCollection 을 만드는 함수."""
+        end = len(places) - 1
+        start_point = {
+            'index': '0', 'viaPointId': '', 'viaPointName': '[0] 출발',
+            'arriveTime': departure.strftime(TIME_FORMAT), 'completeTime': departure.strftime(TIME_FORMAT),
+            'distance': '0', 'deliveryTime': '0', 'waitTime': '0', 'pointType': 'S'
+        }
+        features = [{'type': 'Feature', 'properties': start_point,
+                     'geometry': {'type': 'Point', 'coordinates': [places[0]['longitude'], places[0]['latitude']]}}]
+
+        total_time = total_distance = total_fare = 0
+        current_time = departure
+        previous = 0
+        for index, k in enumerate(order + (end,), start=1):
+            leg_time, leg_distance, leg_fare = _leg_summary(legs[(previous, k)])
+            total_time += leg_time
+            total_distance += leg_distance
+            total_fare += leg_fare
+
+            arrive_time = current_time + timedelta(seconds=leg_time)
+            if k == end:
+                via_poi, point_type, wait_time, delivery_time = {}, 'E', 0, 0
+                point_name = '도착'
+            else:
+                via_poi, point_type = via_pois[k - 1], f'B{index}'
+                wish_start = _parse_request_time(via_poi.get('wishStartTime'), departure)
+                elapsed = (arrive_time - departure).total_seconds()
+                wait_time = max(0, int(wish_start - elapsed)) if wish_start is not None else 0
+                delivery_time = int(via_poi.get('viaTime') or 0)
+                point_name = via_poi['viaPointName']
+            complete_time = arrive_time + timedelta(seconds=wait_time + delivery_time)
+
+            point_properties = {
+                'index': str(index), 'viaPointId': via_poi.get('viaPointId', ''), 'viaPointName': f'[0] {point_name}',
+                'arriveTime': arrive_time.strftime(TIME_FORMAT), 'completeTime': complete_time.strftime(TIME_FORMAT),
+                'distance': str(leg_distance), 'deliveryTime': str(delivery_time), 'waitTime': str(wait_time),
+                'pointType': point_type
+            }
+            if k != end:
+                point_properties.update(viaDetailAddress=via_poi.get('viaDetailAddress', ''), groupKey='0')
+            line_properties = dict(point_properties, time=str(leg_time), Fare=str(leg_fare), poiId=via_poi.get('viaPoiId', ''))
+
+            features.append({'type': 'Feature', 'properties': point_properties,
+                             'geometry': {'type': 'Point', 'coordinates': [places[k]['longitude'], places[k]['latitude']]}})
+            features.append({'type': 'Feature', 'properties': line_properties,
+                             'geometry': {'type': 'LineString',
+                                          'coordinates': parse_line_coordinates(legs[(previous, k)]).tolist()}})
+            current_time = complete_time
+            previous = k
+
+        return {
+            'type': 'FeatureCollection',
+            'properties': {'totalDistance': str(total_distance), 'totalTime': str(total_time), 'totalFare': str(total_fare)},
+            'features': features
+        }
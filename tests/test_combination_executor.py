@@ -0,0 +1,104 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from recommend.func.combination_executor import CombinationExecutor
+from recommend.func.tour_solver import solve_tour
+
+
+def slow_square(x):
+    # 완료 순서가 입력 순서와 다르도록 큰 값일수록 빨리 끝남
+    time.sleep(0.001 * (10 - x % 10))
+    return None if x % 7 == 3 else x * x
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_map_keeps_input_order_and_drops_none(max_workers):
+    executor = CombinationExecutor(max_workers=max_workers, process_workers=0)
+
+    assert executor.map(slow_square, list(range(30))) == [x * x for x in range(30) if x % 7 != 3]
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_map_top_k_matches_sorted_results(max_workers):
+    executor = CombinationExecutor(max_workers=max_workers, process_workers=0)
+    items = list(range(30))
+
+    result = executor.map_top_k(slow_square, items, top_k=5, key=lambda value: -abs(value - 200))
+
+    expected = sorted((x * x for x in items if x % 7 != 3), key=lambda value: -abs(value - 200), reverse=True)[:5]
+    assert result == expected
+
+
+def test_iter_top_k_yields_improving_snapshots():
+    executor = CombinationExecutor(max_workers=4, process_workers=0)
+
+    snapshots = list(executor.iter_top_k(slow_square, list(range(30)), top_k=3, key=lambda value: value))
+
+    assert snapshots[-1] == [29 * 29, 28 * 28, 27 * 27]
+    for snapshot in snapshots:
+        assert len(snapshot) <= 3 and snapshot == sorted(snapshot, reverse=True)
+    # 각 순위의 값은 줄어들지 않음
+    for before, after in zip(snapshots, snapshots[1:]):
+        assert all(a >= b for a, b in zip(after, before))
+
+
+class LazyItems:
+    """PlaceCombinations 와 같이 길이를 알고 원소를 순서대로 만드는 시퀀스"""
+    def __init__(self, size: int):
+        self.size = size
+        self.consumed = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for i in range(self.size):
+            self.consumed += 1
+            yield i
+
+
+def test_in_flight_work_is_bounded():
+    executor = CombinationExecutor(max_workers=2, process_workers=0)
+    items = LazyItems(1000)
+    lock = threading.Lock()
+    ahead = []
+
+    def work(i):
+        with lock:
+            ahead.append(items.consumed - i)
+        return i
+
+    assert executor.map(work, items) == list(range(1000))
+    # 입력은 완료된 만큼만 가져오므로 처리 중인 원소보다 최대 2 × max_workers 개까지 앞서 소비
+    assert max(ahead) <= 2 * executor.max_workers
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_cancel_stops_remaining_work(max_workers):
+    executor = CombinationExecutor(max_workers=max_workers, process_workers=0)
+    cancel_event = threading.Event()
+    calls = []
+
+    def work(i):
+        calls.append(i)
+        if len(calls) >= 5:
+            cancel_event.set()
+        return i
+
+    result = executor.map(work, list(range(100)), cancel_event=cancel_event)
+
+    assert len(calls) < 100
+    assert len(result) <= len(calls)
+
+
+def test_process_pool_solver_matches_in_process_solver():
+    scores = np.random.default_rng(0).random((6, 6))
+    np.fill_diagonal(scores, 0)
+
+    with CombinationExecutor(max_workers=1, process_workers=1, process_threshold=2) as executor:
+        route, score = executor.solve_tour(scores)
+
+    assert (route, score) == solve_tour(scores)
@@ -0,0 +1,129 @@
+import random
+import threading
+from itertools import combinations
+
+import pytest
+
+from recommend.func.combination_executor import CombinationExecutor
+from recommend.func.combination_search import (DEFAULT_MAX_SPEED, CombinationSearch, haversine_matrix, mst_length,
+                                               place_coords, travel_time_lower_bound)
+
+ANCHORS = [[36.46, 127.12]]
+
+
+def random_places(num_places: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [{'name': f'place{i}', '최종점수': rng.uniform(0, 3),
+             'latitude': 36.4 + rng.uniform(0, 0.2), 'longitude': 127.0 + rng.uniform(0, 0.2)}
+            for i in range(num_places)]
+
+
+def make_evaluate(search: CombinationSearch, seed: int):
+    # 실제 이동 시간은 직선 거리 하한보다 항상 길게 (상한이 유효하도록) 평가 순서와 관계없이 조합 별로 고정
+    def evaluate(places):
+        key = tuple(place['name'] for place in places)
+        if key[0] == 'place0' and key[-1] == 'place9':
+            return None  # 경로를 만들 수 없는 조합
+        lower_bound = travel_time_lower_bound(ANCHORS + place_coords(places), search.max_speed)
+        detour = 1 + random.Random(f'{seed}:{key}').uniform(0, 2)
+        return search.combination_value(places, lower_bound * detour), key
+    return evaluate
+
+
+def exhaustive_top_k(place_combinations: list, evaluate, top_k: int) -> list:
+    evaluations = [evaluate(places) for places in place_combinations]
+    return sorted(evaluation for evaluation in evaluations if evaluation is not None)[::-1][:top_k]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_search_matches_exhaustive_evaluation(seed):
+    search = CombinationSearch(top_k=3)
+    evaluate = make_evaluate(search, seed)
+    place_combinations = [list(combination) for combination in combinations(random_places(10, seed), 3)]
+    expected = exhaustive_top_k(place_combinations, evaluate, 3)
+
+    result = search.search(place_combinations, evaluate, anchors=ANCHORS)
+
+    assert [value for value, _, _ in result] == pytest.approx([value for value, _ in expected])
+    assert [key for _, _, key in result] == [key for _, key in expected]
+    assert search.stats()['evaluated'] + search.stats()['pruned'] == len(place_combinations)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_pruning_skips_combinations(seed):
+    # 장소 점수 차이가 이동 시간보다 커서 상한만으로 대부분의 조합을 제외할 수 있는 경우
+    places = random_places(12, seed)
+    for i, place in enumerate(places):
+        place['최종점수'] = 10 * i
+    search = CombinationSearch(top_k=3)
+    evaluate = make_evaluate(search, seed)
+    place_combinations = [list(combination) for combination in combinations(places, 3)]
+    expected = exhaustive_top_k(place_combinations, evaluate, 3)
+
+    result = search.search(place_combinations, evaluate, anchors=ANCHORS)
+
+    assert [key for _, _, key in result] == [key for _, key in expected]
+    assert search.stats()['pruned'] > len(place_combinations) // 2
+
+
+def test_anchors_tighten_the_bound():
+    places = random_places(3, seed=0)
+    search = CombinationSearch(top_k=1)
+
+    without_anchors = search.optimistic_value(places)
+    with_anchors = search.optimistic_value(places, ANCHORS)
+
+    assert with_anchors <= without_anchors
+    assert with_anchors == pytest.approx(search.combination_value(
+        places, travel_time_lower_bound(ANCHORS + place_coords(places))
+    ))
+
+
+def test_lower_bound_uses_highway_speed():
+    # 고속도로 최고 제한 속도(120km/h)로 직선 이동해도 하한보다 빠를 수 없어야 함
+    coords = [[36.3504, 127.3845], [37.5665, 126.9780], [36.4800, 127.2890]]
+    distances = haversine_matrix(coords)
+
+    assert DEFAULT_MAX_SPEED * 3.6 >= 130
+    assert travel_time_lower_bound(coords) == pytest.approx(mst_length(distances) / DEFAULT_MAX_SPEED)
+    assert travel_time_lower_bound(coords) < mst_length(distances) / (120 / 3.6)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_parallel_search_matches_serial_search(seed):
+    places = random_places(12, seed)
+    for i, place in enumerate(places):
+        place['최종점수'] = 10 * i
+    place_combinations = [list(combination) for combination in combinations(places, 3)]
+    serial = CombinationSearch(top_k=3)
+    parallel = CombinationSearch(top_k=3)
+
+    expected = serial.search(place_combinations, make_evaluate(serial, seed), anchors=ANCHORS)
+    result = parallel.search(place_combinations, make_evaluate(parallel, seed), anchors=ANCHORS,
+                             executor=CombinationExecutor(max_workers=4, process_workers=0))
+
+    assert [key for _, _, key in result] == [key for _, _, key in expected]
+    assert [value for value, _, _ in result] == pytest.approx([value for value, _, _ in expected])
+    # 묶음 단위로 평가하므로 순차 탐색보다 최대 (max_workers - 1) 개 더 평가할 수 있음
+    assert serial.stats()['evaluated'] <= parallel.stats()['evaluated'] <= serial.stats()['evaluated'] + 3
+    assert parallel.stats()['pruned'] > 0
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_search_stops_when_cancelled(max_workers):
+    search = CombinationSearch(top_k=3)
+    cancel_event = threading.Event()
+    evaluate = make_evaluate(search, seed=0)
+
+    def cancelling_evaluate(places):
+        cancel_event.set()
+        return evaluate(places)
+
+    place_combinations = [list(combination) for combination in combinations(random_places(10, seed=1), 3)]
+    result = search.search(place_combinations, cancelling_evaluate, anchors=ANCHORS,
+                           executor=CombinationExecutor(max_workers=max_workers, process_workers=0),
+                           cancel_event=cancel_event)
+
+    # 첫 묶음만 평가하고 종료
+    assert search.stats()['evaluated'] <= max_workers
+    assert len(result) <= search.stats()['evaluated']
@@ -0,0 +1,99 @@
+import os
+
+import pandas as pd
+import pytest
+
+from recommend.func.dataset_cache import DatasetCache
+
+pytest.importorskip('pyarrow')
+
+CSV = '목적지명,분류,지역,최종점수\n솥뚜껑매운탕,식당,공주,2.52\n곰골식당,식당,공주,2.42\n카페A,카페,부여,1.5\n'
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / 'places.csv'
+    path.write_text(CSV, encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DatasetCache(cache_dir=str(tmp_path / 'cache'))
+
+
+def test_cached_read_matches_read_csv(cache, csv_path):
+    first = cache.read_csv(csv_path)
+    second = cache.read_csv(csv_path)
+
+    pd.testing.assert_frame_equal(first, pd.read_csv(csv_path))
+    pd.testing.assert_frame_equal(second, pd.read_csv(csv_path))
+    assert cache.stats() == {'hits': 1, 'misses': 1}
+    assert os.path.exists(cache.cache_path(csv_path))
+
+
+def test_categorical_columns(cache, csv_path):
+    data = cache.read_csv(csv_path, categorical=['분류'])
+
+    assert isinstance(data['분류'].dtype, pd.CategoricalDtype)
+    assert data['지역'].dtype == pd.read_csv(csv_path)['지역'].dtype
+    assert data['분류'].astype(str).tolist() == ['식당', '식당', '카페']
+
+
+def test_content_change_invalidates_cache(cache, csv_path):
+    cache.read_csv(csv_path)
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.write('카페B,카페,부여,1.2\n')
+
+    data = cache.read_csv(csv_path)
+
+    assert data['목적지명'].tolist()[-1] == '카페B'
+    assert cache.stats() == {'hits': 0, 'misses': 2}
+
+
+def test_same_size_content_change_invalidates_cache(cache, csv_path):
+    cache.read_csv(csv_path)
+    stat = os.stat(csv_path)
+    with open(csv_path, 'w', encoding='utf-8') as f:
+        f.write(CSV.replace('2.52', '3.52'))
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    data = cache.read_csv(csv_path)
+
+    assert os.stat(csv_path).st_size == stat.st_size
+    assert data['최종점수'].tolist()[0] == 3.52
+    assert cache.stats() == {'hits': 0, 'misses': 2}
+
+
+def test_touched_file_with_same_content_refreshes_metadata(cache, csv_path):
+    cache.read_csv(csv_path)
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    # 내용 해시가 같으면 다시 변환하지 않고, 갱신된 메타데이터로 다음 읽기는 해시 없이 적중
+    cache.read_csv(csv_path)
+    table = cache.read_table(csv_path)
+
+    assert cache.stats() == {'hits': 2, 'misses': 1}
+    assert table.schema.metadata[b'source_mtime_ns'] == str(stat.st_mtime_ns + 10 ** 9).encode()
+
+
+def test_read_options_use_separate_cache_files(cache, csv_path):
+    cache.read_csv(csv_path)
+    data = cache.read_csv(csv_path, usecols=['목적지명', '최종점수'])
+
+    assert data.columns.tolist() == ['목적지명', '최종점수']
+    assert cache.cache_path(csv_path) != cache.cache_path(csv_path, {'usecols': ['목적지명', '최종점수']})
+    assert cache.stats() == {'hits': 0, 'misses': 2}
+
+
+def test_corrupt_cache_file_is_rebuilt(cache, csv_path):
+    cache.read_csv(csv_path)
+    with open(cache.cache_path(csv_path), 'wb') as f:
+        f.write(b'not an arrow file')
+
+    pd.testing.assert_frame_equal(cache.read_csv(csv_path), pd.read_csv(csv_path))
+    assert cache.stats() == {'hits': 0, 'misses': 2}
+
+    cache.clear()
+    assert not os.listdir(cache.cache_dir)
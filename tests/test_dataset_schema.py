@@ -0,0 +1,78 @@
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from recommend.func import dataset_cache
+from recommend.func.dataset_schema import DATA_DIR, DATASET_SCHEMAS, dataset_kind, get_schema, read_dataset
+
+pytest.importorskip('pyarrow')
+
+DATASET_PATHS = sorted(glob.glob(os.path.join(DATA_DIR, '*.csv')))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    # 공용 캐시를 테스트 별 디렉터리로 교체
+    monkeypatch.setattr(dataset_cache, 'dataset_cache', dataset_cache.DatasetCache(cache_dir=str(tmp_path)))
+    return dataset_cache.dataset_cache
+
+
+@pytest.mark.parametrize('path, kind', [
+    ('./data/tt_togo_count.csv', 'togo_count'),
+    ('data/g_fest_not_togo_count.csv', 'fest_not_togo_count'),
+    ('b_wkd_visit_count.csv', 'wkd_visit_count'),
+    ('tt_bj_navi_전처리데이터.csv', 'bj_navi_전처리데이터'),
+    ('추천장소통합리스트.csv', '추천장소통합리스트'),
+])
+def test_dataset_kind(path, kind):
+    assert dataset_kind(path) == kind
+
+
+def test_get_schema_returns_a_copy():
+    schema = get_schema('g_togo_count.csv')
+    schema['방문건수'] = 'float64'
+
+    assert get_schema('g_togo_count.csv') == DATASET_SCHEMAS['togo_count']
+    assert get_schema('추천장소통합리스트.csv') == {}
+
+
+@pytest.mark.parametrize('path', DATASET_PATHS, ids=os.path.basename)
+def test_read_dataset_round_trip(path, isolated_cache):
+    schema = {column: dtype for column, dtype in get_schema(path).items() if column in pd.read_csv(path, nrows=0)}
+    expected = pd.read_csv(path, dtype=schema)
+
+    first = read_dataset(path)
+    second = read_dataset(path)  # 캐시 파일에서 읽음
+
+    assert isolated_cache.stats() == {'hits': 1, 'misses': 1}
+    for data in (first, second):
+        assert data.columns.tolist() == expected.columns.tolist()
+        for column, dtype in schema.items():
+            if dtype == 'category':
+                assert isinstance(data[column].dtype, pd.CategoricalDtype)
+            else:
+                assert data[column].dtype == expected[column].dtype == np.dtype(dtype)
+        for column in expected.columns:
+            if isinstance(expected[column].dtype, pd.CategoricalDtype):
+                assert data[column].astype(object).tolist() == expected[column].astype(object).tolist()
+            elif column in schema:
+                np.testing.assert_array_equal(data[column].to_numpy(), expected[column].to_numpy())
+            else:
+                pd.testing.assert_series_equal(data[column], expected[column])
+
+
+def test_schema_values_fit_their_dtypes():
+    # 정수/float32 로 줄인 컬럼이 원래 값을 잃지 않는지 확인
+    for path in DATASET_PATHS:
+        original = pd.read_csv(path)
+        data = read_dataset(path)
+        for column, dtype in get_schema(path).items():
+            if column not in original or dtype == 'category':
+                continue
+            if dtype == 'float32' and column.endswith('좌표'):
+                np.testing.assert_allclose(data[column].astype(np.float64), original[column], atol=1e-5)
+            else:
+                np.testing.assert_array_equal(data[column].astype(np.float64), original[column].astype(np.float64))
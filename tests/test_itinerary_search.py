@@ -0,0 +1,84 @@
+import random
+from itertools import combinations, permutations
+
+import pytest
+
+from recommend.func.itinerary_search import ItinerarySearch
+
+
+def random_instance(num_nodes: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    points = [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(num_nodes)]
+    travel_times = [[600 * ((ax - bx) ** 2 + (ay - by) ** 2) ** 0.5 for bx, by in points] for ax, ay in points]
+    scores = [0.0] + [rng.uniform(1, 5) for _ in range(num_nodes - 1)]
+    # 반드시 방문할 장소(마지막)만 다녀와도 예산이 남도록 설정
+    budget = travel_times[0][-1] + travel_times[-1][0] + 600 + 6000
+    return {'travel_times': travel_times, 'scores': scores, 'budget': budget,
+            'dwell_times': [0] + [600] * (num_nodes - 1), 'required': (num_nodes - 1,)}
+
+
+def best_score(instance: dict) -> float:
+    # 방문할 장소 집합과 순서를 모두 확인
+    search = ItinerarySearch(**instance)
+    others = [node for node in range(1, len(instance['scores'])) if node not in instance['required']]
+    best = float('-inf')
+    for size in range(len(others) + 1):
+        for nodes in combinations(others, size):
+            for route in permutations(nodes + instance['required']):
+                if search.route_time(list(route)) <= instance['budget']:
+                    best = max(best, search.route_score(list(route)))
+    return best
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_search_returns_feasible_itineraries(seed):
+    instance = random_instance(7, seed)
+
+    results = ItinerarySearch(**instance, max_iterations=300, time_limit=10, seed=seed).search(top_k=3)
+
+    # 휴리스틱이므로 최적해 이하의 실행 가능한 일정만 확인
+    assert 0 < results[0][0] <= best_score(instance) + 1e-9
+    for score, route_time, route in results:
+        assert instance['required'][0] in route
+        assert route_time <= instance['budget']
+    assert [score for score, _, _ in results] == sorted((score for score, _, _ in results), reverse=True)
+    assert len({frozenset(route) for _, _, route in results}) == len(results)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_search_visits_every_place_within_large_budget(seed):
+    instance = dict(random_instance(7, seed), budget=10 ** 6)
+
+    results = ItinerarySearch(**instance, max_iterations=50, time_limit=10, seed=seed).search()
+
+    assert results[0][0] == pytest.approx(best_score(instance)) == pytest.approx(sum(instance['scores']))
+
+
+def test_search_respects_limits():
+    instance = dict(random_instance(9, seed=0), budget=10 ** 6)
+    categories = ['출발지'] + ['카페', '카페', '식당', '식당', '관광지', '관광지', '관광지'] + ['축제장소']
+
+    results = ItinerarySearch(**instance, categories=categories, category_limits={'카페': 1, '식당': 1},
+                              max_stops=4, max_iterations=100, time_limit=10, seed=0).search(top_k=3)
+
+    for _, _, route in results:
+        assert len(route) <= 4
+        assert sum(categories[node] == '카페' for node in route) <= 1
+        assert sum(categories[node] == '식당' for node in route) <= 1
+
+
+def test_search_is_reproducible_with_seed_and_max_iterations():
+    instance = random_instance(12, seed=0)
+
+    first = ItinerarySearch(**instance, max_iterations=100, time_limit=10, seed=7).search(top_k=3)
+    second = ItinerarySearch(**instance, max_iterations=100, time_limit=10, seed=7).search(top_k=3)
+
+    assert first == second
+
+
+def test_search_returns_nothing_when_required_places_exceed_budget():
+    instance = random_instance(7, seed=0)
+    required = instance['required'][0]
+    instance['budget'] = instance['travel_times'][0][required] + instance['travel_times'][required][0]
+
+    assert ItinerarySearch(**instance, max_iterations=10, time_limit=10, seed=0).search(top_k=3) == []
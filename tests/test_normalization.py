@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from recommend.func.normalization import min_max_normalize, normalize, rank_normalize, z_score_normalize
+
+preprocessing = pytest.importorskip('sklearn.preprocessing')
+stats = pytest.importorskip('scipy.stats')
+
+
+def random_properties(num_routes: int, seed: int) -> np.ndarray:
+    # (거리, 시간, 요금, 장소 점수) 열. 요금은 대부분 0 인 상수 열
+    rng = np.random.default_rng(seed)
+    return np.column_stack([
+        rng.integers(1000, 100000, num_routes),
+        rng.integers(60, 10000, num_routes),
+        np.zeros(num_routes),
+        rng.uniform(0, 10, num_routes),
+    ]).astype(np.float64)
+
+
+@pytest.mark.parametrize('num_routes', [1, 2, 5, 50])
+@pytest.mark.parametrize('seed', range(5))
+def test_min_max_matches_sklearn(num_routes, seed):
+    values = random_properties(num_routes, seed)
+
+    expected = preprocessing.MinMaxScaler().fit_transform(values)
+    result = min_max_normalize(values)
+
+    np.testing.assert_array_equal(result, expected)
+    # 기존 코드와 같이 소수점 3자리로 반올림한 점수도 같음
+    np.testing.assert_array_equal(np.round(result, 3), np.round(expected, 3))
+
+
+def test_min_max_constant_columns_are_zero():
+    values = [[5, 1, 0], [5, 2, 0], [5, 3, 0]]
+
+    expected = preprocessing.MinMaxScaler().fit_transform(np.asarray(values, dtype=np.float64))
+
+    np.testing.assert_array_equal(min_max_normalize(values), expected)
+    np.testing.assert_array_equal(min_max_normalize(values)[:, [0, 2]], 0.0)
+
+
+def test_min_max_accepts_numeric_strings_and_axis():
+    values = [['68969', '5483', '0'], ['54176', '3437', '0']]
+
+    np.testing.assert_allclose(min_max_normalize(values), [[1.0, 1.0, 0.0], [0.0, 0.0, 0.0]])
+    np.testing.assert_array_equal(min_max_normalize([[1, 3, 2]], axis=1), [[0.0, 1.0, 0.5]])
+    assert min_max_normalize([]).shape == (0,)
+
+
+def test_z_score_matches_scipy():
+    values = random_properties(20, seed=0)
+
+    result = z_score_normalize(values)
+
+    np.testing.assert_allclose(result[:, [0, 1, 3]], stats.zscore(values[:, [0, 1, 3]], axis=0))
+    np.testing.assert_array_equal(result[:, 2], 0.0)
+
+
+def test_rank_uses_average_ranks():
+    values = np.array([[3.0, 1.0], [1.0, 1.0], [3.0, 1.0], [2.0, 1.0]])
+
+    ranks = stats.rankdata(values[:, 0])
+    expected = (ranks - ranks.min()) / (ranks.max() - ranks.min())
+
+    np.testing.assert_allclose(rank_normalize(values)[:, 0], expected)
+    np.testing.assert_array_equal(rank_normalize(values)[:, 1], 0.0)
+
+
+def test_normalize_dispatch():
+    values = random_properties(10, seed=1)
+
+    np.testing.assert_array_equal(normalize(values), min_max_normalize(values))
+    np.testing.assert_array_equal(normalize(values, 'rank'), rank_normalize(values))
+    with pytest.raises(ValueError):
+        normalize(values, 'log')
@@ -0,0 +1,107 @@
+import math
+
+import numpy as np
+import pytest
+
+from recommend.func.combination_search import CombinationSearch
+from recommend.func.pareto import ROUTE_OBJECTIVES, pareto_front, select_pareto_routes
+from recommend.func.place_data_manager import PlaceDataManager
+from recommend.func.route_optimizer import RouteOptimizer
+
+
+def brute_force_front(values: np.ndarray, maximize: list) -> list:
+    costs = np.where(maximize, -values, values)
+    return [i for i, cost in enumerate(costs)
+            if not any(np.all(other <= cost) and np.any(other < cost) for other in costs)]
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_pareto_front_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    # 중복 값이 생기도록 작은 정수 범위에서 생성
+    values = rng.integers(0, 5, size=(40, 4)).astype(np.float64)
+    maximize = [False, False, False, True]
+
+    assert pareto_front(values, maximize).tolist() == brute_force_front(values, maximize)
+
+
+def route(distance, time, fare, place_score, route_score=0.0) -> dict:
+    return {'properties': {'totalDistance': distance, 'totalTime': time, 'totalFare': fare,
+                           'placeScore': place_score, 'routeScore': route_score}}
+
+
+def test_route_objectives_use_place_score():
+    assert [key for key, _ in ROUTE_OBJECTIVES] == ['totalDistance', 'totalTime', 'totalFare', 'placeScore']
+
+    routes = [route(10, 10, 0, 5.0, route_score=0.1), route(10, 10, 0, 4.0, route_score=3.9)]
+    result = select_pareto_routes(routes)
+
+    # 이동 비용이 반영된 routeScore 가 높아도 같은 거리/시간에서 장소 점수가 낮으면 지배됨
+    assert [r['properties']['placeScore'] for r in result['front']] == [5.0]
+
+
+def test_weights_change_selection_only():
+    routes = [route(10, 100, 0, 1.0), route(20, 200, 0, 2.0), route(30, 300, 0, 3.0), route(30, 300, 0, 2.5)]
+
+    by_place_score = select_pareto_routes(routes, {'placeScore': 1.0})
+    by_time = select_pareto_routes(routes, {'totalTime': 1.0})
+
+    assert by_place_score['selected']['properties']['placeScore'] == 3.0
+    assert by_time['selected']['properties']['totalTime'] == 100
+    assert len(by_place_score['front']) == len(by_time['front']) == 3
+    assert select_pareto_routes([])['front'] == [] and select_pareto_routes([])['selected'] is None
+
+
+def test_combination_search_without_top_k_keeps_every_combination():
+    places = [[{'최종점수': score, 'latitude': 36.4 + score / 100, 'longitude': 127.0}] for score in range(6)]
+    search = CombinationSearch(top_k=None)
+
+    result = search.search(places, lambda combination: (combination[0]['최종점수'], combination))
+
+    assert [value for value, _, _ in result] == [5, 4, 3, 2, 1, 0]
+    assert search.stats() == {'evaluated': 6, 'pruned': 0}
+
+
+class FakeTMAPClient:
+    """직선 거리로 경로를 만드는 TMAPClient 대체 클래스"""
+    POI = {'name': '출발지', 'latitude': '36.46', 'longitude': '127.12'}
+
+    def get_poi(self, keyword, region=None):
+        return dict(self.POI, name=keyword)
+
+    def get_route_data(self, start, end, passList=None):
+        points = [start] + (passList or []) + [end]
+        points = [point if point.get('latitude') is not None else self.get_poi(point['name']) for point in points]
+        coordinates = [[float(point['longitude']), float(point['latitude'])] for point in points]
+        distance = int(sum(math.dist(a, b) for a, b in zip(coordinates, coordinates[1:])) * 100000)
+        features = [{'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': coordinates[0]},
+                     'properties': {'totalDistance': distance, 'totalTime': distance // 10, 'totalFare': 0,
+                                    'pointIndex': 0, 'pointType': 'S', 'description': '출발'}}]
+        for i, coordinate in enumerate(coordinates[1:-1], start=1):
+            features.append({'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': coordinate},
+                             'properties': {'pointIndex': i, 'pointType': f'B{i}', 'description': '경유지'}})
+        features.append({'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': coordinates[-1]},
+                         'properties': {'pointIndex': len(coordinates) - 1, 'pointType': 'E', 'description': '도착'}})
+        features.append({'type': 'Feature', 'geometry': {'type': 'LineString', 'coordinates': coordinates},
+                         'properties': {'description': '도로 구간'}})
+        return {'type': 'FeatureCollection', 'features': features}
+
+
+@pytest.fixture(scope='module')
+def route_optimizer():
+    return RouteOptimizer(FakeTMAPClient(), PlaceDataManager(), max_workers=1, combination_workers=1, process_workers=0)
+
+
+@pytest.mark.parametrize('prune_combinations', [False, True])
+def test_tsp_routes_carry_place_score(route_optimizer, prune_combinations):
+    region = '공주'
+    routes = route_optimizer.get_top_k_routes_tsp('출발지', '출발지', region, '축제장소', comb=2, comb_k=2, top_k=None,
+                                                   prune_combinations=prune_combinations)
+
+    assert len(routes) == 4  # 카페 2 × 식당 2, top_k=None 이면 생략 없이 모든 조합
+    for candidate in routes:
+        names = [point['pointName'] for point in candidate['points'][1:-1] if point['pointName'] != '축제장소']
+        assert candidate['properties']['placeScore'] == pytest.approx(
+            route_optimizer.calculate_place_score(names, region)
+        )
+    assert select_pareto_routes(routes)['selected'] is not None
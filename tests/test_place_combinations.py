@@ -0,0 +1,49 @@
+import math
+from itertools import combinations, product
+
+import pandas as pd
+import pytest
+
+from recommend.func.place_combinations import PlaceCombinations, unrank_combination
+
+
+@pytest.mark.parametrize('n, r', [(1, 0), (1, 1), (5, 2), (6, 3), (7, 7), (9, 4)])
+def test_unrank_combination_matches_itertools(n, r):
+    expected = list(combinations(range(n), r))
+
+    assert [unrank_combination(rank, n, r) for rank in range(math.comb(n, r))] == expected
+
+
+@pytest.fixture
+def place_combinations():
+    data = pd.DataFrame({'name': [f'place{i}' for i in range(9)], 'category': ['카페'] * 3 + ['식당'] * 2 + ['관광지'] * 4})
+    groups = [([0, 1, 2], 1), ([3, 4], 1), ([5, 6, 7, 8], 2)]
+    expected = [sum(parts, ()) for parts in product(*(combinations(rows, r) for rows, r in groups))]
+    return PlaceCombinations(data, groups), expected
+
+
+def test_place_combinations_matches_itertools(place_combinations):
+    sequence, expected = place_combinations
+
+    assert len(sequence) == len(expected)
+    assert list(sequence) == expected
+    assert [sequence[i] for i in range(len(sequence))] == expected
+    assert sequence[-1] == expected[-1]
+
+
+def test_place_combinations_slices_and_shards(place_combinations):
+    sequence, expected = place_combinations
+
+    assert list(sequence[5:20:3]) == expected[5:20:3]
+    shards = [list(sequence.shard(index, 4)) for index in range(4)]
+    assert sorted(sum(shards, [])) == sorted(expected)
+    assert shards[1] == expected[1::4]
+    with pytest.raises(ValueError):
+        sequence.shard(4, 4)
+
+
+def test_place_combinations_records(place_combinations):
+    sequence, _ = place_combinations
+
+    assert [place['name'] for place in sequence.records(sequence[0])] == ['place0', 'place3', 'place5', 'place6']
+    assert sequence.rows() == list(range(9))
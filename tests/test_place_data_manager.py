@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from recommend.func.place_data_manager import PlaceDataManager
+
+
+def legacy_filtered_places(place_data: pd.DataFrame, region: str, category: str, top_k: int) -> pd.DataFrame:
+    # 인덱스 도입 전 get_filtered_places
+    filtered_data = place_data[(place_data['region'] == region) & (place_data['category'] == category)]
+    return filtered_data.nlargest(top_k, '최종점수')
+
+
+def legacy_place_score(place_data: pd.DataFrame, name: str, region: str) -> float:
+    # 인덱스 도입 전 calculate_place_score 의 장소 별 조회
+    return float(place_data[(place_data['region'] == region) & (place_data['name'] == name)]['최종점수'].values[0])
+
+
+@pytest.fixture(scope='module')
+def manager():
+    return PlaceDataManager()
+
+
+def tied_manager() -> PlaceDataManager:
+    # 점수가 같은 장소가 많은 데이터 (nlargest 와 같은 순서인지 확인)
+    rng = np.random.default_rng(0)
+    manager = PlaceDataManager.__new__(PlaceDataManager)
+    manager.place_data = pd.DataFrame({
+        'name': [f'place{i}' for i in range(200)],
+        'category': rng.choice(['카페', '식당', '관광지'], 200),
+        'region': rng.choice(['공주', '부여'], 200),
+        'latitude': 36.0 + rng.random(200),
+        'longitude': 127.0 + rng.random(200),
+        '최종점수': rng.integers(0, 4, 200) / 2,
+    })
+    manager._build_indexes()
+    return manager
+
+
+@pytest.mark.parametrize('top_k', [0, 1, 5, 15, 100])
+def test_filtered_places_match_legacy_filter(manager, top_k):
+    for region in manager.place_data['region'].unique():
+        for category in ('카페', '식당', '관광지'):
+            expected = legacy_filtered_places(manager.place_data, region, category, top_k)
+            pd.testing.assert_frame_equal(manager.get_filtered_places(region, category, top_k), expected)
+
+
+@pytest.mark.parametrize('top_k', [1, 3, 10, 50])
+def test_filtered_places_keep_nlargest_tie_order(top_k):
+    manager = tied_manager()
+    for region in ('공주', '부여'):
+        for category in ('카페', '식당', '관광지'):
+            expected = legacy_filtered_places(manager.place_data, region, category, top_k)
+            assert manager.get_filtered_places(region, category, top_k).index.tolist() == expected.index.tolist()
+
+
+def test_unknown_partition_is_empty(manager):
+    assert manager.get_filtered_places('서울', '카페', 5).empty
+    assert manager.get_filtered_places('공주', '숙소', 5).empty
+
+
+def test_place_score_matches_legacy_lookup(manager):
+    for row in manager.place_data.itertuples():
+        assert manager.get_place_score(row.name, row.region) == legacy_place_score(manager.place_data, row.name, row.region)
+    with pytest.raises(KeyError):
+        manager.get_place_score('없는 장소', '공주')
+
+
+def test_search_poi(manager):
+    place = manager.place_data.iloc[0]
+
+    assert manager.search_poi(place['name'], place['region']) == {
+        'name': place['name'], 'latitude': float(place['latitude']), 'longitude': float(place['longitude'])
+    }
+    assert manager.search_poi(place['name'], '서울') == {}
+    assert manager.search_poi('없는 장소', place['region']) == {}
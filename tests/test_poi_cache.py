@@ -0,0 +1,83 @@
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from recommend.func.poi_cache import PoiCache
+from recommend.func.sqlite_cache import SQLiteCache
+from recommend.func.tmap_client import TMAPClient
+
+POIS = {'공주 공산성': ('36.4647', '127.1256')}
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakePoiTransport:
+    """POIS 에 있는 키워드만 검색 결과를 반환하고, 없으면 TMAP 과 같이 204 응답."""
+    def __init__(self):
+        self.keywords = []
+
+    def get(self, url, **kwargs):
+        keyword = parse_qs(urlsplit(url).query)['searchKeyword'][0]
+        self.keywords.append(keyword)
+        response = requests.Response()
+        if keyword in POIS:
+            latitude, longitude = POIS[keyword]
+            body = {'searchPoiInfo': {'pois': {'poi': [{'noorLat': latitude, 'noorLon': longitude, 'name': keyword}]}}}
+            response.status_code, response._content = 200, json.dumps(body).encode()
+        else:
+            response.status_code, response._content = 204, b''
+        return response
+
+
+def test_cached_poi_is_a_copy():
+    cache = PoiCache()
+    poi = {'latitude': '36.4', 'longitude': '127.1', 'name': '공산성'}
+    cache.set('공산성', '공주', poi)
+    poi['name'] = 'changed'
+
+    cached = cache.get('공산성', '공주')
+    cached['name'] = 'changed again'
+
+    assert cache.get('공산성', '공주')['name'] == '공산성'
+
+
+def test_disk_cache_is_read_through():
+    disk_cache = SQLiteCache(':memory:', table='pois')
+    PoiCache(disk_cache=disk_cache).set('공산성', '공주', {'name': '공산성'})
+
+    cache = PoiCache(disk_cache=disk_cache)
+    assert cache.get('공산성', '공주') == {'name': '공산성'}
+    assert cache.get('공산성', None) is None
+    assert cache.stats()['hits'] == 1
+
+
+def test_missing_keywords_expire_after_negative_ttl():
+    clock = FakeClock()
+    cache = PoiCache(negative_ttl=60, clock=clock)
+    cache.set_missing('없는장소', '공주')
+
+    assert cache.get('없는장소', '공주') == {}
+    clock.now += 61
+    assert cache.get('없는장소', '공주') is None
+
+
+def test_client_does_not_request_missing_keywords_again():
+    transport = FakePoiTransport()
+    client = TMAPClient('key', transport=transport, poi_cache=PoiCache())
+
+    assert client.get_poi('없는장소', '공주') == {}
+    assert client.get_poi('없는장소', '공주') == {}
+    pois = client.get_pois(['공산성', '없는장소', '공산성'], '공주')
+
+    assert pois == {'공산성': {'latitude': '36.4647', 'longitude': '127.1256', 'name': '공주 공산성'}, '없는장소': {}}
+    assert transport.keywords == ['공주 없는장소', '공주 공산성']
+
+    pois['공산성']['name'] = 'changed'
+    assert client.get_poi('공산성', '공주')['name'] == '공주 공산성'
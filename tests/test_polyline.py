@@ -0,0 +1,115 @@
+import json
+
+import numpy as np
+import pytest
+
+from recommend.func.polyline import (
+    EARTH_CIRCUMFERENCE, build_polyline_levels, decode_polyline, encode_polyline, routes_from_json, routes_to_json,
+    select_polyline_level, simplify_polyline
+)
+
+
+def random_coords(seed: int, size: int = 50, precision: int = 6) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.round(np.column_stack([rng.uniform(126, 128, size), rng.uniform(35, 38, size)]), precision)
+
+
+def test_encode_known_polyline():
+    # Google Encoded Polyline 예시 (precision 5, [위도, 경도] 순서)
+    coords = [[38.5, -120.2], [40.7, -120.95], [43.252, -126.453]]
+
+    assert encode_polyline(coords, precision=5) == '_p~iF~ps|U_ulLnnqC_mqNvxq`@'
+
+
+@pytest.mark.parametrize('precision', [5, 6])
+@pytest.mark.parametrize('seed', range(5))
+def test_encode_decode_round_trip(precision, seed):
+    coords = random_coords(seed, precision=precision)
+
+    decoded = decode_polyline(encode_polyline(coords, precision), precision)
+
+    assert decoded.shape == coords.shape
+    np.testing.assert_allclose(decoded, coords, atol=0.5 / 10 ** precision)
+
+
+def test_encode_decode_empty():
+    assert encode_polyline([]) == ''
+    assert decode_polyline('').shape == (0, 2)
+
+
+def test_routes_json_round_trip():
+    coords = random_coords(seed=0)
+    routes = [{'properties': {'totalTime': 600}, 'points': [], 'lineCoordinates': coords}]
+
+    loaded = routes_from_json(json.loads(json.dumps(routes_to_json(routes))))
+
+    assert loaded[0]['properties'] == {'totalTime': 600}
+    assert 'lineCoordinatesEncoded' not in loaded[0]
+    np.testing.assert_allclose(loaded[0]['lineCoordinates'], coords, atol=1e-6)
+
+
+def test_routes_from_legacy_json():
+    # 이전 형식([[경도, 위도], ...] 리스트)으로 저장한 경로도 읽을 수 있음
+    loaded = routes_from_json([{'lineCoordinates': [[127.1, 36.4], [127.2, 36.5]]}])
+
+    assert isinstance(loaded[0]['lineCoordinates'], np.ndarray)
+    assert loaded[0]['lineCoordinates'].tolist() == [[127.1, 36.4], [127.2, 36.5]]
+
+
+def point_line_distances(points: np.ndarray, simplified: np.ndarray) -> np.ndarray:
+    # 원래 점에서 단순화된 선분까지의 최소 거리(m) (짧은 구간이므로 평면 근사)
+    meters = np.array([EARTH_CIRCUMFERENCE / 360 * np.cos(np.radians(points[:, 1].mean())), EARTH_CIRCUMFERENCE / 360])
+    points, simplified = points * meters, simplified * meters
+    distances = np.full(len(points), np.inf)
+    for a, b in zip(simplified[:-1], simplified[1:]):
+        segment = b - a
+        t = np.clip(((points - a) @ segment) / max(segment @ segment, 1e-12), 0, 1)
+        distances = np.minimum(distances, np.hypot(*(points - (a + t[:, None] * segment)).T))
+    return distances
+
+
+@pytest.mark.parametrize('tolerance', [1.0, 10.0, 100.0])
+def test_simplify_polyline_stays_within_tolerance(tolerance):
+    # 구불구불한 도로 모양의 경로
+    t = np.linspace(0, 1, 500)
+    coords = np.column_stack([127.0 + 0.05 * t, 36.4 + 0.01 * np.sin(20 * t)])
+
+    simplified = simplify_polyline(coords, tolerance)
+
+    assert 2 <= len(simplified) < len(coords)
+    assert simplified[0].tolist() == coords[0].tolist() and simplified[-1].tolist() == coords[-1].tolist()
+    # Douglas–Peucker 는 제거한 점이 남은 선분에서 tolerance 이내임을 보장
+    assert point_line_distances(coords, simplified).max() <= tolerance * 1.01
+
+
+def test_simplify_polyline_keeps_short_lines():
+    coords = random_coords(seed=0, size=2)
+
+    assert simplify_polyline(coords, 100.0).tolist() == coords.tolist()
+    assert simplify_polyline(random_coords(seed=1), 0).shape == (50, 2)
+
+
+def test_polyline_levels_are_coarser_at_lower_zoom():
+    t = np.linspace(0, 1, 2000)
+    coords = np.column_stack([127.0 + 0.2 * t, 36.4 + 0.05 * np.sin(40 * t)])
+
+    levels = build_polyline_levels(coords)
+
+    sizes = [len(levels[zoom]) for zoom in sorted(levels)]
+    assert sizes == sorted(sizes) and sizes[-1] < len(coords)
+    assert select_polyline_level(levels, 12) is levels[13]
+    assert select_polyline_level(levels, 18) is levels[15]
+    assert select_polyline_level(levels, 1) is levels[9]
+
+
+def test_routes_json_round_trip_keeps_levels():
+    coords = random_coords(seed=0)
+    routes = [{'properties': {}, 'lineCoordinates': coords, 'lineLevels': build_polyline_levels(coords)}]
+
+    loaded = routes_from_json(json.loads(json.dumps(routes_to_json(routes))))
+
+    assert sorted(loaded[0]['lineLevels']) == sorted(routes[0]['lineLevels'])
+    for zoom, level in routes[0]['lineLevels'].items():
+        np.testing.assert_allclose(loaded[0]['lineLevels'][zoom], level, atol=1e-6)
+    # 단순화 단계가 없는 이전 형식은 읽을 때 계산
+    assert sorted(routes_from_json([{'lineCoordinates': coords.tolist()}])[0]['lineLevels']) == sorted(loaded[0]['lineLevels'])
@@ -0,0 +1,114 @@
+import datetime
+
+import pytest
+
+from recommend.func import rate_limiter
+from recommend.func.rate_limiter import DailyQuota, QuotaExceededError, RateLimiter, TokenBucket, limits_from_env
+
+
+class FakeClock:
+    """time.monotonic/time.sleep 대신 사용하는 시계. sleep 하면 시간이 그만큼 흐름."""
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeCalendar:
+    def __init__(self):
+        self.day = datetime.date(2024, 10, 20)
+
+    def __call__(self) -> datetime.date:
+        return self.day
+
+
+def test_token_bucket_allows_burst_then_waits_for_refill():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+
+    assert all(bucket.acquire() for _ in range(3))
+    assert clock.sleeps == []
+
+    assert bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_token_bucket_refills_up_to_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+    for _ in range(3):
+        bucket.acquire()
+
+    clock.now += 100
+    assert all(bucket.acquire() for _ in range(3))
+    assert clock.sleeps == []
+    assert not bucket.acquire(timeout=0.1)
+
+
+def test_daily_quota_resets_on_new_day():
+    calendar = FakeCalendar()
+    quota = DailyQuota(2, today=calendar)
+    assert quota.consume() and quota.consume()
+    assert not quota.consume()
+    assert quota.usage() == {'used': 2, 'limit': 2, 'remaining': 0}
+
+    calendar.day += datetime.timedelta(days=1)
+
+    # 호출 없이 조회만 해도 새 날짜 기준 사용량을 반환
+    assert quota.usage() == {'used': 0, 'limit': 2, 'remaining': 2}
+    assert quota.consume()
+
+
+def test_unlimited_quota():
+    quota = DailyQuota(None)
+    assert all(quota.consume() for _ in range(1000))
+    assert quota.remaining() is None
+
+
+def test_rate_limiter_raises_when_quota_is_exhausted():
+    limiter = RateLimiter({'route': {'rate': 1000, 'burst': 1000, 'daily_quota': 2}})
+
+    assert limiter.acquire('route') and limiter.acquire('route')
+    with pytest.raises(QuotaExceededError) as exc_info:
+        limiter.acquire('route')
+
+    assert exc_info.value.endpoint == 'route'
+    assert exc_info.value.limit == 2
+    assert limiter.usage() == {'route': {'used': 2, 'limit': 2, 'remaining': 0}}
+    # 한도가 없는 엔드포인트는 제한하지 않음
+    assert limiter.acquire('poi')
+
+
+def test_rate_limit_timeout_refunds_quota():
+    limiter = RateLimiter({'route': {'rate': 0.001, 'burst': 1, 'daily_quota': 5}})
+    assert limiter.acquire('route')
+
+    assert not limiter.acquire('route', timeout=0)
+    assert limiter.remaining('route') == 4
+
+
+def test_quotas_are_off_by_default(monkeypatch):
+    monkeypatch.delenv(rate_limiter.DAILY_QUOTAS_ENV, raising=False)
+
+    assert all(limit['daily_quota'] is None for limit in limits_from_env().values())
+
+
+def test_quotas_from_env(monkeypatch):
+    monkeypatch.setenv(rate_limiter.DAILY_QUOTAS_ENV, 'route=1000, routeOptimization=100')
+
+    limits = limits_from_env()
+
+    assert limits['route']['daily_quota'] == 1000
+    assert limits['routeOptimization']['daily_quota'] == 100
+    assert limits['poi']['daily_quota'] is None
+    assert RateLimiter().remaining('route') == 1000
+
+    monkeypatch.setenv(rate_limiter.DAILY_QUOTAS_ENV, 'routes=10')
+    with pytest.raises(ValueError):
+        limits_from_env()
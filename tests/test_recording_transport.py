@@ -0,0 +1,94 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+from recommend.func.http_transport import HTTPTransport
+from recommend.func.recording_transport import RecordingTransport, ReplayTransport, request_fingerprint
+from recommend.func.stand_in_server import StandInServer
+
+POI_URL = 'https://apis.openapi.sk.com/tmap/pois?version=1&appKey={key}&searchKeyword=공산성'
+ROUTE_URL = 'https://apis.openapi.sk.com/tmap/routes?version=1&format=json'
+ROUTE_PAYLOAD = {'startX': '127.1', 'startY': '36.4', 'endX': '127.2', 'endY': '36.5', 'startName': '출발'}
+
+
+class OriginHandler(BaseHTTPRequestHandler):
+    """요청 경로(쿼리 제외)와 본문을 그대로 돌려주는 테스트용 upstream 서버."""
+    def _handle(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        data = json.dumps({'path': urlsplit(self.path).path, 'body': body}, ensure_ascii=False).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = _handle
+    do_POST = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def origin_url():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), OriginHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    host, port = httpd.server_address[:2]
+    yield f'http://{host}:{port}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_fingerprint_ignores_host_secrets_and_query_order():
+    first = request_fingerprint('get', 'https://apis.openapi.sk.com/tmap/pois?b=2&a=1&appKey=secret')
+    second = request_fingerprint('GET', 'http://127.0.0.1:8765/tmap/pois?a=1&b=2')
+
+    assert first['key'] == second['key']
+    assert ['appKey', 'secret'] not in first['query']
+    assert request_fingerprint('GET', '/tmap/pois?a=2&b=2')['key'] != first['key']
+
+
+def test_fingerprint_compares_json_bodies():
+    as_bytes = request_fingerprint('POST', '/tmap/routes', json.dumps({'b': 1, 'a': 2}).encode('utf-8'))
+    as_dict = request_fingerprint('POST', '/tmap/routes', {'a': 2, 'b': 1})
+
+    assert as_bytes['key'] == as_dict['key']
+
+
+def test_recorded_responses_are_replayed(tmp_path, origin_url):
+    recorder = RecordingTransport(str(tmp_path), base_url=origin_url)
+    recorded_poi = recorder.get(POI_URL.format(key='recording-key'))
+    recorded_route = recorder.post(ROUTE_URL, json=ROUTE_PAYLOAD)
+
+    # 인증 키는 기록하지 않음
+    assert 'recording-key' not in ''.join(path.read_text(encoding='utf-8') for path in tmp_path.iterdir())
+
+    replayer = ReplayTransport(str(tmp_path))
+    replayed_poi = replayer.get(POI_URL.format(key='another-key'))
+    replayed_route = replayer.post(ROUTE_URL, json=dict(reversed(list(ROUTE_PAYLOAD.items()))))
+    missing = replayer.post(ROUTE_URL, json=dict(ROUTE_PAYLOAD, endX='128.0'))
+
+    assert (replayed_poi.status_code, replayed_poi.json()) == (recorded_poi.status_code, recorded_poi.json())
+    assert replayed_route.json() == recorded_route.json() == {'path': '/tmap/routes',
+                                                              'body': ROUTE_PAYLOAD}
+    assert missing.status_code == 404
+    assert replayer.stats() == {'replayed': 2, 'missing': 1}
+
+
+def test_stand_in_server_serves_recordings(tmp_path, origin_url):
+    recorder = RecordingTransport(str(tmp_path), base_url=origin_url)
+    recorded = recorder.post(ROUTE_URL, json=ROUTE_PAYLOAD)
+
+    with StandInServer(str(tmp_path), port=0) as server:
+        transport = HTTPTransport(base_url=server.base_url)
+        served = transport.post(ROUTE_URL, json=ROUTE_PAYLOAD)
+        missing = transport.get(POI_URL.format(key='key'))
+
+    assert served.json() == recorded.json()
+    assert missing.status_code == 404
+    assert server.stats() == {'served': 1, 'missing': 1, 'injectedErrors': 0}
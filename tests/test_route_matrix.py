@@ -0,0 +1,75 @@
+import threading
+
+from recommend.func.route_matrix import RegionRouteMatrix, RouteMatrixBuilder, place_key
+
+
+def make_place(name: str, index: int) -> dict:
+    return {'name': name, 'latitude': 36.0 + index * 0.01, 'longitude': 127.0 + index * 0.01}
+
+
+PLACES = [make_place(name, i) for i, name in enumerate(['출발지', '카페', '식당', '축제'])]
+
+
+class FakeFetch:
+    """구간 경로 요청을 기록하고, failing 에 포함된 (출발지명, 도착지명) 구간은 빈 응답을 반환"""
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, start: dict, end: dict) -> dict:
+        with self._lock:
+            self.calls.append((start['name'], end['name']))
+        if (start['name'], end['name']) in self.failing:
+            return {}
+        return {'type': 'FeatureCollection', 'features': [
+            {'type': 'Feature', 'properties': {'totalDistance': 1000, 'totalTime': 100, 'totalFare': 0}}
+        ]}
+
+
+def test_builder_keeps_pair_order():
+    fetch = FakeFetch()
+    matrix = RouteMatrixBuilder(fetch, max_workers=4).build(PLACES[:3])
+
+    assert list(matrix) == [(0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1)]
+    assert sorted(fetch.calls) == sorted((a['name'], b['name']) for a in PLACES[:3] for b in PLACES[:3] if a is not b)
+
+
+def test_legs_are_fetched_once_across_combinations():
+    fetch = FakeFetch()
+    region_matrix = RegionRouteMatrix(RouteMatrixBuilder(fetch, max_workers=4))
+
+    region_matrix.prefetch([PLACES[:3], [PLACES[0], PLACES[1], PLACES[3]]])
+    region_matrix.submatrix([PLACES[0], PLACES[2], PLACES[1]])
+
+    assert len(fetch.calls) == len(set(fetch.calls)) == len(region_matrix) == 10
+
+
+def test_submatrix_copies_first_feature_properties():
+    region_matrix = RegionRouteMatrix(RouteMatrixBuilder(FakeFetch(), max_workers=1))
+
+    first = region_matrix.submatrix(PLACES[:2])
+    first[(0, 1)]['features'][0]['properties']['scaledProperties'] = {'scaledTime': 1.0}
+    second = region_matrix.submatrix(PLACES[:2])
+
+    assert 'scaledProperties' not in second[(0, 1)]['features'][0]['properties']
+
+
+def test_failed_legs_are_not_stored():
+    fetch = FakeFetch(failing={('카페', '식당')})
+    region_matrix = RegionRouteMatrix(RouteMatrixBuilder(fetch, max_workers=4))
+
+    legs = region_matrix.submatrix(PLACES[:3])
+
+    assert legs[(1, 2)] == {}
+    assert all(route.get('features') for pair, route in legs.items() if pair != (1, 2))
+    assert (place_key(PLACES[1]), place_key(PLACES[2])) not in region_matrix.legs
+    assert len(region_matrix) == 5
+
+    # 실패한 구간은 다음 조합에서 다시 요청되고, 성공하면 저장됨
+    fetch.failing.clear()
+    legs = region_matrix.submatrix(PLACES[:3])
+
+    assert legs[(1, 2)]['features']
+    assert fetch.calls.count(('카페', '식당')) == 2
+    assert len(region_matrix) == 6
@@ -0,0 +1,97 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from recommend.bench_route_parser import build_sample_response, legacy_parse
+from recommend.func.route_parser import VIRTUAL_LINE_DESCRIPTION, parse_optimized_route_response, parse_route_response
+
+RECOMMEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'recommend')
+
+
+def load_json(*path):
+    with open(os.path.join(RECOMMEND_DIR, *path), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def point(point_type: str, index: int, coordinates: list, **properties) -> dict:
+    return {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': coordinates},
+            'properties': dict(pointType=point_type, pointIndex=index, description='안내 지점', **properties)}
+
+
+def line(coordinates: list, description: str = '도로 구간') -> dict:
+    return {'type': 'Feature', 'geometry': {'type': 'LineString', 'coordinates': coordinates},
+            'properties': {'description': description}}
+
+
+PLACES = [
+    {'name': '출발지', 'category': '출발지'},
+    {'name': '카페', 'category': '카페'},
+    {'name': '식당', 'category': '식당'},
+    {'name': '출발지', 'category': '출발지'},
+]
+
+ROUTE = {'type': 'FeatureCollection', 'features': [
+    point('S', 0, [127.0, 36.0], totalDistance=1000, totalTime=600, totalFare=0),
+    line([[127.0, 36.0], [127.0, 36.0]], VIRTUAL_LINE_DESCRIPTION),
+    line([[127.0, 36.0], [127.1, 36.1]]),
+    point('GP', 1, [127.1, 36.1]),  # 회전 안내 지점
+    point('B1', 2, [127.2, 36.2]),
+    line([[127.2, 36.2], [127.2, 36.2]], VIRTUAL_LINE_DESCRIPTION),
+    line([[127.2, 36.2], [127.3, 36.3], [127.4, 36.4]]),
+    point('B2', 3, [127.4, 36.4]),
+    {'type': 'Feature', 'geometry': {'type': 'LineString', 'coordinates': [[127.4, 36.4], [127.4, 36.4]]},
+     'properties': {}},  # description 이 없는 feature
+    line([[127.4, 36.4], [127.0, 36.0]]),
+    point('E', 4, [127.0, 36.0]),
+]}
+
+
+def test_points_are_matched_to_places_by_point_type():
+    parsed = parse_route_response(ROUTE, PLACES)
+
+    assert parsed['properties'] == {'totalDistance': 1000, 'totalTime': 600, 'totalFare': 0}
+    assert [(p['pointId'], p['pointName'], p['pointType']) for p in parsed['points']] == [
+        (0, '출발지', 'S'), (2, '카페', '카페'), (3, '식당', '식당'), (4, '출발지', 'E')
+    ]
+    assert (parsed['points'][1]['pointLongitude'], parsed['points'][1]['pointLatitude']) == (127.2, 36.2)
+    assert parsed['paths'] == []
+
+
+def test_virtual_and_undescribed_lines_are_skipped():
+    parsed = parse_route_response(ROUTE, PLACES)
+
+    assert parsed['lineCoordinates'].tolist() == [
+        [127.0, 36.0], [127.1, 36.1], [127.2, 36.2], [127.3, 36.3], [127.4, 36.4], [127.4, 36.4], [127.0, 36.0]
+    ]
+
+
+@pytest.mark.parametrize('index', range(3))
+def test_parser_matches_legacy_loop(index):
+    route = load_json('data', 'tsp_top_routes.json')[index]
+    response = build_sample_response(route)
+    places = [{'name': p['pointName'], 'category': '관광지'} for p in route['points']]
+
+    legacy_points, legacy_coordinates = legacy_parse(response, places)
+    parsed = parse_route_response(response, places)
+
+    assert isinstance(parsed['lineCoordinates'], np.ndarray) and parsed['lineCoordinates'].dtype == np.float64
+    assert parsed['lineCoordinates'].tolist() == legacy_coordinates
+    assert [dict(p) for p in parsed['points']] == [dict(p) for p in legacy_points]
+
+
+def test_parse_optimized_route_response():
+    response = load_json('sample_optimized_route.json')
+
+    parsed = parse_optimized_route_response(response)
+
+    assert parsed['properties'] == {'totalDistance': '68969', 'totalTime': '5483', 'totalFare': '0'}
+    assert [p['pointName'] for p in parsed['points']] == ['출발', '비비비', '궁남지', '장원막국수', '도착']
+    assert [p['pointId'] for p in parsed['points']] == ['0', '1', '2', '3', '4']
+    assert [(p['pathId'], p['pathTime'], p['pathDistance']) for p in parsed['paths']] == [
+        ('1', '3437', '54176'), ('2', '641', '4995'), ('3', '613', '3731'), ('4', '792', '6067')
+    ]
+    lines = [f['geometry']['coordinates'] for f in response['features'] if f['geometry']['type'] == 'LineString']
+    assert parsed['lineCoordinates'].shape == (sum(len(coordinates) for coordinates in lines), 2)
+    assert parsed['lineCoordinates'].tolist() == [c for coordinates in lines for c in coordinates]
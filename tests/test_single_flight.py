@@ -0,0 +1,78 @@
+import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from recommend.func.single_flight import SingleFlight
+
+NUM_CALLERS = 8
+
+
+def run_concurrently(single_flight: SingleFlight, fn, key='key') -> list:
+    # 모든 호출자가 do 에 들어간 뒤 upstream 호출이 끝나도록 release 로 막아둠
+    with ThreadPoolExecutor(max_workers=NUM_CALLERS) as executor:
+        futures = [executor.submit(single_flight.do, key, fn) for _ in range(NUM_CALLERS)]
+        while single_flight.stats()['saved'] < NUM_CALLERS - 1:
+            time.sleep(0.001)
+        fn.release.set()
+        return [future.exception() or future.result() for future in futures]
+
+
+class BlockingCall:
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.release = threading.Event()
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def test_concurrent_calls_are_coalesced():
+    single_flight = SingleFlight()
+    fn = BlockingCall(result={'features': []})
+
+    results = run_concurrently(single_flight, fn)
+
+    assert fn.calls == 1
+    assert all(result is results[0] for result in results)
+    assert single_flight.stats() == {'calls': 1, 'saved': NUM_CALLERS - 1, 'inFlight': 0}
+
+
+def test_waiters_receive_copies():
+    single_flight = SingleFlight(copy_shared=copy.deepcopy)
+    fn = BlockingCall(result={'features': [1]})
+
+    results = run_concurrently(single_flight, fn)
+
+    assert all(result == {'features': [1]} for result in results)
+    assert len({id(result) for result in results}) == NUM_CALLERS
+
+
+def test_errors_are_raised_to_every_caller():
+    single_flight = SingleFlight()
+    fn = BlockingCall(error=RuntimeError('upstream failed'))
+
+    results = run_concurrently(single_flight, fn)
+
+    assert fn.calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    # 실패한 호출은 해제되어 다음 호출은 다시 수행
+    assert single_flight.do('key', lambda: 'retried') == 'retried'
+
+
+def test_calls_are_not_cached():
+    single_flight = SingleFlight()
+    counter = iter(range(10))
+
+    assert single_flight.do('key', next, counter) == 0
+    assert single_flight.do('key', next, counter) == 1
+    with pytest.raises(StopIteration):
+        single_flight.do('other', next, iter(()))
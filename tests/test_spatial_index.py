@@ -0,0 +1,101 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from recommend.func.place_data_manager import PlaceDataManager
+from recommend.func.spatial_index import EARTH_RADIUS, SpatialIndex
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS * math.asin(math.sqrt(a))
+
+
+def random_places(num_places: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'latitude': 36.0 + rng.random(num_places),
+        'longitude': 126.5 + rng.random(num_places),
+        'category': rng.choice(['카페', '식당', '관광지'], num_places),
+    })
+
+
+def brute_force_radius(places: pd.DataFrame, latitude: float, longitude: float, radius_m: float,
+                       category: str = None) -> dict:
+    distances = dict()
+    for row, place in enumerate(places.itertuples()):
+        if category is not None and place.category != category:
+            continue
+        if math.isnan(place.latitude) or math.isnan(place.longitude):
+            continue
+        distance = haversine(latitude, longitude, place.latitude, place.longitude)
+        if distance <= radius_m:
+            distances[row] = distance
+    return distances
+
+
+@pytest.mark.parametrize('radius_m', [0, 500, 5000, 30000])
+@pytest.mark.parametrize('category', [None, '카페', '관광지'])
+@pytest.mark.parametrize('seed', range(3))
+def test_query_radius_matches_haversine(seed, category, radius_m):
+    places = random_places(500, seed)
+    index = SpatialIndex.from_dataframe(places, category='category')
+    latitude, longitude = 36.5, 127.0
+
+    rows, distances = index.query_radius(latitude, longitude, radius_m, category)
+    expected = brute_force_radius(places, latitude, longitude, radius_m, category)
+
+    # 경계에 걸친 점의 반올림 오차를 제외하면 같은 장소
+    boundary = {row for row, distance in expected.items() if abs(distance - radius_m) < 1e-6}
+    assert set(rows.tolist()) - boundary == set(expected) - boundary
+    assert distances == pytest.approx([expected.get(row, radius_m) for row in rows.tolist()], abs=1e-6)
+    assert np.all(np.diff(distances) >= 0)
+
+
+@pytest.mark.parametrize('k', [1, 5, 50])
+@pytest.mark.parametrize('category', [None, '식당'])
+def test_query_nearest_matches_haversine(k, category):
+    places = random_places(300, seed=1)
+    index = SpatialIndex.from_dataframe(places, category='category')
+    latitude, longitude = 36.2, 126.9
+
+    rows, distances = index.query_nearest(latitude, longitude, k, category)
+    expected = sorted(brute_force_radius(places, latitude, longitude, math.inf, category).items(), key=lambda x: x[1])[:k]
+
+    assert rows.tolist() == [row for row, _ in expected]
+    assert distances == pytest.approx([distance for _, distance in expected], abs=1e-6)
+
+
+def test_rows_without_coordinates_are_skipped():
+    places = random_places(20, seed=2)
+    places.loc[[3, 7], 'latitude'] = np.nan
+    index = SpatialIndex.from_dataframe(places, category='category')
+
+    rows, _ = index.query_radius(36.5, 127.0, 200000)
+
+    assert len(index) == 18
+    assert sorted(rows.tolist()) == [row for row in range(20) if row not in (3, 7)]
+
+
+def test_empty_queries():
+    index = SpatialIndex.from_dataframe(random_places(10, seed=3), category='category')
+
+    for rows, distances in (index.query_radius(36.5, 127.0, 1000, '숙소'), index.query_nearest(36.5, 127.0, 0),
+                            index.query_nearest(36.5, 127.0, 3, '숙소')):
+        assert len(rows) == len(distances) == 0
+    assert len(index.query_nearest(36.5, 127.0, 100)[0]) == 10
+
+
+def test_filtered_places_within_radius():
+    manager = PlaceDataManager()
+    center = (36.4556, 127.1247)
+
+    result = manager.get_filtered_places('공주', '카페', 5, center=center, radius_km=5)
+
+    data = manager.place_data
+    within = data[(data['region'] == '공주') & (data['category'] == '카페')]
+    within = within[[haversine(*center, lat, lon) <= 5000 for lat, lon in zip(within['latitude'], within['longitude'])]]
+    assert result.index.tolist() == within.nlargest(5, '최종점수').index.tolist()
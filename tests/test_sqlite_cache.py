@@ -0,0 +1,124 @@
+import json
+
+import pytest
+import requests
+
+from recommend.func import sqlite_cache
+from recommend.func.sqlite_cache import SQLiteCache, make_cache_key
+from recommend.func.tmap_client import TMAPClient
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(sqlite_cache.time, 'time', clock)
+    return clock
+
+
+def test_make_cache_key_ignores_key_order():
+    assert make_cache_key({'a': 1, 'b': [1, 2]}) == make_cache_key({'b': [1, 2], 'a': 1})
+    assert make_cache_key({'a': 1}) != make_cache_key({'a': 2})
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = SQLiteCache(':memory:', ttl=60)
+    cache.set('key', {'value': 1})
+
+    clock.now += 60
+    assert cache.get('key') == {'value': 1}
+
+    clock.now += 1
+    assert cache.get('key') is None
+    assert len(cache) == 0
+    assert cache.stats()['expired'] == 1
+
+
+def test_purge_expired(clock):
+    cache = SQLiteCache(':memory:', ttl=60)
+    cache.set('old', 1)
+    clock.now += 30
+    cache.set('new', 2)
+
+    clock.now += 31
+    assert cache.purge_expired() == 1
+    assert cache.get('old') is None
+    assert cache.get('new') == 2
+
+
+def test_least_recently_used_entries_are_evicted(clock):
+    cache = SQLiteCache(':memory:', ttl=None, max_entries=2)
+    cache.set('a', 1)
+    clock.now += 1
+    cache.set('b', 2)
+    clock.now += 1
+    assert cache.get('a') == 1  # a 를 최근 사용으로 갱신
+
+    clock.now += 1
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats()['evictions'] == 1
+
+
+def test_tables_are_separated(tmp_path):
+    db_path = str(tmp_path / 'cache.sqlite')
+    routes = SQLiteCache(db_path, table='routes')
+    pois = SQLiteCache(db_path, table='pois')
+    routes.set('key', 'route')
+
+    assert pois.get('key') is None
+    assert SQLiteCache(db_path, table='routes').get('key') == 'route'
+    with pytest.raises(ValueError):
+        SQLiteCache(db_path, table='routes; DROP TABLE pois')
+
+
+class FakeTransport:
+    def __init__(self, status_code: int = 200, body=None):
+        self.status_code = status_code
+        self.body = body
+        self.calls = 0
+
+    def post(self, url, **kwargs):
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = self.status_code
+        response._content = self.body if isinstance(self.body, bytes) else json.dumps(self.body).encode()
+        return response
+
+
+START = {'name': '출발', 'longitude': 127.1, 'latitude': 36.4}
+END = {'name': '도착', 'longitude': 127.2, 'latitude': 36.5}
+
+
+def test_route_responses_are_cached():
+    transport = FakeTransport(body={'type': 'FeatureCollection', 'features': [{'properties': {}}]})
+    client = TMAPClient('key', transport=transport, route_cache=SQLiteCache(':memory:'))
+
+    first = client.get_route_data(START, END)
+    # 좌표는 정규화하여 캐시 키를 만듦
+    second = client.get_route_data(dict(START, longitude=127.1000000001), END)
+
+    assert first == second
+    assert transport.calls == 1
+
+
+@pytest.mark.parametrize('status_code, body', [(500, b'<html>error</html>'), (429, {'error': 'quota'}), (200, b'not json')])
+def test_failed_route_responses_are_not_cached(status_code, body):
+    transport = FakeTransport(status_code, body)
+    route_cache = SQLiteCache(':memory:')
+    client = TMAPClient('key', transport=transport, route_cache=route_cache)
+
+    assert client.get_route_data(START, END) == {}
+    assert client.get_route_data(START, END) == {}
+    assert transport.calls == 2
+    assert len(route_cache) == 0
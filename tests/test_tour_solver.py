@@ -0,0 +1,67 @@
+from itertools import permutations
+
+import numpy as np
+import pytest
+
+from recommend.func import tour_solver
+from recommend.func.tour_solver import score_tours, solve_brute_force, solve_tour, tour_score
+
+
+def random_scores(num_places: int, seed: int) -> np.ndarray:
+    scores = np.random.default_rng(seed).random((num_places, num_places))
+    np.fill_diagonal(scores, 0)
+    return scores
+
+
+@pytest.mark.parametrize('method', ['held_karp', 'branch_and_bound'])
+@pytest.mark.parametrize('num_places', [2, 3, 4, 6, 8])
+@pytest.mark.parametrize('seed', range(5))
+def test_solver_matches_brute_force(method, num_places, seed):
+    scores = random_scores(num_places, seed)
+    _, expected = solve_brute_force(scores)
+
+    route, score = solve_tour(scores, method)
+
+    assert score == pytest.approx(expected)
+    assert route[0] == route[-1] == 0
+    assert sorted(route[1:-1]) == list(range(1, num_places))
+    assert tour_score(route, scores) == pytest.approx(score)
+
+
+def test_brute_force_checks_every_tour():
+    scores = random_scores(5, seed=0)
+    route, score = solve_brute_force(scores)
+
+    assert score == pytest.approx(max(
+        tour_score((0, *tour, 0), scores)
+        for tour in permutations(range(1, 5))
+    ))
+    assert tour_score(route, scores) == pytest.approx(score)
+
+
+def test_score_tours_matches_loop():
+    scores = random_scores(6, seed=1)
+    tours = [(0, *tour, 0) for tour in permutations(range(1, 6))]
+
+    batch_scores = score_tours(scores, tours)
+
+    assert batch_scores.shape == (len(tours),)
+    assert batch_scores == pytest.approx([
+        sum(scores[a][b] for a, b in zip(tour, tour[1:])) for tour in tours
+    ])
+
+
+@pytest.mark.parametrize('batch_size', [1, 7, 24, 4096])
+def test_brute_force_batches(monkeypatch, batch_size):
+    scores = random_scores(5, seed=2)
+    expected = solve_brute_force(scores)
+
+    monkeypatch.setattr(tour_solver, 'BATCH_SIZE', batch_size)
+
+    assert solve_brute_force(scores) == expected
+    assert solve_brute_force(random_scores(1, seed=0)) == ((0, 0), 0.0)
+
+
+def test_unknown_solver():
+    with pytest.raises(ValueError):
+        solve_tour(random_scores(3, seed=0), 'greedy')
@@ -0,0 +1,134 @@
+import math
+from itertools import permutations
+
+import numpy as np
+import pytest
+
+from recommend.func.route_parser import parse_optimized_route_response
+from recommend.func.via_point_optimizer import INFEASIBLE, LocalRouteOptimizer, solve_via_point_order
+
+
+def simulate(order: tuple, travel_times: list, via_times: list, time_windows: list) -> float:
+    # 방문 순서대로 이동/대기/체류하여 도착지 도착 시각 계산 (희망 종료 시각을 넘기면 inf)
+    current, previous = 0, 0
+    for k in order:
+        current += travel_times[previous][k]
+        window_start, window_end = time_windows[k - 1] or (None, None)
+        if window_start is not None:
+            current = max(current, window_start)
+        if window_end is not None and current > window_end:
+            return INFEASIBLE
+        current += via_times[k - 1]
+        previous = k
+    return current + travel_times[previous][len(via_times) + 1]
+
+
+def brute_force_arrival(travel_times: list, via_times: list, time_windows: list) -> float:
+    return min(simulate(order, travel_times, via_times, time_windows)
+               for order in permutations(range(1, len(via_times) + 1)))
+
+
+def random_instance(num_vias: int, seed: int) -> tuple:
+    rng = np.random.default_rng(seed)
+    size = num_vias + 2
+    travel_times = rng.integers(60, 3600, size=(size, size)).tolist()
+    via_times = rng.integers(0, 1800, size=num_vias).tolist()
+    time_windows = []
+    for _ in range(num_vias):
+        if rng.random() < 0.4:
+            window_start = int(rng.integers(0, 7200))
+            time_windows.append((window_start, window_start + int(rng.integers(600, 7200))))
+        else:
+            time_windows.append(None)
+    return travel_times, via_times, time_windows
+
+
+@pytest.mark.parametrize('num_vias', [0, 1, 2, 4, 6])
+@pytest.mark.parametrize('seed', range(8))
+def test_order_matches_brute_force(num_vias, seed):
+    travel_times, via_times, time_windows = random_instance(num_vias, seed)
+
+    order, arrival = solve_via_point_order(travel_times, via_times, time_windows)
+    expected = brute_force_arrival(travel_times, via_times, time_windows)
+
+    if expected == INFEASIBLE:
+        assert (order, arrival) == (None, INFEASIBLE)
+    else:
+        assert arrival == expected
+        assert sorted(order) == list(range(1, num_vias + 1))
+        assert simulate(order, travel_times, via_times, time_windows) == arrival
+
+
+def test_unsatisfiable_time_window():
+    travel_times = [[0, 600, 600], [600, 0, 600], [600, 600, 0]]
+
+    assert solve_via_point_order(travel_times, [0], [(0, 300)]) == (None, INFEASIBLE)
+
+
+SPEED = 10  # m/s
+
+
+class FakeRoutes:
+    """직선 거리로 구간 경로를 만들고, failing 에 포함된 (출발지명, 도착지명) 구간은 빈 응답을 반환"""
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = 0
+
+    def __call__(self, start: dict, end: dict) -> dict:
+        self.calls += 1
+        if (start['name'], end['name']) in self.failing:
+            return {}
+        distance = int(math.hypot(start['latitude'] - end['latitude'], start['longitude'] - end['longitude']) * 100000)
+        return {'type': 'FeatureCollection', 'features': [
+            {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [start['longitude'], start['latitude']]},
+             'properties': {'totalDistance': distance, 'totalTime': distance // SPEED, 'totalFare': 0,
+                            'pointType': 'S', 'description': '출발'}},
+            {'type': 'Feature', 'properties': {'description': '도로 구간'},
+             'geometry': {'type': 'LineString', 'coordinates': [[start['longitude'], start['latitude']],
+                                                                [end['longitude'], end['latitude']]]}},
+        ]}
+
+
+START = {'name': '출발', 'latitude': '36.0', 'longitude': '127.0'}
+END = {'name': '도착', 'latitude': '36.0', 'longitude': '127.04'}
+VIA_POIS = [
+    {'viaPointId': str(i), 'viaPointName': name, 'viaX': str(127.0 + x), 'viaY': str(36.0 + y), 'viaTime': 600}
+    for i, (name, x, y) in enumerate([('카페', 0.03, 0.0), ('식당', 0.01, 0.0), ('축제', 0.02, 0.0)])
+]
+
+
+def test_local_optimizer_response():
+    fetch = FakeRoutes()
+    optimizer = LocalRouteOptimizer(fetch, max_workers=4)
+
+    response = optimizer.get_optimized_route(START, END, VIA_POIS, start_time='202410010900')
+    parsed = parse_optimized_route_response(response)
+
+    # 직선 위의 경유지는 출발지에서 가까운 순서(식당 → 축제 → 카페)로 방문
+    assert [point['pointName'] for point in parsed['points']] == ['출발', '식당', '축제', '카페', '도착']
+    assert int(parsed['properties']['totalDistance']) == sum(int(path['pathDistance']) for path in parsed['paths'])
+    assert int(parsed['properties']['totalTime']) == sum(int(path['pathTime']) for path in parsed['paths'])
+    assert parsed['lineCoordinates'].shape == (8, 2)
+
+    # 같은 구간은 다시 요청하지 않음
+    calls = fetch.calls
+    optimizer.get_optimized_route(START, END, VIA_POIS[:2], start_time='202410010900')
+    assert fetch.calls == calls
+
+
+def test_local_optimizer_failed_leg():
+    # 모든 순서가 실패한 구간(출발 → *)을 지나야 하면 빈 사전
+    fetch = FakeRoutes(failing={('출발', via_poi['viaPointName']) for via_poi in VIA_POIS})
+    optimizer = LocalRouteOptimizer(fetch, max_workers=1)
+
+    assert optimizer.get_optimized_route(START, END, VIA_POIS, start_time='202410010900') == {}
+
+    # 일부 구간만 실패하면 그 구간을 피하는 순서를 선택
+    fetch = FakeRoutes(failing={('식당', '축제')})
+    optimizer = LocalRouteOptimizer(fetch, max_workers=1)
+    parsed = parse_optimized_route_response(
+        optimizer.get_optimized_route(START, END, VIA_POIS, start_time='202410010900')
+    )
+    names = [point['pointName'] for point in parsed['points']]
+    assert names[0] == '출발' and names[-1] == '도착' and sorted(names[1:-1]) == ['식당', '축제', '카페']
+    assert ('식당', '축제') not in list(zip(names, names[1:]))